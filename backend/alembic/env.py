@@ -9,12 +9,6 @@ from alembic import context
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from app.core.config import settings
-from app.core.database import Base
-
-# 모든 모델을 임포트하여 메타데이터에 포함
-from app.models import *
-
 # Alembic Config 객체
 config = context.config
 
@@ -22,22 +16,70 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# 메타데이터 설정
-target_metadata = Base.metadata
+
+def needs_metadata() -> bool:
+    """모델 메타데이터가 필요한 명령인지 확인 (autogenerate 비교를 수행하는 revision/check)"""
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None:
+        # 프로그램에서 직접 호출한 경우 안전하게 메타데이터 로드
+        return True
+    command = getattr(cmd_opts, "cmd", None)
+    command_name = getattr(command[0], "__name__", None) if command else None
+    return bool(getattr(cmd_opts, "autogenerate", False)) or command_name == "check"
+
+
+def load_metadata():
+    """모델 메타데이터 로드
+
+    upgrade/downgrade/current 등은 메타데이터를 사용하지 않으므로
+    ORM 모델 임포트 비용은 autogenerate 비교 시에만 지불
+    """
+    if not needs_metadata():
+        return None
+
+    from app.core.database import Base
+
+    # 모든 모델을 임포트하여 메타데이터에 포함
+    import app.models  # noqa: F401
+
+    return Base.metadata
+
+
+def include_name_for(target_metadata):
+    """autogenerate 비교 대상을 모델에 정의된 테이블로 제한하는 include_name 훅 생성
+
+    include_name은 리플렉션 이전에 호출되므로, 모델에 없는 테이블은 테이블별
+    카탈로그 조회(컬럼/인덱스/외래키) 자체를 건너뛴다.
+    """
+    if target_metadata is None:
+        return None
+
+    model_tables = frozenset(table.name for table in target_metadata.sorted_tables)
+
+    def include_name(name, type_, parent_names):
+        if type_ == "table":
+            return name in model_tables
+        return True
+
+    return include_name
 
 
 def get_url():
+    from app.core.config import settings
+
     return settings.DATABASE_URL
 
 
 def run_migrations_offline() -> None:
     """오프라인 모드에서 마이그레이션 실행"""
+    target_metadata = load_metadata()
     url = get_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -46,20 +88,35 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """온라인 모드에서 마이그레이션 실행"""
+    target_metadata = load_metadata()
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = get_url()
 
+    # 리비전 사이의 재연결 핸드셰이크를 피하도록 연결을 재사용
+    # (002의 테이블별 병렬 인덱스 빌드가 추가 연결을 사용하므로 overflow 허용)
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        poolclass=pool.QueuePool,
+        pool_size=2,
+        max_overflow=4,
+        pool_pre_ping=False,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            context.configure(
+                connection=connection,
+                target_metadata=target_metadata,
+                include_name=include_name_for(target_metadata),
+                # 리비전별 트랜잭션 - 실패 범위를 리비전 단위로 제한하고 리비전별 SET LOCAL 설정을 허용
+                transaction_per_migration=True,
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
@@ -16,8 +16,15 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
+# 애플리케이션(datetime.utcnow)과 동일하게 UTC 기준 naive timestamp를 DB 기본값으로 사용
+# (세션 타임존이 Asia/Seoul이므로 now()를 그대로 쓰면 9시간 차이 발생)
+UTC_NOW = sa.text("(now() AT TIME ZONE 'utc')")
+
 
 def upgrade() -> None:
+    # 무결성에 필요한 UNIQUE 인덱스만 테이블과 함께 생성하고,
+    # 나머지 보조 인덱스는 시드 데이터 적재 이후 010_post_load_indexes에서 생성
+
     # Create users table
     op.create_table('users',
         sa.Column('id', sa.Integer(), nullable=False),
@@ -29,13 +36,12 @@ def upgrade() -> None:
         sa.Column('address', sa.Text(), nullable=False, comment='주소'),
         sa.Column('is_verified', sa.Boolean(), nullable=False, comment='본인인증 완료 여부'),
         sa.Column('verification_method', sa.String(length=50), nullable=True, comment='인증 방법'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
     op.create_index(op.f('ix_users_phone'), 'users', ['phone'], unique=True)
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True, postgresql_where=sa.text('email IS NOT NULL'))
 
     # Create plans table
     op.create_table('plans',
@@ -53,12 +59,10 @@ def upgrade() -> None:
         sa.Column('promotion_text', sa.String(length=200), nullable=True, comment='프로모션 문구'),
         sa.Column('is_active', sa.Boolean(), nullable=False, comment='활성화 상태'),
         sa.Column('display_order', sa.Integer(), nullable=False, comment='표시 순서'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_plans_id'), 'plans', ['id'], unique=False)
-    op.create_index(op.f('ix_plans_category'), 'plans', ['category'], unique=False)
 
     # Create devices table
     op.create_table('devices',
@@ -77,12 +81,10 @@ def upgrade() -> None:
         sa.Column('is_featured', sa.Boolean(), nullable=False, comment='추천 상품 여부'),
         sa.Column('display_order', sa.Integer(), nullable=False, comment='표시 순서'),
         sa.Column('release_date', sa.String(length=20), nullable=True, comment='출시일'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_devices_id'), 'devices', ['id'], unique=False)
-    op.create_index(op.f('ix_devices_brand'), 'devices', ['brand'], unique=False)
 
     # Create admins table
     op.create_table('admins',
@@ -94,15 +96,14 @@ def upgrade() -> None:
         sa.Column('is_active', sa.Boolean(), nullable=False, comment='활성화 상태'),
         sa.Column('is_superuser', sa.Boolean(), nullable=False, comment='슈퍼유저 여부'),
         sa.Column('last_login', sa.DateTime(), nullable=True, comment='마지막 로그인 시간'),
-        sa.Column('login_count', sa.String(length=10), nullable=False, comment='로그인 횟수'),
+        sa.Column('login_count', sa.Integer(), server_default='0', nullable=False, comment='로그인 횟수'),
         sa.Column('full_name', sa.String(length=100), nullable=True, comment='실명'),
         sa.Column('department', sa.String(length=100), nullable=True, comment='부서'),
         sa.Column('phone', sa.String(length=20), nullable=True, comment='연락처'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_admins_id'), 'admins', ['id'], unique=False)
     op.create_index(op.f('ix_admins_username'), 'admins', ['username'], unique=True)
 
     # Create numbers table
@@ -116,16 +117,11 @@ def upgrade() -> None:
         sa.Column('reserved_by_order_id', sa.String(length=50), nullable=True, comment='예약한 주문 ID'),
         sa.Column('is_premium', sa.Boolean(), nullable=False, comment='프리미엄 번호 여부'),
         sa.Column('pattern_type', sa.String(length=50), nullable=True, comment='패턴 유형 (연속, 반복, 대칭 등)'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_numbers_id'), 'numbers', ['id'], unique=False)
     op.create_index(op.f('ix_numbers_number'), 'numbers', ['number'], unique=True)
-    op.create_index(op.f('ix_numbers_category'), 'numbers', ['category'], unique=False)
-    op.create_index(op.f('ix_numbers_status'), 'numbers', ['status'], unique=False)
-    op.create_index('idx_number_status_category', 'numbers', ['status', 'category'], unique=False)
-    op.create_index('idx_number_reserved_until', 'numbers', ['reserved_until'], unique=False)
 
     # Create orders table
     op.create_table('orders',
@@ -148,17 +144,15 @@ def upgrade() -> None:
         sa.Column('privacy_agreed', sa.Boolean(), nullable=False, comment='개인정보 처리 동의'),
         sa.Column('marketing_agreed', sa.Boolean(), nullable=False, comment='마케팅 수신 동의'),
         sa.Column('notes', sa.Text(), nullable=True, comment='주문 메모'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.ForeignKeyConstraint(['device_id'], ['devices.id'], ),
         sa.ForeignKeyConstraint(['number_id'], ['numbers.id'], ),
         sa.ForeignKeyConstraint(['plan_id'], ['plans.id'], ),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_orders_id'), 'orders', ['id'], unique=False)
     op.create_index(op.f('ix_orders_order_number'), 'orders', ['order_number'], unique=True)
-    op.create_index(op.f('ix_orders_status'), 'orders', ['status'], unique=False)
 
     # Create payments table
     op.create_table('payments',
@@ -185,13 +179,11 @@ def upgrade() -> None:
         sa.Column('refunded_at', sa.DateTime(), nullable=True, comment='환불 완료 시간'),
         sa.Column('receipt_url', sa.String(length=500), nullable=True, comment='영수증 URL'),
         sa.Column('notes', sa.Text(), nullable=True, comment='결제 메모'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_payments_id'), 'payments', ['id'], unique=False)
-    op.create_index(op.f('ix_payments_status'), 'payments', ['status'], unique=False)
     op.create_index(op.f('ix_payments_transaction_id'), 'payments', ['transaction_id'], unique=True)
 
     # Create order_status_history table
@@ -203,14 +195,12 @@ def upgrade() -> None:
         sa.Column('admin_id', sa.Integer(), nullable=True, comment='처리한 관리자 ID'),
         sa.Column('note', sa.Text(), nullable=True, comment='상태 변경 메모'),
         sa.Column('is_automatic', sa.String(length=10), nullable=False, comment='자동 처리 여부'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=False),
         sa.ForeignKeyConstraint(['admin_id'], ['admins.id'], ),
         sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_order_status_history_id'), 'order_status_history', ['id'], unique=False)
-    op.create_index(op.f('ix_order_status_history_order_id'), 'order_status_history', ['order_id'], unique=False)
 
 
 def downgrade() -> None:
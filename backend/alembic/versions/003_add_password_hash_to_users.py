@@ -17,10 +17,25 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add password_hash column to users table
-    op.add_column('users', sa.Column('password_hash', sa.String(length=255), nullable=True, comment='해시된 비밀번호'))
+    # Add password_hash and is_active columns, widen name for encrypted values
+    # 003-005의 사용자 테이블 변경을 단일 ALTER TABLE로 처리하여 users 테이블 잠금을 한 번만 획득
+    # (is_active는 004, 암호화 컬럼 타입 변경은 005에서 이동)
+    # varchar -> text 변경은 바이너리 호환이므로 테이블 재작성 없음
+    op.execute("""
+        ALTER TABLE users
+            ADD COLUMN password_hash varchar(255),
+            ADD COLUMN is_active boolean NOT NULL DEFAULT true,
+            ALTER COLUMN name TYPE text
+    """)
+    op.execute("COMMENT ON COLUMN users.password_hash IS '해시된 비밀번호'")
+    op.execute("COMMENT ON COLUMN users.is_active IS '계정 활성화 상태'")
 
 
 def downgrade() -> None:
-    # Remove password_hash column from users table
-    op.drop_column('users', 'password_hash')
\ No newline at end of file
+    # Remove password_hash and is_active columns, restore name type
+    op.execute("""
+        ALTER TABLE users
+            DROP COLUMN IF EXISTS is_active,
+            DROP COLUMN password_hash,
+            ALTER COLUMN name TYPE varchar(100)
+    """)
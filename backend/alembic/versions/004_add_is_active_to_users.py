@@ -17,10 +17,13 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add is_active column to users table
-    op.add_column('users', sa.Column('is_active', sa.Boolean(), nullable=False, default=True, comment='계정 활성화 상태'))
+    # is_active 컬럼은 003에서 password_hash와 함께 추가됨
+    # 이전 003만 적용된 데이터베이스를 위해 컬럼이 없을 때만 추가
+    # server_default를 사용하면 PostgreSQL 11+에서 기존 행을 재작성하지 않고 카탈로그에만 기본값을 기록
+    op.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS is_active boolean NOT NULL DEFAULT true")
+    op.execute("COMMENT ON COLUMN users.is_active IS '계정 활성화 상태'")
 
 
 def downgrade() -> None:
-    # Remove is_active column from users table
-    op.drop_column('users', 'is_active')
\ No newline at end of file
+    # 004 이전 스키마에는 is_active가 없으므로 여기서 삭제 (003 downgrade는 IF EXISTS로 처리)
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS is_active")
@@ -30,7 +30,6 @@ def upgrade() -> None:
     sa.Column('used_at', sa.DateTime(), nullable=True),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_verification_codes_id'), 'verification_codes', ['id'], unique=False)
     op.create_index(op.f('ix_verification_codes_phone'), 'verification_codes', ['phone'], unique=False)
     # ### end Alembic commands ###
 
@@ -38,6 +37,5 @@ def upgrade() -> None:
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     op.drop_index(op.f('ix_verification_codes_phone'), table_name='verification_codes')
-    op.drop_index(op.f('ix_verification_codes_id'), table_name='verification_codes')
     op.drop_table('verification_codes')
     # ### end Alembic commands ###
\ No newline at end of file
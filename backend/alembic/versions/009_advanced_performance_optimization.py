@@ -5,9 +5,7 @@ Revises: 008
 Create Date: 2025-01-18 10:00:00.000000
 
 """
-import sqlalchemy as sa
-
-from alembic import op
+from app.db.migration_utils import create_indexes_concurrently, drop_indexes_concurrently
 
 # revision identifiers, used by Alembic.
 revision = '009'
@@ -16,89 +14,65 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
+# 잠금 대기 상한 - 이 리비전의 인덱스는 주문/결제 등 쓰기가 잦은 테이블에 몰려 있으므로 기본값보다 짧게
+LOCK_TIMEOUT = '3s'
+
+# 빌드 세션별 설정 - 세션이 테이블 수만큼 동시에 열리므로 메모리는 세션당 값으로 제한
+BUILD_SESSION_SETTINGS = [
+    "SET maintenance_work_mem = '512MB'",
+    "SET max_parallel_maintenance_workers = 4",
+    # 빌드 전용 세션이므로 커밋 시 WAL flush 대기 생략
+    "SET synchronous_commit = off",
+]
+
+# 인덱스 정의 (인덱스 이름, 테이블, 인덱스 정의)
+# 이후 리비전(018~031)이 이 정의들을 교체하므로 여기서는 최초 배포 당시 정의를 유지
+ADVANCED_INDEXES = [
     # 복합 인덱스 생성 (자주 함께 사용되는 컬럼들)
-    
+
     # Orders 테이블 - 관리자 대시보드 쿼리 최적화
-    op.create_index('idx_orders_status_created_at', 'orders', ['status', 'created_at'])
-    op.create_index('idx_orders_user_created_at', 'orders', ['user_id', 'created_at'])
-    op.create_index('idx_orders_plan_status', 'orders', ['plan_id', 'status'])
-    
+    ('idx_orders_status_created_at', 'orders', '(status, created_at)'),
+    ('idx_orders_user_created_at', 'orders', '(user_id, created_at)'),
+    ('idx_orders_plan_status', 'orders', '(plan_id, status)'),
+
     # Numbers 테이블 - 번호 검색 최적화
-    op.create_index('idx_numbers_category_status_fee', 'numbers', ['category', 'status', 'additional_fee'])
-    op.create_index('idx_numbers_premium_available', 'numbers', ['is_premium', 'status'])
-    
+    ('idx_numbers_category_status_fee', 'numbers', '(category, status, additional_fee)'),
+    ('idx_numbers_premium_available', 'numbers', '(is_premium, status)'),
+
     # Devices 테이블 - 상품 목록 조회 최적화
-    op.create_index('idx_devices_active_brand_price', 'devices', ['is_active', 'brand', 'price'])
-    op.create_index('idx_devices_featured_active', 'devices', ['is_featured', 'is_active', 'display_order'])
-    
+    ('idx_devices_active_brand_price', 'devices', '(is_active, brand, price)'),
+    ('idx_devices_featured_active', 'devices', '(is_featured, is_active, display_order)'),
+
     # Plans 테이블 - 요금제 목록 최적화
-    op.create_index('idx_plans_active_category_order', 'plans', ['is_active', 'category', 'display_order'])
-    op.create_index('idx_plans_active_fee', 'plans', ['is_active', 'monthly_fee'])
-    
+    ('idx_plans_active_category_order', 'plans', '(is_active, category, display_order)'),
+    ('idx_plans_active_fee', 'plans', '(is_active, monthly_fee)'),
+
     # Users 테이블 - 사용자 검색 최적화
-    op.create_index('idx_users_active_verified', 'users', ['is_active', 'is_verified'])
-    
+    ('idx_users_active_verified', 'users', '(is_active, is_verified)'),
+
     # Payments 테이블 - 결제 통계 최적화
-    op.create_index('idx_payments_status_paid_at', 'payments', ['status', 'paid_at'])
-    op.create_index('idx_payments_method_status', 'payments', ['payment_method', 'status'])
-    
+    ('idx_payments_status_paid_at', 'payments', '(status, paid_at)'),
+    ('idx_payments_method_status', 'payments', '(payment_method, status)'),
+
     # Order Status History - 처리 이력 조회 최적화
-    op.create_index('idx_order_history_order_created', 'order_status_history', ['order_id', 'created_at'])
-    
+    ('idx_order_history_order_created', 'order_status_history', '(order_id, created_at)'),
+
     # 부분 인덱스 생성 (PostgreSQL 전용)
     # 활성 상태인 데이터만 인덱싱하여 성능 향상
-    op.execute("""
-        CREATE INDEX CONCURRENTLY idx_plans_active_only 
-        ON plans (category, monthly_fee, display_order) 
-        WHERE is_active = true
-    """)
-    
-    op.execute("""
-        CREATE INDEX CONCURRENTLY idx_devices_available_only 
-        ON devices (brand, price, display_order) 
-        WHERE is_active = true AND stock_quantity > 0
-    """)
-    
-    op.execute("""
-        CREATE INDEX CONCURRENTLY idx_numbers_available_only 
-        ON numbers (category, additional_fee, number) 
-        WHERE status = 'available'
-    """)
-    
+    ('idx_plans_active_only', 'plans', '(category, monthly_fee, display_order) WHERE is_active = true'),
+    ('idx_devices_available_only', 'devices', '(brand, price, display_order) WHERE is_active = true AND stock_quantity > 0'),
+    ('idx_numbers_available_only', 'numbers', "(category, additional_fee, number) WHERE status = 'available'"),
+
     # 함수 기반 인덱스 (검색 성능 향상)
-    op.execute("""
-        CREATE INDEX CONCURRENTLY idx_numbers_last_four_digits 
-        ON numbers (RIGHT(number, 4))
-    """)
-    
-    op.execute("""
-        CREATE INDEX CONCURRENTLY idx_orders_date_only 
-        ON orders (DATE(created_at))
-    """)
+    ('idx_numbers_last_four_digits', 'numbers', '(RIGHT(number, 4))'),
+    ('idx_orders_date_only', 'orders', '(DATE(created_at))'),
+]
+
+
+def upgrade() -> None:
+    # 모든 인덱스를 CONCURRENTLY로 생성하여 빌드 중에도 쓰기를 막지 않음
+    create_indexes_concurrently(ADVANCED_INDEXES, lock_timeout=LOCK_TIMEOUT, session_settings=BUILD_SESSION_SETTINGS)
 
 
 def downgrade() -> None:
-    # 함수 기반 인덱스 삭제
-    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_date_only")
-    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_numbers_last_four_digits")
-    
-    # 부분 인덱스 삭제
-    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_numbers_available_only")
-    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_devices_available_only")
-    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_plans_active_only")
-    
-    # 복합 인덱스 삭제
-    op.drop_index('idx_order_history_order_created', table_name='order_status_history')
-    op.drop_index('idx_payments_method_status', table_name='payments')
-    op.drop_index('idx_payments_status_paid_at', table_name='payments')
-    op.drop_index('idx_users_active_verified', table_name='users')
-    op.drop_index('idx_plans_active_fee', table_name='plans')
-    op.drop_index('idx_plans_active_category_order', table_name='plans')
-    op.drop_index('idx_devices_featured_active', table_name='devices')
-    op.drop_index('idx_devices_active_brand_price', table_name='devices')
-    op.drop_index('idx_numbers_premium_available', table_name='numbers')
-    op.drop_index('idx_numbers_category_status_fee', table_name='numbers')
-    op.drop_index('idx_orders_plan_status', table_name='orders')
-    op.drop_index('idx_orders_user_created_at', table_name='orders')
-    op.drop_index('idx_orders_status_created_at', table_name='orders')
\ No newline at end of file
+    drop_indexes_concurrently(ADVANCED_INDEXES, lock_timeout=LOCK_TIMEOUT)
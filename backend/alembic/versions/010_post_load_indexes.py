@@ -0,0 +1,42 @@
+"""Post-load secondary indexes for initial tables
+
+Revision ID: 010
+Revises: 009
+Create Date: 2025-01-20 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+# 001에서 분리한 보조 인덱스 (인덱스 이름, 테이블, 컬럼)
+# 시드 데이터 적재(008) 이후에 생성하여 행 단위 B-tree 유지 비용을 피함
+# 001에서 이미 생성된 기존 데이터베이스에서는 IF NOT EXISTS로 건너뜀
+POST_LOAD_INDEXES = [
+    ('ix_plans_category', 'plans', ['category']),
+    ('ix_devices_brand', 'devices', ['brand']),
+    ('ix_numbers_category', 'numbers', ['category']),
+    ('ix_numbers_status', 'numbers', ['status']),
+    ('idx_number_status_category', 'numbers', ['status', 'category']),
+    ('idx_number_reserved_until', 'numbers', ['reserved_until']),
+    ('ix_orders_status', 'orders', ['status']),
+    ('ix_payments_status', 'payments', ['status']),
+    ('ix_order_status_history_order_id', 'order_status_history', ['order_id']),
+]
+
+
+def upgrade() -> None:
+    for index_name, table_name, columns in POST_LOAD_INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for index_name, table_name, _columns in reversed(POST_LOAD_INDEXES):
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
@@ -0,0 +1,44 @@
+"""Drop redundant primary key indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2025-01-21 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+# PRIMARY KEY 제약 조건의 고유 인덱스와 중복되는 id 단일 컬럼 인덱스 (인덱스 이름, 테이블)
+REDUNDANT_PK_INDEXES = [
+    ('ix_users_id', 'users'),
+    ('ix_plans_id', 'plans'),
+    ('ix_devices_id', 'devices'),
+    ('ix_admins_id', 'admins'),
+    ('ix_numbers_id', 'numbers'),
+    ('ix_orders_id', 'orders'),
+    ('ix_payments_id', 'payments'),
+    ('ix_order_status_history_id', 'order_status_history'),
+    ('ix_verification_codes_id', 'verification_codes'),
+    ('ix_faqs_id', 'faqs'),
+    ('ix_inquiries_id', 'inquiries'),
+]
+
+
+def upgrade() -> None:
+    # 기존 데이터베이스에만 존재하므로 IF EXISTS로 삭제 (쓰기 잠금 없이 CONCURRENTLY 실행)
+    with op.get_context().autocommit_block():
+        for index_name, _table_name in REDUNDANT_PK_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    for index_name, table_name in reversed(REDUNDANT_PK_INDEXES):
+        op.create_index(index_name, table_name, ['id'], unique=False, if_not_exists=True)
@@ -0,0 +1,29 @@
+"""Make users email unique index partial
+
+Revision ID: 012
+Revises: 011
+Create Date: 2025-01-21 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL 이메일은 고유성 검사 대상이 아니므로 NULL이 아닌 행만 인덱싱
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently('ix_users_email', 'users', '(email) WHERE email IS NOT NULL', unique=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently('ix_users_email', 'users', '(email)', unique=True)
@@ -0,0 +1,52 @@
+"""Timestamp server defaults
+
+Revision ID: 013
+Revises: 012
+Create Date: 2025-01-21 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+# created_at/updated_at 컬럼을 가진 TimestampMixin 테이블
+TIMESTAMP_TABLES = [
+    'users',
+    'plans',
+    'devices',
+    'admins',
+    'numbers',
+    'orders',
+    'payments',
+    'order_status_history',
+    'admin_activity_logs',
+]
+
+# 애플리케이션(datetime.utcnow)과 동일한 UTC 기준 naive timestamp
+UTC_NOW = "(now() AT TIME ZONE 'utc')"
+
+
+def upgrade() -> None:
+    # 기본값 설정은 카탈로그만 변경하므로 테이블 재작성 없음
+    for table_name in TIMESTAMP_TABLES:
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN created_at SET DEFAULT {UTC_NOW}, "
+            f"ALTER COLUMN updated_at SET DEFAULT {UTC_NOW}"
+        )
+
+
+def downgrade() -> None:
+    for table_name in reversed(TIMESTAMP_TABLES):
+        op.execute(
+            f"ALTER TABLE {table_name} "
+            f"ALTER COLUMN created_at DROP DEFAULT, "
+            f"ALTER COLUMN updated_at DROP DEFAULT"
+        )
@@ -0,0 +1,33 @@
+"""Convert admins.login_count to integer
+
+Revision ID: 014
+Revises: 013
+Create Date: 2025-01-22 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 문자열로 저장되던 로그인 횟수를 정수로 변환 (단일 ALTER TABLE로 한 번만 재작성)
+    op.execute("""
+        ALTER TABLE admins
+            ALTER COLUMN login_count TYPE integer USING login_count::integer,
+            ALTER COLUMN login_count SET DEFAULT 0
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE admins
+            ALTER COLUMN login_count DROP DEFAULT,
+            ALTER COLUMN login_count TYPE varchar(10) USING login_count::varchar
+    """)
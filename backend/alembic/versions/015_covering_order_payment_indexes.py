@@ -0,0 +1,41 @@
+"""Covering columns for order and payment status indexes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2025-01-22 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 이전 정의, INCLUDE 정의)
+COVERING_INDEXES = [
+    ('idx_orders_user_id_status', 'orders', '(user_id, status)', '(user_id, status) INCLUDE (total_amount, created_at)'),
+    ('idx_payments_order_id_status', 'payments', '(order_id, status)', '(order_id, status) INCLUDE (amount, paid_at)'),
+]
+
+
+def upgrade() -> None:
+    # 조회 컬럼을 리프 페이지에 포함하여 힙 방문 없이 index-only scan 가능
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _previous, covering in COVERING_INDEXES:
+            rebuild_index_concurrently(index_name, table_name, covering)
+        # index-only scan은 visibility map에 의존하므로 통계와 함께 갱신
+        for _index_name, table_name, _previous, _covering in COVERING_INDEXES:
+            op.execute(f"VACUUM (ANALYZE) {table_name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, previous, _covering in reversed(COVERING_INDEXES):
+            rebuild_index_concurrently(index_name, table_name, previous)
@@ -0,0 +1,100 @@
+"""Partition order_status_history by created_at range
+
+Revision ID: 016
+Revises: 015
+Create Date: 2025-01-23 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+# 미리 생성할 향후 월별 파티션 수 (이후에는 백그라운드 작업이 유지)
+MONTHS_AHEAD = 12
+
+# 파티션 전환 후 부모 테이블에 다시 생성할 인덱스 (인덱스 이름, 컬럼)
+HISTORY_INDEXES = [
+    ('ix_order_status_history_order_id', 'order_id'),
+    ('idx_order_status_history_created_at', 'created_at'),
+    ('idx_order_status_history_status', 'status'),
+    ('idx_order_status_history_admin_id', 'admin_id'),
+    ('idx_order_history_order_created', 'order_id, created_at'),
+]
+
+
+def _swap_in(new_table: str) -> None:
+    """기존 데이터를 새 테이블로 복사하고 시퀀스 소유권을 넘긴 뒤 이름을 교체"""
+    # 복사 이후 커밋된 이력이 DROP TABLE로 유실되지 않도록 쓰기를 먼저 차단 (조회는 계속 허용)
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("LOCK TABLE order_status_history IN EXCLUSIVE MODE")
+    op.execute(f"INSERT INTO {new_table} SELECT * FROM order_status_history")
+    op.execute(f"ALTER SEQUENCE order_status_history_id_seq OWNED BY {new_table}.id")
+    op.execute("DROP TABLE order_status_history")
+    op.execute(f"ALTER TABLE {new_table} RENAME TO order_status_history")
+    op.execute(f"ALTER TABLE order_status_history RENAME CONSTRAINT {new_table}_pkey TO order_status_history_pkey")
+    op.execute("""
+        ALTER TABLE order_status_history
+            ADD CONSTRAINT order_status_history_order_id_fkey FOREIGN KEY (order_id) REFERENCES orders (id),
+            ADD CONSTRAINT order_status_history_admin_id_fkey FOREIGN KEY (admin_id) REFERENCES admins (id)
+    """)
+    for index_name, columns in HISTORY_INDEXES:
+        op.execute(f"CREATE INDEX {index_name} ON order_status_history ({columns})")
+
+
+def upgrade() -> None:
+    # 상태 이력은 시간순으로만 증가하므로 월별 파티션으로 나누어
+    # 쓰기와 주문별 조회가 집중되는 최근 파티션의 인덱스를 작게 유지
+    # 파티션 테이블의 기본 키에는 파티션 키가 포함되어야 함
+    op.execute("""
+        CREATE TABLE order_status_history_partitioned (
+            LIKE order_status_history INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # 기존 데이터의 첫 달부터 향후 MONTHS_AHEAD개월까지 월별 파티션 생성
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start timestamp;
+        BEGIN
+            FOR month_start IN
+                SELECT generate_series(
+                    date_trunc('month', LEAST(
+                        COALESCE((SELECT min(created_at) FROM order_status_history), now() AT TIME ZONE 'utc'),
+                        now() AT TIME ZONE 'utc'
+                    )),
+                    date_trunc('month', now() AT TIME ZONE 'utc') + interval '{MONTHS_AHEAD} months',
+                    interval '1 month'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE order_status_history_%s PARTITION OF order_status_history_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month_start, 'YYYY_MM'), month_start, month_start + interval '1 month'
+                );
+            END LOOP;
+        END
+        $$
+    """)
+    # 유지보수 작업이 지연되더라도 INSERT가 실패하지 않도록 기본 파티션 생성
+    op.execute("CREATE TABLE order_status_history_default PARTITION OF order_status_history_partitioned DEFAULT")
+
+    _swap_in('order_status_history_partitioned')
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE TABLE order_status_history_unpartitioned (
+            LIKE order_status_history INCLUDING DEFAULTS INCLUDING COMMENTS,
+            PRIMARY KEY (id)
+        )
+    """)
+    _swap_in('order_status_history_unpartitioned')
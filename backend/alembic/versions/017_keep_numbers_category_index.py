@@ -0,0 +1,29 @@
+"""Keep ix_numbers_category for category-only lookups
+
+Revision ID: 017
+Revises: 016
+Create Date: 2025-01-23 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # status 조건 없이 category만으로 조회하는 경로는 ix_numbers_category가 유일한 전체 인덱스
+    # (028에서 category로 시작하는 복합 인덱스가 상태별 부분 인덱스로 바뀜)
+    # 이전에 이 리비전으로 인덱스를 제거한 DB도 다시 생성되도록 보장
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_numbers_category ON numbers (category)")
+
+
+def downgrade() -> None:
+    # 인덱스는 010에서 생성되므로 이 리비전에서는 제거하지 않음
+    pass
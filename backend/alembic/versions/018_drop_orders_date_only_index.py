@@ -0,0 +1,28 @@
+"""Drop idx_orders_date_only in favour of created_at range predicates
+
+Revision ID: 018
+Revises: 017
+Create Date: 2025-01-24 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 일자별 조회는 created_at >= :d AND created_at < :d + 1일 범위 조건으로 바뀌어
+    # created_at 인덱스(idx_orders_created_at)와 복합 인덱스가 처리하므로 DATE(created_at) 함수 인덱스 제거
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_date_only")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_date_only ON orders (DATE(created_at))")
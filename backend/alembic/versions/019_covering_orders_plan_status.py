@@ -0,0 +1,32 @@
+"""Replace idx_orders_plan_status with a covering (plan_id, status, created_at) index
+
+Revision ID: 019
+Revises: 018
+Create Date: 2025-01-24 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 요금제별 주문을 최신순으로 조회할 때 정렬과 힙 방문 없이 index-only scan으로 처리
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_plan_status_created "
+            "ON orders (plan_id, status, created_at DESC) INCLUDE (user_id, total_amount)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_plan_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_plan_status ON orders (plan_id, status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_plan_status_created")
@@ -0,0 +1,35 @@
+"""Rebuild idx_numbers_premium_available as a partial index
+
+Revision ID: 020
+Revises: 019
+Create Date: 2025-01-24 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_numbers_premium_available'
+PREVIOUS_DEFINITION = '(is_premium, status)'
+PARTIAL_DEFINITION = "(additional_fee, number) WHERE is_premium = true AND status = 'available'"
+
+
+def upgrade() -> None:
+    # 실제 조회는 '판매 가능한 프리미엄 번호'뿐이므로 해당 행만 인덱싱하고
+    # additional_fee를 선두 키로 두어 요금순 정렬을 인덱스 순서로 처리
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'numbers', PARTIAL_DEFINITION)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'numbers', PREVIOUS_DEFINITION)
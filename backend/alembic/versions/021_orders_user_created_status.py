@@ -0,0 +1,33 @@
+"""Replace idx_orders_user_created_at with a (user_id, created_at, status) covering index
+
+Revision ID: 021
+Revises: 020
+Create Date: 2025-01-24 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 사용자별 주문 내역(최신순)과 상태 필터를 함께 처리: status는 인덱스 내 필터로,
+    # plan_id/total_amount는 INCLUDE로 두어 힙 방문 없이 조회
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_user_created_status "
+            "ON orders (user_id, created_at DESC, status) INCLUDE (plan_id, total_amount)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_user_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_user_created_at ON orders (user_id, created_at)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_user_created_status")
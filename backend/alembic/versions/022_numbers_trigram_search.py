@@ -0,0 +1,37 @@
+"""pg_trgm GIN index for numbers.number substring search
+
+Revision ID: 022
+Revises: 021
+Create Date: 2025-01-24 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 번호 검색(LIKE '%1234%', 끝자리 LIKE '%1234')을 트라이그램 GIN 인덱스 하나로 처리하여
+    # 끝 4자리 전용 RIGHT(number, 4) 함수 인덱스를 대체
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_numbers_trgm "
+            "ON numbers USING gin (number gin_trgm_ops) WHERE status = 'available'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_numbers_last_four_digits")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_numbers_last_four_digits ON numbers (RIGHT(number, 4))")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_numbers_trgm")
+
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
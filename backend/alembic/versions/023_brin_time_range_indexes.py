@@ -0,0 +1,45 @@
+"""BRIN indexes for orders.created_at, payments.paid_at and order_status_history.created_at
+
+Revision ID: 023
+Revises: 022
+Create Date: 2025-01-24 15:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 월별 리포트처럼 넓은 기간을 훑는 조회용 BRIN
+    # orders.created_at은 추가 전용 시계열 컬럼이므로 002의 B-tree(idx_orders_created_at)를 작은 BRIN으로 교체
+    # (최신순 정렬 목록은 idx_orders_status_created_at 등 복합 인덱스와 033의 커서 인덱스가 처리)
+    # payments.paid_at의 단건/정렬 조회는 기존 B-tree(idx_payments_paid_at)가 그대로 처리
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently('idx_orders_created_at', 'orders', 'USING brin (created_at) WITH (pages_per_range = 32)')
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payments_paid_brin "
+            "ON payments USING brin (paid_at) WITH (pages_per_range = 32)"
+        )
+
+    # 파티션 테이블(016)은 CONCURRENTLY를 지원하지 않으므로 일반 CREATE INDEX 사용
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_order_status_history_created_brin "
+        "ON order_status_history USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_order_status_history_created_brin")
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_payments_paid_brin")
+        rebuild_index_concurrently('idx_orders_created_at', 'orders', '(created_at)')
@@ -0,0 +1,35 @@
+"""Rebuild idx_users_active_verified as a partial covering index
+
+Revision ID: 024
+Revises: 023
+Create Date: 2025-01-24 16:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_users_active_verified'
+PREVIOUS_DEFINITION = '(is_active, is_verified)'
+PARTIAL_DEFINITION = '(created_at DESC) INCLUDE (email, phone) WHERE is_active = true AND is_verified = true'
+
+
+def upgrade() -> None:
+    # (is_active, is_verified)는 키 조합이 4개뿐이라 선택도가 거의 없으므로
+    # 활성+인증 사용자만 가입일순으로 담고 목록 컬럼은 INCLUDE로 포함
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'users', PARTIAL_DEFINITION)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'users', PREVIOUS_DEFINITION)
@@ -0,0 +1,43 @@
+"""Replace btree idx_payments_payment_method with hash and add partial analytics index
+
+Revision ID: 025
+Revises: 024
+Create Date: 2025-01-24 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # payment_method는 동등 비교로만 조회하는 소수의 값이므로 hash 인덱스가 더 작고 빠름
+        # 같은 컬럼의 B-tree(002의 idx_payments_payment_method)는 hash로 대체하여 쓰기마다 두 인덱스를 갱신하지 않음
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payments_method_hash ON payments USING hash (payment_method)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_payments_payment_method")
+        # 결제 방법별 통계는 완료/환불 건만 집계하므로 해당 행만 인덱싱
+        # 다른 상태의 결제 방법+상태 조회는 전체 행을 담은 idx_payments_method_status(009)가 계속 처리
+        # (이전 버전의 이 리비전에서 제거된 DB에도 다시 생성)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payments_method_status ON payments (payment_method, status)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payments_method_status_paid "
+            "ON payments (payment_method, status, paid_at) WHERE status IN ('completed', 'refunded')"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_payments_method_status_paid")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_payments_payment_method ON payments (payment_method)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_payments_method_hash")
@@ -0,0 +1,37 @@
+"""Replace idx_devices_featured_active with a partial covering index
+
+Revision ID: 026
+Revises: 025
+Create Date: 2025-01-25 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 메인 화면 추천 단말기는 추천+판매중인 소수의 행뿐이므로 해당 행만 노출 순서로 인덱싱하고
+    # 목록 표시 컬럼은 INCLUDE로 포함하여 index-only scan으로 처리
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_devices_featured_partial "
+            "ON devices (display_order) INCLUDE (brand, model, price, image_url) "
+            "WHERE is_featured = true AND is_active = true"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_devices_featured_active")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_devices_featured_active "
+            "ON devices (is_featured, is_active, display_order)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_devices_featured_partial")
@@ -0,0 +1,41 @@
+"""Cluster plans in idx_plans_active_fee order
+
+Revision ID: 027
+Revises: 026
+Create Date: 2025-01-25 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CLUSTER는 테이블을 재작성하며 ACCESS EXCLUSIVE 잠금을 잡으므로 대기/실행 시간 상한 지정
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '10min'")
+
+    # 요금순 범위 조회가 순차 I/O가 되도록 힙을 인덱스 순서로 재배치
+    # 다른 세션이 같은 작업을 진행 중이면 건너뜀 (클러스터 표시는 남으므로 이후 CLUSTER plans로 재실행 가능)
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF pg_try_advisory_xact_lock(hashtext('cluster_plans')) THEN
+                EXECUTE 'CLUSTER plans USING idx_plans_active_fee';
+                EXECUTE 'ANALYZE plans';
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE plans SET WITHOUT CLUSTER")
@@ -0,0 +1,45 @@
+"""Split idx_numbers_category_status_fee into per-status partial indexes
+
+Revision ID: 028
+Revises: 027
+Create Date: 2025-01-25 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+# 상태별 부분 인덱스 (인덱스 이름, 상태)
+# available은 009의 idx_numbers_available_only (category, additional_fee, number)가 이미 포함
+STATUS_PARTIAL_INDEXES = [
+    ('idx_numbers_cat_fee_reserved', 'reserved'),
+    ('idx_numbers_cat_fee_assigned', 'assigned'),
+]
+
+
+def upgrade() -> None:
+    # 상태별로 필요한 행만 담은 작은 인덱스를 두고 전체 행을 담은 복합 인덱스는 제거
+    with op.get_context().autocommit_block():
+        for index_name, status in STATUS_PARTIAL_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON numbers (category, additional_fee) WHERE status = '{status}'"
+            )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_numbers_category_status_fee")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_numbers_category_status_fee "
+            "ON numbers (category, status, additional_fee)"
+        )
+        for index_name, _status in reversed(STATUS_PARTIAL_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,44 @@
+"""Rebuild idx_payments_status_paid_at as a partial covering index
+
+Revision ID: 029
+Revises: 028
+Create Date: 2025-01-25 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_payments_status_paid_at'
+PREVIOUS_DEFINITION = '(status, paid_at)'
+COVERING_DEFINITION = (
+    "(status, paid_at DESC) INCLUDE (amount, order_id, payment_method) WHERE status IN ('completed', 'refunded', 'failed')"
+)
+
+
+def upgrade() -> None:
+    # 대시보드 결제 집계(금액/주문/결제수단)를 힙 방문 없이 index-only scan으로 처리
+    # 진행 중 상태(pending, processing)는 집계 대상이 아니므로 제외
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'payments', COVERING_DEFINITION)
+
+    # index-only scan은 visibility map에 의존하므로 payments는 autovacuum을 더 자주 실행
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("ALTER TABLE payments SET (autovacuum_vacuum_scale_factor = 0.05)")
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("ALTER TABLE payments RESET (autovacuum_vacuum_scale_factor)")
+
+    with op.get_context().autocommit_block():
+        rebuild_index_concurrently(INDEX_NAME, 'payments', PREVIOUS_DEFINITION)
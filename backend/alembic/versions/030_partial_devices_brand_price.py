@@ -0,0 +1,35 @@
+"""Replace idx_devices_active_brand_price with a partial (brand, price) index
+
+Revision ID: 030
+Revises: 029
+Create Date: 2025-01-25 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 판매중 단말기만 브랜드별 가격순으로 인덱싱 (B-tree는 역방향 스캔이 가능하므로
+    # 가격 오름차순/내림차순 정렬 모두 이 인덱스 하나로 처리)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_devices_brand_price "
+            "ON devices (brand, price) INCLUDE (model, image_url) WHERE is_active = true"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_devices_active_brand_price")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_devices_active_brand_price ON devices (is_active, brand, price)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_devices_brand_price")
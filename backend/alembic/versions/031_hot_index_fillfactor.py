@@ -0,0 +1,56 @@
+"""Lower fillfactor on write-hot status/time indexes
+
+Revision ID: 031
+Revises: 030
+Create Date: 2025-01-25 15:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+from app.db.migration_utils import rebuild_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+
+HOT_FILLFACTOR = 'WITH (fillfactor = 70)'
+
+# 상태 변경/이력 추가가 잦아 페이지 분할이 많은 인덱스 (인덱스 이름, 테이블, 키 정의, 부분 조건)
+HOT_INDEXES = [
+    ('idx_orders_status_created_at', 'orders', '(status, created_at)', ''),
+    (
+        'idx_payments_status_paid_at',
+        'payments',
+        '(status, paid_at DESC) INCLUDE (amount, order_id, payment_method)',
+        "WHERE status IN ('completed', 'refunded', 'failed')",
+    ),
+]
+
+
+def _rebuild_history_index(storage: str) -> None:
+    # 파티션 테이블(016)은 CONCURRENTLY를 지원하지 않으므로 트랜잭션 안에서 재생성
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("DROP INDEX IF EXISTS idx_order_history_order_created")
+    op.execute(f"CREATE INDEX idx_order_history_order_created ON order_status_history (order_id, created_at) {storage}")
+
+
+def upgrade() -> None:
+    # fillfactor는 이후 분할에만 적용되므로 기존 페이지까지 반영하도록 재생성
+    with op.get_context().autocommit_block():
+        for index_name, table_name, keys, predicate in HOT_INDEXES:
+            rebuild_index_concurrently(index_name, table_name, f"{keys} {HOT_FILLFACTOR} {predicate}".strip())
+
+    _rebuild_history_index(HOT_FILLFACTOR)
+
+
+def downgrade() -> None:
+    _rebuild_history_index('')
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, keys, predicate in reversed(HOT_INDEXES):
+            rebuild_index_concurrently(index_name, table_name, f"{keys} {predicate}".strip())
@@ -0,0 +1,51 @@
+"""Store numbers.status as a native number_status enum
+
+Revision ID: 032
+Revises: 031
+Create Date: 2025-01-25 16:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '032'
+down_revision = '031'
+branch_labels = None
+depends_on = None
+
+
+NUMBER_STATUSES = ('available', 'reserved', 'assigned')
+
+# status 조건이 있는 부분 인덱스 (인덱스 이름, 정의)
+# 타입 변경 시 자동 재생성되면 조건이 status::text 비교로 남아 enum 조회에 쓰이지 않으므로 직접 재생성
+STATUS_PARTIAL_INDEXES = [
+    ('idx_numbers_available_only', "(category, additional_fee, number) WHERE status = 'available'"),
+    ('idx_numbers_premium_available', "(additional_fee, number) WHERE is_premium = true AND status = 'available'"),
+    ('idx_numbers_cat_fee_reserved', "(category, additional_fee) WHERE status = 'reserved'"),
+    ('idx_numbers_cat_fee_assigned', "(category, additional_fee) WHERE status = 'assigned'"),
+    ('idx_numbers_trgm', "USING gin (number gin_trgm_ops) WHERE status = 'available'"),
+]
+
+
+def _convert_status(column_type: str, using: str) -> None:
+    # 테이블 재작성 중에는 ACCESS EXCLUSIVE 잠금이므로 CONCURRENTLY 없이 같은 트랜잭션에서 인덱스 재생성
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    for index_name, _definition in STATUS_PARTIAL_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute(f"ALTER TABLE numbers ALTER COLUMN status TYPE {column_type} USING {using}")
+    for index_name, definition in STATUS_PARTIAL_INDEXES:
+        op.execute(f"CREATE INDEX {index_name} ON numbers {definition}")
+
+
+def upgrade() -> None:
+    # 상태 문자열(가변 길이) 대신 4바이트 enum으로 저장하여 status가 포함된 인덱스 키 축소
+    labels = ', '.join(f"'{status}'" for status in NUMBER_STATUSES)
+    op.execute(f"CREATE TYPE number_status AS ENUM ({labels})")
+    _convert_status('number_status', 'status::number_status')
+
+
+def downgrade() -> None:
+    _convert_status('varchar(20)', 'status::text')
+    op.execute("DROP TYPE number_status")
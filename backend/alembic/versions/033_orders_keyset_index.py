@@ -0,0 +1,28 @@
+"""Add a (created_at, id) btree index for keyset pagination of orders
+
+Revision ID: 033
+Revises: 032
+Create Date: 2025-01-26 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '033'
+down_revision = '032'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 관리자 주문 목록의 커서 페이지네이션((created_at, id) < 커서) 용 인덱스
+    # orders.created_at 기존 인덱스는 BRIN이라 정렬+LIMIT 조회를 처리하지 못함
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_created_id_keyset ON orders (created_at DESC, id DESC)")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_orders_created_id_keyset")
@@ -0,0 +1,40 @@
+"""Store order_status_history.is_automatic as boolean
+
+Revision ID: 034
+Revises: 033
+Create Date: 2025-01-26 11:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '034'
+down_revision = '033'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 타입 변경은 모든 파티션을 재작성하며 ACCESS EXCLUSIVE 잠금을 잡으므로 대기/실행 시간 상한 지정
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '30min'")
+
+    # 'true'/'false' 문자열(최대 10바이트 + 헤더)을 1바이트 boolean으로 변환
+    op.execute(
+        "ALTER TABLE order_status_history "
+        "ALTER COLUMN is_automatic TYPE boolean USING (is_automatic = 'true'), "
+        "ALTER COLUMN is_automatic SET DEFAULT false"
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute("SET LOCAL statement_timeout = '30min'")
+
+    op.execute(
+        "ALTER TABLE order_status_history "
+        "ALTER COLUMN is_automatic DROP DEFAULT, "
+        "ALTER COLUMN is_automatic TYPE varchar(10) USING (CASE WHEN is_automatic THEN 'true' ELSE 'false' END)"
+    )
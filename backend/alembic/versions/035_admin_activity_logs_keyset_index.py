@@ -0,0 +1,37 @@
+"""Add (created_at, id) btree indexes for keyset pagination of admin activity logs
+
+Revision ID: 035
+Revises: 034
+Create Date: 2025-01-27 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '035'
+down_revision = '034'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 인덱스 정의)
+KEYSET_INDEXES = [
+    # 전체 로그 조회 - (created_at, id) < 커서 정렬+LIMIT
+    ('idx_admin_activity_logs_created_id_keyset', '(created_at DESC, id DESC)'),
+    # 관리자별 로그 조회 - admin_id 단일 인덱스로는 최신순 정렬을 처리하지 못함
+    ('idx_admin_activity_logs_admin_created_id', '(admin_id, created_at DESC, id DESC)'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, definition in KEYSET_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON admin_activity_logs {definition}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _ in reversed(KEYSET_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
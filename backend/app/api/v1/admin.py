@@ -1,12 +1,19 @@
-from typing import Any, Dict, List
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from ...core.database import SessionLocal
 from ...core.deps import get_current_admin, get_db
 from ...core.permissions import (
     Permission,
+    get_role_permission_values,
     require_admin_permissions,
     require_order_management,
     require_statistics_access,
@@ -15,6 +22,7 @@ from ...core.permissions import (
 )
 from ...models.admin import Admin
 from ...models.order import Order
+from ...models.order_status_history import OrderStatusHistory
 from ...models.user import User
 from ...schemas.admin import (
     AdminActivityLogListResponse,
@@ -28,22 +36,95 @@ from ...schemas.admin import (
 )
 from ...schemas.auth import AdminCreate as AuthAdminCreate
 from ...schemas.auth import AdminUpdate as AuthAdminUpdate
+from ...schemas.order import OrderFilter, OrderStatusUpdate
 from ...services.admin_service import AdminService
+from ...services.cache_service import cache_service
+from ...services.order_service import OrderService
+from ...services.statistics_service import ORDER_REPORT_COLUMNS, StatisticsService
 
 router = APIRouter()
 
+# 관리자 통계 캐시 TTL (초) - 집계 값은 수 초~수 분 단위로만 변하므로 짧게 캐싱
+STATS_CACHE_TTL = {
+    "dashboard": 30,
+    "overview": 60,
+    "orders": 60,
+    "plans": 60,
+    "devices": 60,
+    "users": 60,
+    "performance": 60,
+    "daily": 300,
+    "monthly": 900,
+    "report": 900,
+}
+
+
+def _get_cached_stats(stats_type: str, key: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """통계 캐시 조회, 미스 시 집계 후 캐싱 (JSON 호환 형태로 저장하므로 히트/미스 응답이 동일)"""
+    cache_key = f"admin:{key}"
+    cached_stats = cache_service.get_cached_stats(cache_key)
+    if cached_stats is not None:
+        return cached_stats
+
+    stats = jsonable_encoder(loader())
+    cache_service.cache_stats(cache_key, stats, STATS_CACHE_TTL[stats_type])
+    return stats
+
+
+def _stats_response(data: Dict[str, Any]) -> ORJSONResponse:
+    """통계 응답을 바로 직렬화하여 반환 (_get_cached_stats 결과는 이미 JSON 호환 형태라 jsonable_encoder 재처리 불필요)"""
+    return ORJSONResponse({"success": True, "data": data})
+
+
+# CSV 스트리밍 시 한 번에 내보내는 행 수
+EXPORT_CHUNK_ROWS = 500
+
+
+def _iter_csv(header: List[str], rows: Iterable[tuple], bom: bool = False) -> Iterator[str]:
+    """행 이터레이터를 CSV 청크 단위로 변환 (전체 파일을 메모리에 만들지 않음)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if bom:
+        # Excel이 UTF-8 한글을 올바르게 인식하도록 BOM 추가
+        buffer.write("\ufeff")
+    writer.writerow(header)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
 
-@router.get("/dashboard", response_model=Dict[str, Any])
-async def get_admin_dashboard(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+    yield buffer.getvalue()
+
+
+# 대시보드 초기 로딩 묶음 조회 섹션 (섹션명: (캐시 TTL 종류, 캐시 키, 집계 함수))
+BOOTSTRAP_SECTIONS: Dict[str, tuple] = {
+    "dashboard": ("dashboard", "dashboard", lambda db: AdminService(db).get_dashboard_stats()),
+    "overview": ("overview", "overview", lambda db: StatisticsService(db).get_overview_stats()),
+    "orders": ("orders", "orders", lambda db: StatisticsService(db).get_order_status_stats()),
+    "daily": ("daily", "daily:30", lambda db: StatisticsService(db).get_daily_stats(30)),
+}
+
+
+def _load_bootstrap_section(bind, section: str) -> Dict[str, Any]:
+    """묶음 조회 섹션 하나를 조회 (섹션별로 병렬 실행되므로 같은 엔진에서 각자 별도 세션 사용)"""
+    stats_type, key, loader = BOOTSTRAP_SECTIONS[section]
+    with Session(bind=bind) as db:
+        return _get_cached_stats(stats_type, key, lambda: loader(db))
+
+
+@router.get("/dashboard")
+def get_admin_dashboard(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """관리자 대시보드 데이터 조회"""
     admin_service = AdminService(db)
 
     try:
-        dashboard_stats = admin_service.get_dashboard_stats()
+        dashboard_stats = _get_cached_stats("dashboard", "dashboard", admin_service.get_dashboard_stats)
 
-        return {
-            "success": True,
-            "data": {
+        return _stats_response(
+            {
                 **dashboard_stats,
                 "admin_info": {
                     "id": current_admin.id,
@@ -51,47 +132,112 @@ async def get_admin_dashboard(db: Session = Depends(get_db), current_admin: Admi
                     "role": current_admin.role,
                     "permissions": admin_service.get_admin_permissions(current_admin),
                 },
-            },
-        }
+            }
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="대시보드 데이터 조회 중 오류가 발생했습니다."
         )
 
 
-@router.get("/users", response_model=Dict[str, Any])
-async def get_all_users(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_admin: Admin = Depends(require_user_management())
+@router.get("/bootstrap")
+def get_admin_bootstrap(
+    include: str = "dashboard,overview,orders,daily",
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(require_statistics_access()),
 ):
-    """모든 사용자 조회 (사용자 관리 권한 필요)"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    total = db.query(User).count()
+    """관리자 화면 초기 데이터 묶음 조회 (통계 조회 권한 필요)
 
-    return {
-        "success": True,
-        "data": {
-            "users": [
-                {
-                    "id": user.id,
-                    "name": user.name,
-                    "phone": user.phone,
-                    "email": user.email,
-                    "is_verified": user.is_verified,
-                    "created_at": user.created_at,
-                }
-                for user in users
-            ],
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-        },
-    }
+    대시보드/개요/주문/일별 통계를 한 요청으로 받아 인증과 활동 로그를 1회로 줄이고,
+    캐시 미스인 섹션은 커넥션 풀의 서로 다른 연결로 병렬 집계
+    """
+    admin_service = AdminService(db)
+
+    sections = list(dict.fromkeys(section.strip() for section in include.split(",") if section.strip()))
+    unknown = [section for section in sections if section not in BOOTSTRAP_SECTIONS]
+    if not sections or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 항목입니다: {', '.join(unknown)} (가능: {', '.join(BOOTSTRAP_SECTIONS)})",
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            results = executor.map(lambda section: _load_bootstrap_section(db.get_bind(), section), sections)
+            bootstrap_data = dict(zip(sections, results))
+
+        bootstrap_data["admin_info"] = {
+            "id": current_admin.id,
+            "username": current_admin.username,
+            "role": current_admin.role,
+            "permissions": admin_service.get_admin_permissions(current_admin),
+        }
+
+        # 활동 로그 기록
+        admin_service.queue_admin_activity(
+            admin_id=current_admin.id,
+            action="VIEW_ADMIN_BOOTSTRAP",
+            description="관리자 초기 데이터 조회",
+            request_data={"include": sections},
+        )
 
+        return _stats_response(bootstrap_data)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="관리자 초기 데이터 조회 중 오류가 발생했습니다."
+        )
 
-@router.get("/orders", response_model=Dict[str, Any])
-async def get_all_orders(
+
+@router.get("/users")
+def get_all_users(
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(require_user_management()),
+):
+    """모든 사용자 조회 (사용자 관리 권한 필요)
+
+    cursor(직전 페이지 마지막 사용자 ID)를 주면 OFFSET 없이 PK 인덱스로 다음 페이지를 조회
+    """
+    # 응답에 필요한 컬럼만 조회하여 ORM 객체 생성 없이 행을 그대로 dict로 변환
+    columns = (User.id, User.name, User.phone, User.email, User.is_verified, User.created_at)
+    keys = [column.key for column in columns]
+
+    if cursor is not None:
+        # 키셋 페이지네이션 - 페이지 깊이와 무관하게 limit 건만 읽음 (전체 건수는 첫 페이지에서만 제공)
+        rows = db.execute(select(*columns).where(User.id < cursor).order_by(User.id.desc()).limit(limit)).all()
+        total = None
+    else:
+        # 전체 건수를 윈도우 함수로 페이지 조회와 함께 계산하여 별도 COUNT 쿼리 생략
+        rows = db.execute(
+            select(*columns, func.count().over().label("total")).order_by(User.id.desc()).offset(skip).limit(limit)
+        ).all()
+        # 범위를 벗어난 페이지는 행이 없어 전체 건수를 알 수 없으므로 그때만 COUNT 실행
+        total = rows[0].total if rows else db.query(User).count()
+
+    # keys가 응답 컬럼까지만 있으므로 zip에서 total 컬럼은 제외됨
+    users = [dict(zip(keys, row)) for row in rows]
+
+    return ORJSONResponse(
+        {
+            "success": True,
+            "data": {
+                "users": users,
+                "total": total,
+                "skip": skip,
+                "limit": limit,
+                "next_cursor": users[-1]["id"] if len(users) == limit else None,
+            },
+        }
+    )
+
+
+@router.get("/orders")
+def get_all_orders(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[int] = None,
     status_filter: str = None,
     user_search: str = None,
     date_from: str = None,
@@ -102,11 +248,6 @@ async def get_all_orders(
     current_admin: Admin = Depends(require_order_management()),
 ):
     """모든 주문 조회 (주문 관리 권한 필요)"""
-    from datetime import datetime
-
-    from ...schemas.order import OrderFilter
-    from ...services.order_service import OrderService
-
     admin_service = AdminService(db)
     order_service = OrderService(db)
 
@@ -129,55 +270,38 @@ async def get_all_orders(
 
         # 주문 목록 조회
         page = (skip // limit) + 1
-        orders, total = order_service.get_orders(filters, page, limit)
+        orders, total = order_service.get_order_rows(filters, page, limit, cursor=cursor)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="VIEW_ORDERS",
             description="주문 목록 조회",
-            request_data={"filters": filters.dict(exclude_none=True), "skip": skip, "limit": limit},
+            request_data={"filters": filters.dict(exclude_none=True), "skip": skip, "limit": limit, "cursor": cursor},
         )
 
-        return {
-            "success": True,
-            "data": {
-                "orders": [
-                    {
-                        "id": order.id,
-                        "order_number": order.order_number,
-                        "user_id": order.user_id,
-                        "user_name": order.user.name if order.user else None,
-                        "user_phone": order.user.phone if order.user else None,
-                        "plan_name": order.plan.name if order.plan else None,
-                        "device_name": f"{order.device.brand} {order.device.model}" if order.device else None,
-                        "number": order.number.number if order.number else None,
-                        "status": order.status,
-                        "total_amount": float(order.total_amount),
-                        "is_paid": order.is_paid,
-                        "payment_status": order.payment.status if order.payment else None,
-                        "created_at": order.created_at,
-                        "updated_at": order.updated_at,
-                    }
-                    for order in orders
-                ],
-                "total": total,
-                "skip": skip,
-                "limit": limit,
-                "filters": filters.dict(exclude_none=True),
-            },
-        }
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": {
+                    "orders": orders,
+                    "total": total,
+                    "skip": skip,
+                    "limit": limit,
+                    "next_cursor": orders[-1]["id"] if len(orders) == limit else None,
+                    "filters": filters.dict(exclude_none=True),
+                },
+            }
+        )
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="주문 목록 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/orders/{order_id}", response_model=Dict[str, Any])
-async def get_order_detail(
+@router.get("/orders/{order_id}")
+def get_order_detail(
     order_id: int, db: Session = Depends(get_db), current_admin: Admin = Depends(require_order_management())
 ):
     """주문 상세 정보 조회 (주문 관리 권한 필요)"""
-    from ...services.order_service import OrderService
-
     admin_service = AdminService(db)
     order_service = OrderService(db)
 
@@ -185,7 +309,7 @@ async def get_order_detail(
         order = order_service.get_order_by_id(order_id, include_relations=True)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="VIEW_ORDER",
             resource_type="order",
@@ -193,106 +317,108 @@ async def get_order_detail(
             description=f"주문 상세 조회: {order.order_number}",
         )
 
-        return {
-            "success": True,
-            "data": {
-                "order": {
-                    "id": order.id,
-                    "order_number": order.order_number,
-                    "status": order.status,
-                    "total_amount": float(order.total_amount),
-                    "plan_fee": float(order.plan_fee),
-                    "device_fee": float(order.device_fee),
-                    "setup_fee": float(order.setup_fee),
-                    "number_fee": float(order.number_fee),
-                    "delivery_address": order.delivery_address,
-                    "delivery_request": order.delivery_request,
-                    "preferred_delivery_time": order.preferred_delivery_time,
-                    "terms_agreed": order.terms_agreed,
-                    "privacy_agreed": order.privacy_agreed,
-                    "marketing_agreed": order.marketing_agreed,
-                    "notes": order.notes,
-                    "is_paid": order.is_paid,
-                    "created_at": order.created_at,
-                    "updated_at": order.updated_at,
-                },
-                "user": (
-                    {
-                        "id": order.user.id,
-                        "name": order.user.name,
-                        "phone": order.user.phone,
-                        "email": order.user.email,
-                        "birth_date": order.user.birth_date,
-                        "address": order.user.address,
-                    }
-                    if order.user
-                    else None
-                ),
-                "plan": (
-                    {
-                        "id": order.plan.id,
-                        "name": order.plan.name,
-                        "description": order.plan.description,
-                        "monthly_fee": float(order.plan.monthly_fee),
-                        "data_limit": order.plan.data_limit,
-                        "call_minutes": order.plan.call_minutes,
-                        "sms_count": order.plan.sms_count,
-                    }
-                    if order.plan
-                    else None
-                ),
-                "device": (
-                    {
-                        "id": order.device.id,
-                        "brand": order.device.brand,
-                        "model": order.device.model,
-                        "color": order.device.color,
-                        "price": float(order.device.price),
-                        "specifications": order.device.specifications,
-                    }
-                    if order.device
-                    else None
-                ),
-                "number": (
-                    {
-                        "id": order.number.id,
-                        "number": order.number.number,
-                        "category": order.number.category,
-                        "additional_fee": float(order.number.additional_fee),
-                    }
-                    if order.number
-                    else None
-                ),
-                "payment": (
-                    {
-                        "id": order.payment.id,
-                        "payment_method": order.payment.payment_method,
-                        "amount": float(order.payment.amount),
-                        "status": order.payment.status,
-                        "transaction_id": order.payment.transaction_id,
-                        "paid_at": order.payment.paid_at,
-                    }
-                    if order.payment
-                    else None
-                ),
-                "status_history": (
-                    [
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": {
+                    "order": {
+                        "id": order.id,
+                        "order_number": order.order_number,
+                        "status": order.status,
+                        "total_amount": float(order.total_amount),
+                        "plan_fee": float(order.plan_fee),
+                        "device_fee": float(order.device_fee),
+                        "setup_fee": float(order.setup_fee),
+                        "number_fee": float(order.number_fee),
+                        "delivery_address": order.delivery_address,
+                        "delivery_request": order.delivery_request,
+                        "preferred_delivery_time": order.preferred_delivery_time,
+                        "terms_agreed": order.terms_agreed,
+                        "privacy_agreed": order.privacy_agreed,
+                        "marketing_agreed": order.marketing_agreed,
+                        "notes": order.notes,
+                        "is_paid": order.is_paid,
+                        "created_at": order.created_at,
+                        "updated_at": order.updated_at,
+                    },
+                    "user": (
                         {
-                            "id": history.id,
-                            "status": history.status,
-                            "previous_status": history.previous_status,
-                            "note": history.note,
-                            "admin_username": history.admin.username if history.admin else None,
-                            "is_automatic": history.is_automatic == "true",
-                            "created_at": history.created_at,
+                            "id": order.user.id,
+                            "name": order.user.name,
+                            "phone": order.user.phone,
+                            "email": order.user.email,
+                            "birth_date": order.user.birth_date,
+                            "address": order.user.address,
                         }
-                        for history in order.status_history
-                    ]
-                    if order.status_history
-                    else []
-                ),
-            },
-        }
+                        if order.user
+                        else None
+                    ),
+                    "plan": (
+                        {
+                            "id": order.plan.id,
+                            "name": order.plan.name,
+                            "description": order.plan.description,
+                            "monthly_fee": float(order.plan.monthly_fee),
+                            "data_limit": order.plan.data_limit,
+                            "call_minutes": order.plan.call_minutes,
+                            "sms_count": order.plan.sms_count,
+                        }
+                        if order.plan
+                        else None
+                    ),
+                    "device": (
+                        {
+                            "id": order.device.id,
+                            "brand": order.device.brand,
+                            "model": order.device.model,
+                            "color": order.device.color,
+                            "price": float(order.device.price),
+                            "specifications": order.device.specifications,
+                        }
+                        if order.device
+                        else None
+                    ),
+                    "number": (
+                        {
+                            "id": order.number.id,
+                            "number": order.number.number,
+                            "category": order.number.category,
+                            "additional_fee": float(order.number.additional_fee),
+                        }
+                        if order.number
+                        else None
+                    ),
+                    "payment": (
+                        {
+                            "id": order.payment.id,
+                            "payment_method": order.payment.payment_method,
+                            "amount": float(order.payment.amount),
+                            "status": order.payment.status,
+                            "transaction_id": order.payment.transaction_id,
+                            "paid_at": order.payment.paid_at,
+                        }
+                        if order.payment
+                        else None
+                    ),
+                    "status_history": (
+                        [
+                            {
+                                "id": history.id,
+                                "status": history.status,
+                                "previous_status": history.previous_status,
+                                "note": history.note,
+                                "admin_username": history.admin.username if history.admin else None,
+                                "is_automatic": history.is_automatic,
+                                "created_at": history.created_at,
+                            }
+                            for history in order.status_history
+                        ]
+                        if order.status_history
+                        else []
+                    ),
+                },
+            }
+        )
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -301,17 +427,15 @@ async def get_order_detail(
         )
 
 
-@router.put("/orders/{order_id}/status", response_model=Dict[str, Any])
-async def update_order_status(
+@router.put("/orders/{order_id}/status")
+def update_order_status(
     order_id: int,
     status_data: Dict[str, Any],
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(require_order_management()),
 ):
     """주문 상태 업데이트 (주문 관리 권한 필요)"""
-    from ...schemas.order import OrderStatusUpdate
-    from ...services.order_service import OrderService
-
     admin_service = AdminService(db)
     order_service = OrderService(db)
 
@@ -325,8 +449,14 @@ async def update_order_status(
 
         status_update = OrderStatusUpdate(status=new_status, note=note)
 
-        # 주문 상태 업데이트
-        order = order_service.update_order_status(order_id, status_update, current_admin.id)
+        # 주문 상태 업데이트 (DB 처리는 현재 스레드에서 수행)
+        order = order_service.apply_status_update(order_id, status_update, current_admin.id)
+        # 알림은 응답 후 이벤트 루프에서 발송 - 수신자를 미리 조회해 세션을 넘기지 않음
+        background_tasks.add_task(
+            order_service.notify_status_update, order, status_update, db.get(User, order.user_id)
+        )
+        # 주문 상태가 바뀌면 집계 값이 달라지므로 통계 캐시 무효화
+        cache_service.invalidate_stats_cache()
 
         # 활동 로그 기록
         admin_service.log_admin_activity(
@@ -357,16 +487,15 @@ async def update_order_status(
         )
 
 
-@router.post("/orders/{order_id}/cancel", response_model=Dict[str, Any])
-async def cancel_order(
+@router.post("/orders/{order_id}/cancel")
+def cancel_order(
     order_id: int,
     cancel_data: Dict[str, Any],
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(require_order_management()),
 ):
     """주문 취소 (주문 관리 권한 필요)"""
-    from ...services.order_service import OrderService
-
     admin_service = AdminService(db)
     order_service = OrderService(db)
 
@@ -374,7 +503,12 @@ async def cancel_order(
         reason = cancel_data.get("reason", "관리자에 의한 주문 취소")
 
         # 주문 취소
-        order = order_service.cancel_order(order_id, reason, current_admin.id)
+        status_update = order_service.build_cancel_update(order_id, reason)
+        order = order_service.apply_status_update(order_id, status_update, current_admin.id)
+        background_tasks.add_task(
+            order_service.notify_status_update, order, status_update, db.get(User, order.user_id)
+        )
+        cache_service.invalidate_stats_cache()
 
         # 활동 로그 기록
         admin_service.log_admin_activity(
@@ -403,112 +537,113 @@ async def cancel_order(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="주문 취소 중 오류가 발생했습니다.")
 
 
-@router.get("/orders/{order_id}/history", response_model=Dict[str, Any])
-async def get_order_status_history(
+@router.get("/orders/{order_id}/history")
+def get_order_status_history(
     order_id: int, db: Session = Depends(get_db), current_admin: Admin = Depends(require_order_management())
 ):
     """주문 상태 변경 이력 조회 (주문 관리 권한 필요)"""
     admin_service = AdminService(db)
 
     try:
-        # 주문 존재 확인
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if not order:
+        # 주문과 상태 이력을 한 번에 조회 (이력이 없는 주문도 주문 행 1개는 반환되도록 OUTER JOIN)
+        rows = db.execute(
+            select(
+                Order.order_number,
+                Order.status.label("current_status"),
+                OrderStatusHistory.id,
+                OrderStatusHistory.status,
+                OrderStatusHistory.previous_status,
+                OrderStatusHistory.note,
+                OrderStatusHistory.admin_id,
+                Admin.username.label("admin_username"),
+                OrderStatusHistory.is_automatic,
+                OrderStatusHistory.created_at,
+            )
+            .select_from(Order)
+            .outerjoin(OrderStatusHistory, OrderStatusHistory.order_id == Order.id)
+            .outerjoin(Admin, OrderStatusHistory.admin_id == Admin.id)
+            .where(Order.id == order_id)
+            .order_by(OrderStatusHistory.created_at.desc())
+        ).all()
+        if not rows:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="주문을 찾을 수 없습니다.")
 
-        # 상태 이력 조회
-        history_records = (
-            db.query(OrderStatusHistory)
-            .filter(OrderStatusHistory.order_id == order_id)
-            .order_by(OrderStatusHistory.created_at.desc())
-            .all()
-        )
+        order_number, current_status = rows[0].order_number, rows[0].current_status
+        history_records = [
+            {key: value for key, value in row._mapping.items() if key not in ("order_number", "current_status")}
+            for row in rows
+            if row.id is not None
+        ]
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="VIEW_ORDER_HISTORY",
             resource_type="order",
             resource_id=order_id,
-            description=f"주문 이력 조회: {order.order_number}",
+            description=f"주문 이력 조회: {order_number}",
         )
 
-        return {
-            "success": True,
-            "data": {
-                "order_id": order_id,
-                "order_number": order.order_number,
-                "current_status": order.status,
-                "history": [
-                    {
-                        "id": history.id,
-                        "status": history.status,
-                        "previous_status": history.previous_status,
-                        "note": history.note,
-                        "admin_id": history.admin_id,
-                        "admin_username": history.admin.username if history.admin else None,
-                        "is_automatic": history.is_automatic == "true",
-                        "created_at": history.created_at,
-                    }
-                    for history in history_records
-                ],
-            },
-        }
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": {
+                    "order_id": order_id,
+                    "order_number": order_number,
+                    "current_status": current_status,
+                    "history": history_records,
+                },
+            }
+        )
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="주문 이력 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/overview", response_model=Dict[str, Any])
-async def get_overview_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/overview")
+def get_overview_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """전체 개요 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        overview_stats = stats_service.get_overview_stats()
+        overview_stats = _get_cached_stats("overview", "overview", stats_service.get_overview_stats)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_OVERVIEW_STATISTICS", description="전체 개요 통계 조회"
         )
 
-        return {"success": True, "data": overview_stats}
+        return _stats_response(overview_stats)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="개요 통계 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/orders", response_model=Dict[str, Any])
-async def get_order_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/orders")
+def get_order_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """주문 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        order_stats = stats_service.get_order_status_stats()
+        order_stats = _get_cached_stats("orders", "orders", stats_service.get_order_status_stats)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_ORDER_STATISTICS", description="주문 통계 조회"
         )
 
-        return {"success": True, "data": order_stats}
+        return _stats_response(order_stats)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="주문 통계 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/daily", response_model=Dict[str, Any])
-async def get_daily_statistics(
+@router.get("/statistics/daily")
+def get_daily_statistics(
     days: int = 30, db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())
 ):
     """일별 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
@@ -516,28 +651,26 @@ async def get_daily_statistics(
         if days > 365:
             days = 365  # 최대 1년
 
-        daily_stats = stats_service.get_daily_stats(days)
+        daily_stats = _get_cached_stats("daily", f"daily:{days}", lambda: stats_service.get_daily_stats(days))
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="VIEW_DAILY_STATISTICS",
             description=f"일별 통계 조회 ({days}일)",
             request_data={"days": days},
         )
 
-        return {"success": True, "data": daily_stats}
+        return _stats_response(daily_stats)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="일별 통계 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/monthly", response_model=Dict[str, Any])
-async def get_monthly_statistics(
+@router.get("/statistics/monthly")
+def get_monthly_statistics(
     months: int = 12, db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())
 ):
     """월별 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
@@ -545,121 +678,111 @@ async def get_monthly_statistics(
         if months > 24:
             months = 24  # 최대 2년
 
-        monthly_stats = stats_service.get_monthly_stats(months)
+        monthly_stats = _get_cached_stats("monthly", f"monthly:{months}", lambda: stats_service.get_monthly_stats(months))
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="VIEW_MONTHLY_STATISTICS",
             description=f"월별 통계 조회 ({months}개월)",
             request_data={"months": months},
         )
 
-        return {"success": True, "data": monthly_stats}
+        return _stats_response(monthly_stats)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="월별 통계 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/plans", response_model=Dict[str, Any])
-async def get_plan_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/plans")
+def get_plan_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """요금제별 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        plan_stats = stats_service.get_plan_stats()
+        plan_stats = _get_cached_stats("plans", "plans", stats_service.get_plan_stats)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_PLAN_STATISTICS", description="요금제별 통계 조회"
         )
 
-        return {"success": True, "data": plan_stats}
+        return _stats_response(plan_stats)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="요금제 통계 조회 중 오류가 발생했습니다."
         )
 
 
-@router.get("/statistics/devices", response_model=Dict[str, Any])
-async def get_device_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/devices")
+def get_device_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """단말기별 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        device_stats = stats_service.get_device_stats()
+        device_stats = _get_cached_stats("devices", "devices", stats_service.get_device_stats)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_DEVICE_STATISTICS", description="단말기별 통계 조회"
         )
 
-        return {"success": True, "data": device_stats}
+        return _stats_response(device_stats)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="단말기 통계 조회 중 오류가 발생했습니다."
         )
 
 
-@router.get("/statistics/users", response_model=Dict[str, Any])
-async def get_user_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/users")
+def get_user_statistics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """사용자 통계 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        user_stats = stats_service.get_user_stats()
+        user_stats = _get_cached_stats("users", "users", stats_service.get_user_stats)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_USER_STATISTICS", description="사용자 통계 조회"
         )
 
-        return {"success": True, "data": user_stats}
+        return _stats_response(user_stats)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="사용자 통계 조회 중 오류가 발생했습니다."
         )
 
 
-@router.get("/statistics/performance", response_model=Dict[str, Any])
-async def get_performance_metrics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
+@router.get("/statistics/performance")
+def get_performance_metrics(db: Session = Depends(get_db), current_admin: Admin = Depends(require_statistics_access())):
     """성과 지표 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
     try:
-        performance_metrics = stats_service.get_performance_metrics()
+        performance_metrics = _get_cached_stats("performance", "performance", stats_service.get_performance_metrics)
 
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id, action="VIEW_PERFORMANCE_METRICS", description="성과 지표 조회"
         )
 
-        return {"success": True, "data": performance_metrics}
+        return _stats_response(performance_metrics)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="성과 지표 조회 중 오류가 발생했습니다.")
 
 
-@router.get("/statistics/report", response_model=Dict[str, Any])
-async def get_comprehensive_report(
+@router.get("/statistics/report")
+def get_comprehensive_report(
     period: str = "month",  # week, month, quarter, year
     export_format: str = "json",  # json, csv, excel
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(require_statistics_access()),
 ):
     """종합 리포트 조회 (통계 조회 권한 필요)"""
-    from ...services.statistics_service import StatisticsService
-
     admin_service = AdminService(db)
     stats_service = StatisticsService(db)
 
@@ -667,25 +790,32 @@ async def get_comprehensive_report(
         if period not in ["week", "month", "quarter", "year"]:
             period = "month"
 
-        comprehensive_report = stats_service.get_comprehensive_report(period)
-
         # 활동 로그 기록
-        admin_service.log_admin_activity(
+        admin_service.queue_admin_activity(
             admin_id=current_admin.id,
             action="GENERATE_COMPREHENSIVE_REPORT",
             description=f"종합 리포트 생성 ({period})",
             request_data={"period": period, "export_format": export_format},
         )
 
-        # TODO: CSV, Excel 내보내기 기능 구현 (필요시)
+        # CSV/Excel은 주문 행을 커서로 읽으면서 바로 스트리밍 (Excel은 BOM 포함 CSV)
         if export_format in ["csv", "excel"]:
-            return {
-                "success": True,
-                "message": f"{export_format.upper()} 내보내기는 추후 구현 예정입니다.",
-                "data": comprehensive_report,
-            }
+            filename = f"report_{period}_{date.today().strftime('%Y%m%d')}.csv"
+            return StreamingResponse(
+                _iter_csv(
+                    ORDER_REPORT_COLUMNS,
+                    stats_service.iter_order_report_rows(period),
+                    bom=export_format == "excel",
+                ),
+                media_type="text/csv; charset=utf-8",
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
 
-        return {"success": True, "data": comprehensive_report}
+        comprehensive_report = _get_cached_stats(
+            "report", f"report:{period}", lambda: stats_service.get_comprehensive_report(period)
+        )
+
+        return _stats_response(comprehensive_report)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="종합 리포트 생성 중 오류가 발생했습니다."
@@ -693,7 +823,7 @@ async def get_comprehensive_report(
 
 
 @router.get("/admins", response_model=AdminListResponse)
-async def get_all_admins(
+def get_all_admins(
     skip: int = 0,
     limit: int = 100,
     role_filter: str = None,
@@ -714,8 +844,8 @@ async def get_all_admins(
         )
 
 
-@router.post("/admins", response_model=Dict[str, Any])
-async def create_admin(
+@router.post("/admins")
+def create_admin(
     admin_data: AuthAdminCreate, db: Session = Depends(get_db), current_admin: Admin = Depends(require_system_admin())
 ):
     """새 관리자 생성 (시스템 관리자 권한 필요)"""
@@ -735,8 +865,8 @@ async def create_admin(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="관리자 생성 중 오류가 발생했습니다.")
 
 
-@router.get("/admins/{admin_id}", response_model=Dict[str, Any])
-async def get_admin_by_id(
+@router.get("/admins/{admin_id}")
+def get_admin_by_id(
     admin_id: int, db: Session = Depends(get_db), current_admin: Admin = Depends(require_system_admin())
 ):
     """특정 관리자 조회 (시스템 관리자 권한 필요)"""
@@ -764,8 +894,8 @@ async def get_admin_by_id(
     }
 
 
-@router.put("/admins/{admin_id}", response_model=Dict[str, Any])
-async def update_admin(
+@router.put("/admins/{admin_id}")
+def update_admin(
     admin_id: int,
     admin_data: AuthAdminUpdate,
     db: Session = Depends(get_db),
@@ -795,8 +925,8 @@ async def update_admin(
         )
 
 
-@router.delete("/admins/{admin_id}", response_model=Dict[str, Any])
-async def deactivate_admin(
+@router.delete("/admins/{admin_id}")
+def deactivate_admin(
     admin_id: int, db: Session = Depends(get_db), current_admin: Admin = Depends(require_system_admin())
 ):
     """관리자 비활성화 (시스템 관리자 권한 필요)"""
@@ -823,38 +953,44 @@ async def deactivate_admin(
 
 
 @router.get("/permissions", response_model=AdminPermissionResponse)
-async def get_current_admin_permissions(
-    current_admin: Admin = Depends(require_admin_permissions(Permission.READ_USER)), db: Session = Depends(get_db)
-):
-    """현재 관리자의 권한 조회"""
-    admin_service = AdminService(db)
-    permissions = admin_service.get_admin_permissions(current_admin)
-
-    return AdminPermissionResponse(admin_id=current_admin.id, role=current_admin.role, permissions=permissions)
+def get_current_admin_permissions(current_admin: Admin = Depends(require_admin_permissions(Permission.READ_USER))):
+    """현재 관리자의 권한 조회 (역할별 고정 매핑이므로 DB 세션 없이 응답 스키마 형태로 바로 반환)"""
+    return ORJSONResponse(
+        {
+            "admin_id": current_admin.id,
+            "role": current_admin.role,
+            "permissions": list(get_role_permission_values(current_admin.role)),
+        }
+    )
 
 
 @router.get("/activity-logs", response_model=AdminActivityLogListResponse)
-async def get_admin_activity_logs(
+def get_admin_activity_logs(
     admin_id: int = None,
     skip: int = 0,
     limit: int = 100,
     days: int = 30,
+    cursor: Optional[int] = None,
     db: Session = Depends(get_db),
     current_admin: Admin = Depends(require_system_admin()),
 ):
-    """관리자 활동 로그 조회 (시스템 관리자 권한 필요)"""
+    """관리자 활동 로그 조회 (시스템 관리자 권한 필요)
+
+    cursor(직전 페이지 마지막 로그 ID)를 주면 OFFSET 없이 (created_at, id) 인덱스로 다음 페이지를 조회
+    """
     admin_service = AdminService(db)
 
     try:
-        result = admin_service.get_admin_activity_logs(admin_id=admin_id, skip=skip, limit=limit, days=days)
+        result = admin_service.get_admin_activity_logs(admin_id=admin_id, skip=skip, limit=limit, days=days, cursor=cursor)
 
-        return AdminActivityLogListResponse(**result)
+        # 서비스가 응답 스키마 컬럼만 조회해 반환하므로 스키마 재검증 없이 바로 직렬화
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="활동 로그 조회 중 오류가 발생했습니다.")
 
 
-@router.post("/change-password", response_model=Dict[str, Any])
-async def change_admin_password(
+@router.post("/change-password")
+def change_admin_password(
     password_data: ChangePasswordRequest, db: Session = Depends(get_db), current_admin: Admin = Depends(get_current_admin)
 ):
     """관리자 비밀번호 변경"""
@@ -875,8 +1011,8 @@ async def change_admin_password(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="비밀번호 변경 중 오류가 발생했습니다.")
 
 
-@router.get("/session", response_model=Dict[str, Any])
-async def get_admin_session_info(current_admin: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
+@router.get("/session")
+def get_admin_session_info(current_admin: Admin = Depends(get_current_admin), db: Session = Depends(get_db)):
     """현재 관리자 세션 정보 조회"""
     admin_service = AdminService(db)
     permissions = admin_service.get_admin_permissions(current_admin)
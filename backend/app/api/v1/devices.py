@@ -1,12 +1,19 @@
+import hashlib
+import logging
 import math
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
 from ...core.deps import get_current_admin
+from ...core.query_optimizer import query_cache
 from ...models.admin import Admin
 from ...schemas.device import (
     BrandInfo,
@@ -19,16 +26,73 @@ from ...schemas.device import (
 )
 from ...services.device_service import DeviceService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+# 목록 검증/직렬화를 pydantic 코어에서 한 번에 처리하도록 모듈 수준 어댑터 재사용
+_device_list_adapter = TypeAdapter(List[DeviceResponse])
+
+
+def _device_page_response(devices, total: int, page: int, size: int) -> ORJSONResponse:
+    """단말기 페이지 응답을 한 번만 검증/직렬화하여 반환 (response_model 재검증 생략)"""
+    page_data = DeviceListResponse(devices=devices, total=total, page=page, size=size, total_pages=math.ceil(total / size))
+    return ORJSONResponse(page_data.model_dump(mode="json"))
+
+
+def _device_list_content(devices) -> List[dict]:
+    """단말기 목록을 응답 스키마로 한 번만 검증하여 JSON 호환 형태로 변환 (response_model 재검증 생략)"""
+    return _device_list_adapter.dump_python(_device_list_adapter.validate_python(devices), mode="json")
+
+
+def _device_list_response(devices) -> ORJSONResponse:
+    """단말기 목록 응답 반환"""
+    return ORJSONResponse(_device_list_content(devices))
+
+
+# 공개 카탈로그 조회 응답의 HTTP 캐시 정책 (초) - 브랜드 목록은 거의 바뀌지 않고, 추천/상세는 재고 수량이 포함됨
+BRANDS_MAX_AGE = 300
+DEVICE_MAX_AGE = 60
+STALE_WHILE_REVALIDATE = 300
+
+
+# 프로세스 내 캐시 유지 시간 (초) - Redis 조회와 직렬화/ETag 계산까지 생략, 다른 워커의 무효화는 이 시간 안에 반영
+LOCAL_CACHE_TTL = 30
+
+
+def _serialize_with_etag(content) -> Tuple[bytes, str]:
+    """응답 본문을 직렬화하고 본문 해시로 ETag 생성"""
+    body = ORJSONResponse(content).body
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _cacheable_response(request: Request, body: bytes, etag: str, max_age: int) -> Response:
+    """Cache-Control과 ETag를 붙여 반환하고, 클라이언트 ETag가 일치하면 본문 없이 304 반환"""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={STALE_WHILE_REVALIDATE}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _stale_response(content) -> ORJSONResponse:
+    """DB 장애 시 마지막 정상 응답을 만료 표시와 함께 반환 (클라이언트/CDN이 재사용하지 않도록 max-age=0)"""
+    return ORJSONResponse(
+        content,
+        headers={"Warning": '110 - "Response is stale"', "Cache-Control": "max-age=0, stale-if-error=60"},
+    )
+
+
 def get_device_service(db: Session = Depends(get_db)) -> DeviceService:
     """단말기 서비스 의존성"""
     return DeviceService(db)
 
 
 @router.get("/", response_model=DeviceListResponse)
-async def get_devices(
+def get_devices(
     brand: Optional[str] = Query(None, description="브랜드 필터"),
     min_price: Optional[Decimal] = Query(None, description="최소 가격"),
     max_price: Optional[Decimal] = Query(None, description="최대 가격"),
@@ -49,56 +113,88 @@ async def get_devices(
     - **page**: 페이지 번호 (기본값: 1)
     - **size**: 페이지 크기 (기본값: 20, 최대: 100)
     """
-    filters = DeviceFilter(
+    # 쿼리 파라미터 단계에서 이미 검증된 값이므로 필터 모델 재검증 생략
+    filters = DeviceFilter.model_construct(
         brand=brand, min_price=min_price, max_price=max_price, in_stock_only=in_stock_only, search=search, is_active=True
     )
 
     devices, total = device_service.get_devices(filters, page, size)
-    total_pages = math.ceil(total / size)
-
-    return DeviceListResponse(devices=devices, total=total, page=page, size=size, total_pages=total_pages)
+    return _device_page_response(devices, total, page, size)
 
 
 @router.get("/brands", response_model=List[BrandInfo])
-async def get_device_brands(device_service: DeviceService = Depends(get_device_service)):
+def get_device_brands(request: Request, device_service: DeviceService = Depends(get_device_service)):
     """
     사용 가능한 단말기 브랜드 목록 조회
     """
-    return device_service.get_available_brands()
+    cache_key = "device:brands"
+    cached = query_cache.get(cache_key)
+    if cached is None:
+        try:
+            brands = device_service.get_available_brands()
+        except SQLAlchemyError:
+            stale_brands = device_service.get_stale_brands()
+            if stale_brands is None:
+                raise
+            logger.warning("DB 조회 실패로 마지막 정상 브랜드 목록 응답")
+            return _stale_response(jsonable_encoder(stale_brands))
+
+        cached = _serialize_with_etag(jsonable_encoder(brands))
+        query_cache.set(cache_key, cached, LOCAL_CACHE_TTL)
+
+    return _cacheable_response(request, *cached, BRANDS_MAX_AGE)
 
 
 @router.get("/featured", response_model=List[DeviceResponse])
-async def get_featured_devices(
+def get_featured_devices(
+    request: Request,
     limit: int = Query(6, ge=1, le=20, description="추천 단말기 개수"),
     device_service: DeviceService = Depends(get_device_service),
 ):
     """
     추천 단말기 조회
     """
-    return device_service.get_featured_devices(limit)
+    cache_key = f"device:featured:{limit}"
+    cached = query_cache.get(cache_key)
+    if cached is None:
+        try:
+            devices = device_service.get_featured_devices(limit)
+        except SQLAlchemyError:
+            stale_devices = device_service.get_stale_featured_devices(limit)
+            if stale_devices is None:
+                raise
+            logger.warning("DB 조회 실패로 마지막 정상 추천 단말기 목록 응답")
+            return _stale_response(_device_list_content(stale_devices))
+
+        cached = _serialize_with_etag(_device_list_content(devices))
+        query_cache.set(cache_key, cached, LOCAL_CACHE_TTL)
+
+    return _cacheable_response(request, *cached, DEVICE_MAX_AGE)
 
 
 @router.get("/in-stock", response_model=List[DeviceResponse])
-async def get_devices_in_stock(device_service: DeviceService = Depends(get_device_service)):
+def get_devices_in_stock(device_service: DeviceService = Depends(get_device_service)):
     """
     재고 있는 단말기 목록 조회
     """
-    return device_service.get_devices_in_stock()
+    return _device_list_response(device_service.get_devices_in_stock())
 
 
 @router.get("/{device_id}", response_model=DeviceResponse)
-async def get_device(device_id: int, device_service: DeviceService = Depends(get_device_service)):
+def get_device(request: Request, device_id: int, device_service: DeviceService = Depends(get_device_service)):
     """
     단말기 상세 정보 조회
     """
     device = device_service.get_device_by_id(device_id)
     if not device.is_active:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="단말기를 찾을 수 없습니다.")
-    return device
+    return _cacheable_response(
+        request, *_serialize_with_etag(DeviceResponse.model_validate(device).model_dump(mode="json")), DEVICE_MAX_AGE
+    )
 
 
 @router.get("/{device_id}/stock")
-async def check_device_stock(
+def check_device_stock(
     device_id: int,
     quantity: int = Query(1, ge=1, description="확인할 수량"),
     device_service: DeviceService = Depends(get_device_service),
@@ -106,20 +202,19 @@ async def check_device_stock(
     """
     단말기 재고 확인
     """
-    is_available = device_service.check_stock(device_id, quantity)
-    device = device_service.get_device_by_id(device_id)
+    stock_quantity, is_active = device_service.get_stock_snapshot(device_id)
 
     return {
         "device_id": device_id,
-        "current_stock": device.stock_quantity,
+        "current_stock": stock_quantity,
         "requested_quantity": quantity,
-        "is_available": is_available,
+        "is_available": is_active and stock_quantity >= quantity,
     }
 
 
 # 관리자 전용 엔드포인트
 @router.post("/", response_model=DeviceResponse)
-async def create_device(
+def create_device(
     device_data: DeviceCreate,
     device_service: DeviceService = Depends(get_device_service),
     current_admin: Admin = Depends(get_current_admin),
@@ -131,7 +226,7 @@ async def create_device(
 
 
 @router.put("/{device_id}", response_model=DeviceResponse)
-async def update_device(
+def update_device(
     device_id: int,
     device_data: DeviceUpdate,
     device_service: DeviceService = Depends(get_device_service),
@@ -144,7 +239,7 @@ async def update_device(
 
 
 @router.delete("/{device_id}")
-async def delete_device(
+def delete_device(
     device_id: int,
     device_service: DeviceService = Depends(get_device_service),
     current_admin: Admin = Depends(get_current_admin),
@@ -157,7 +252,7 @@ async def delete_device(
 
 
 @router.put("/{device_id}/stock", response_model=DeviceResponse)
-async def update_device_stock(
+def update_device_stock(
     device_id: int,
     stock_data: DeviceStockUpdate,
     device_service: DeviceService = Depends(get_device_service),
@@ -170,7 +265,7 @@ async def update_device_stock(
 
 
 @router.post("/{device_id}/images")
-async def upload_device_image(
+def upload_device_image(
     device_id: int,
     file: UploadFile = File(...),
     is_main: bool = Query(False, description="대표 이미지 여부"),
@@ -180,8 +275,8 @@ async def upload_device_image(
     """
     단말기 이미지 업로드 (관리자 전용)
     """
-    # 파일 크기 제한 (5MB)
-    if file.size > 5 * 1024 * 1024:
+    # 파일 크기 제한 (5MB) - 크기를 알 수 있으면 저장 전에 바로 거절, 나머지는 저장 중 누적 크기로 확인
+    if file.size is not None and file.size > DeviceService.MAX_IMAGE_SIZE:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="파일 크기는 5MB를 초과할 수 없습니다."
         )
@@ -191,7 +286,7 @@ async def upload_device_image(
 
 
 @router.delete("/{device_id}/images")
-async def remove_device_image(
+def remove_device_image(
     device_id: int,
     image_url: str = Query(..., description="삭제할 이미지 URL"),
     device_service: DeviceService = Depends(get_device_service),
@@ -205,7 +300,7 @@ async def remove_device_image(
 
 
 @router.get("/admin/all", response_model=DeviceListResponse)
-async def get_all_devices_for_admin(
+def get_all_devices_for_admin(
     brand: Optional[str] = Query(None, description="브랜드 필터"),
     min_price: Optional[Decimal] = Query(None, description="최소 가격"),
     max_price: Optional[Decimal] = Query(None, description="최대 가격"),
@@ -221,7 +316,8 @@ async def get_all_devices_for_admin(
     """
     모든 단말기 조회 (관리자 전용) - 비활성화된 단말기 포함
     """
-    filters = DeviceFilter(
+    # 쿼리 파라미터 단계에서 이미 검증된 값이므로 필터 모델 재검증 생략
+    filters = DeviceFilter.model_construct(
         brand=brand,
         min_price=min_price,
         max_price=max_price,
@@ -232,6 +328,4 @@ async def get_all_devices_for_admin(
     )
 
     devices, total = device_service.get_devices(filters, page, size)
-    total_pages = math.ceil(total / size)
-
-    return DeviceListResponse(devices=devices, total=total, page=page, size=size, total_pages=total_pages)
+    return _device_page_response(devices, total, page, size)
@@ -2,21 +2,120 @@
 파일 업로드 API 엔드포인트
 """
 
+import asyncio
+import mmap
+import os
+import re
+import shutil
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.deps import get_current_admin
 from app.core.file_permissions import require_file_delete_permission, require_file_write_permission
+from app.core.query_optimizer import query_cache
 from app.models.admin import Admin
 from app.services.file_security_service import file_security_service
 from app.services.file_service import file_service
 
 router = APIRouter()
 
+# 관리자 대시보드 폴링용 스토리지 통계 캐시 유지 시간 (초)
+STORAGE_CACHE_TTL = 30
+
+# 다중 업로드 시 동시에 처리할 최대 파일 수 (이미지 변환 스레드 점유 제한)
+MAX_CONCURRENT_UPLOADS = 4
+
+# 격리 파일/스토리지 관리 기능을 사용할 수 있는 관리자 역할
+ADMIN_ROLES = frozenset({"admin", "super_admin"})
+
+# 파일 접근 권한 확인 대상 역할
+PERMISSION_CHECK_ROLES = ("user", "manager", "admin")
+
+# 격리 로그 레코드 형식: {timestamp},{격리 파일명},{원본 파일명},{사유}
+QUARANTINE_LOG_PATTERN = re.compile(r"^(\d+),([^,\n]*),([^,\n]*),([^\n]*)$", re.MULTILINE)
+
+# 격리 로그 전체 줄 수 계산 시 한 번에 읽는 구간 크기 (바이트)
+QUARANTINE_LOG_COUNT_CHUNK = 1024 * 1024
+
+
+def _invalidate_storage_cache():
+    """스토리지 통계 캐시 무효화 (파일 추가/삭제 후 호출)"""
+    query_cache.delete_prefix("storage:")
+
+
+def _iter_file_sizes(path: str) -> Iterator[int]:
+    """디렉토리 하위 파일 크기 순회 (DirEntry에 캐시된 stat 정보 사용)"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_file_sizes(entry.path)
+            else:
+                yield entry.stat(follow_symlinks=False).st_size
+
+
+def _scan_disk_usage(path: str) -> Tuple[int, int]:
+    """디스크 사용량 집계 (총 바이트, 파일 수)
+
+    하위 디렉토리 변경은 상위 디렉토리 mtime에 반영되지 않으므로 결과 재사용은 query_cache TTL에 맡김
+    """
+    total_size = 0
+    file_count = 0
+    for size in _iter_file_sizes(path):
+        total_size += size
+        file_count += 1
+    return total_size, file_count
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """파일 전체 읽기"""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_quarantine_log_tail(log_path: str, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """격리 로그 최근 기록 조회 (최신순 레코드 목록, 전체 레코드 수)
+
+    로그는 추가 기록만 되므로 mmap으로 파일 끝의 limit개 줄 구간만 디코딩하여 정규식으로 파싱하고, 전체 수는 줄바꿈 개수로 계산
+    """
+    with open(log_path, "rb") as log_file:
+        if os.fstat(log_file.fileno()).st_size == 0:
+            return [], 0
+
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 마지막 줄바꿈을 제외한 범위를 기준으로 줄 수와 줄 경계를 계산
+            end = len(mm) - 1 if mm[-1:] == b"\n" else len(mm)
+            # 줄바꿈 개수는 큰 구간 단위로 bytes.count(C 구현)에 맡겨 줄마다 Python 반복을 돌지 않음
+            total_count = 1 + sum(
+                mm[offset : min(offset + QUARANTINE_LOG_COUNT_CHUNK, end)].count(b"\n")
+                for offset in range(0, end, QUARANTINE_LOG_COUNT_CHUNK)
+            )
+
+            # 최근 limit개 줄의 시작 위치만 역탐색한 뒤 해당 구간을 한 번에 디코딩/분리
+            start = end + 1
+            for _ in range(limit):
+                if start == 0:
+                    break
+                start = mm.rfind(b"\n", 0, start - 1) + 1
+            tail = mm[start:end].decode("utf-8")
+
+    # 형식에 맞지 않는 줄은 건너뜀
+    records = [
+        {
+            "timestamp": int(match.group(1)),
+            "quarantine_filename": match.group(2),
+            "original_filename": match.group(3),
+            "reason": match.group(4).strip(),
+        }
+        for match in reversed(list(QUARANTINE_LOG_PATTERN.finditer(tail)))
+    ]
+
+    return records, total_count
+
 
 @router.post("/upload/device-image/{device_id}")
 async def upload_device_image(
@@ -44,6 +143,7 @@ async def upload_device_image(
 
         # 단말기 이미지 URL 업데이트
         await device_service.update_device_images(db, device_id, uploaded_urls)
+        _invalidate_storage_cache()
 
         return {"message": "이미지가 성공적으로 업로드되었습니다.", "device_id": device_id, "images": uploaded_urls}
 
@@ -53,6 +153,36 @@ async def upload_device_image(
         raise HTTPException(status_code=500, detail=f"이미지 업로드 중 오류가 발생했습니다: {str(e)}")
 
 
+async def _upload_variant(original_filename: str, size_name: str, image_data: bytes) -> str:
+    """이미지 변형 1건 업로드"""
+    filename = file_service.generate_filename(original_filename, size_name)
+
+    if file_service.s3_client:
+        return await file_service.upload_to_s3(image_data, filename)
+    return await file_service.save_local_file(image_data, filename)
+
+
+async def _process_upload(file: UploadFile, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """파일 1건 검사, 최적화 및 업로드"""
+    async with semaphore:
+        # 파일 유효성 검사
+        await file_service.validate_file(file)
+
+        # 파일 내용 읽기
+        file_content = await file.read()
+        await file.seek(0)
+
+        # 이미지 최적화 (Pillow 처리는 스레드에서 실행)
+        variants = await asyncio.to_thread(file_service.create_image_variants, file_content)
+
+        # 변형별 업로드 동시 진행
+        urls = await asyncio.gather(
+            *(_upload_variant(file.filename, size_name, image_data) for size_name, image_data in variants.items())
+        )
+
+    return {"filename": file.filename, "urls": dict(zip(variants, urls))}
+
+
 @router.post("/upload/multiple")
 async def upload_multiple_files(
     files: List[UploadFile] = File(...), current_admin: Admin = Depends(get_current_admin)
@@ -65,37 +195,19 @@ async def upload_multiple_files(
     if len(files) > 10:
         raise HTTPException(status_code=400, detail="한 번에 최대 10개의 파일만 업로드할 수 있습니다.")
 
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+    results = await asyncio.gather(*(_process_upload(file, semaphore) for file in files), return_exceptions=True)
+
     uploaded_files = []
     failed_files = []
 
-    for file in files:
-        try:
-            # 파일 유효성 검사
-            await file_service.validate_file(file)
-
-            # 파일 내용 읽기
-            file_content = await file.read()
-            await file.seek(0)
-
-            # 이미지 최적화
-            variants = file_service.create_image_variants(file_content)
-
-            # 업로드
-            file_urls = {}
-            for size_name, image_data in variants.items():
-                filename = file_service.generate_filename(file.filename, size_name)
-
-                if file_service.s3_client:
-                    url = await file_service.upload_to_s3(image_data, filename)
-                else:
-                    url = await file_service.save_local_file(image_data, filename)
-
-                file_urls[size_name] = url
+    for file, result in zip(files, results):
+        if isinstance(result, BaseException):
+            failed_files.append({"filename": file.filename, "error": str(result)})
+        else:
+            uploaded_files.append(result)
 
-            uploaded_files.append({"filename": file.filename, "urls": file_urls})
-
-        except Exception as e:
-            failed_files.append({"filename": file.filename, "error": str(e)})
+    _invalidate_storage_cache()
 
     return {
         "message": f"{len(uploaded_files)}개 파일이 성공적으로 업로드되었습니다.",
@@ -117,6 +229,7 @@ async def delete_file(
         success = await file_service.delete_file(filename)
 
         if success:
+            _invalidate_storage_cache()
             return {"message": "파일이 성공적으로 삭제되었습니다."}
         else:
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
@@ -140,14 +253,22 @@ async def cleanup_temp_files(
 
 
 @router.get("/storage-info")
-async def get_storage_info(current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def get_storage_info(
+    detailed: bool = Query(False, description="이미지 디렉토리 파일별 용량 집계 포함 여부"),
+    current_admin: Admin = Depends(get_current_admin),
+) -> Dict[str, Any]:
     """
     스토리지 정보 조회
-    """
-    import os
 
+    - **detailed**: true인 경우 이미지 디렉토리를 순회하여 파일 수와 사용 용량 집계
+    """
     from app.core.config import settings
 
+    cache_key = f"storage:info:{int(detailed)}"
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     storage_info = {
         "storage_type": "S3" if file_service.s3_client else "Local",
         "upload_dir": settings.UPLOAD_DIR,
@@ -161,14 +282,17 @@ async def get_storage_info(current_admin: Admin = Depends(get_current_admin)) ->
         try:
             upload_path = os.path.join(settings.UPLOAD_DIR, "images")
             if os.path.exists(upload_path):
-                total_size = 0
-                file_count = 0
-
-                for root, dirs, files in os.walk(upload_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
+                # 파일시스템 전체 사용량은 statvfs 한 번으로 조회
+                disk = shutil.disk_usage(upload_path)
+                storage_info["disk_usage"] = {
+                    "total_bytes": disk.total,
+                    "used_bytes": disk.used,
+                    "free_bytes": disk.free,
+                    "usage_percentage": round(disk.used / disk.total * 100, 2) if disk.total else 0,
+                }
+
+            if detailed and os.path.exists(upload_path):
+                total_size, file_count = _scan_disk_usage(upload_path)
 
                 storage_info.update(
                     {
@@ -181,56 +305,48 @@ async def get_storage_info(current_admin: Admin = Depends(get_current_admin)) ->
                 )
         except Exception as e:
             storage_info["local_storage_error"] = str(e)
+            return ORJSONResponse(storage_info)
 
-    return storage_info
+    query_cache.set(cache_key, storage_info, STORAGE_CACHE_TTL)
+    return ORJSONResponse(storage_info)
 
 
 @router.get("/quarantine")
-async def list_quarantine_files(current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def list_quarantine_files(
+    limit: int = Query(100, ge=1, le=1000, description="조회할 최근 격리 기록 수"),
+    current_admin: Admin = Depends(get_current_admin),
+) -> Dict[str, Any]:
     """격리된 파일 목록 조회 (관리자 전용)"""
-    if current_admin.role not in ["admin", "super_admin"]:
+    if current_admin.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="격리 파일 접근 권한이 없습니다.")
 
-    import os
-
     from app.core.config import settings
 
+    cache_key = f"storage:quarantine:{limit}"
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     quarantine_dir = os.path.join(settings.UPLOAD_DIR, "quarantine")
     quarantine_files = []
+    total_count = 0
 
-    if os.path.exists(quarantine_dir):
-        # 격리 로그 읽기
-        log_path = os.path.join(quarantine_dir, "quarantine.log")
-        if os.path.exists(log_path):
-            with open(log_path, "r", encoding="utf-8") as log_file:
-                for line in log_file:
-                    parts = line.strip().split(",")
-                    if len(parts) >= 4:
-                        quarantine_files.append(
-                            {
-                                "timestamp": int(parts[0]),
-                                "quarantine_filename": parts[1],
-                                "original_filename": parts[2],
-                                "reason": parts[3],
-                            }
-                        )
+    # 격리 로그 읽기
+    log_path = os.path.join(quarantine_dir, "quarantine.log")
+    if os.path.exists(log_path):
+        quarantine_files, total_count = _read_quarantine_log_tail(log_path, limit)
 
-    return {
-        "quarantine_files": sorted(quarantine_files, key=lambda x: x["timestamp"], reverse=True),
-        "total_count": len(quarantine_files),
-    }
+    result = {"quarantine_files": quarantine_files, "total_count": total_count}
+    query_cache.set(cache_key, result, STORAGE_CACHE_TTL)
+    return ORJSONResponse(result)
 
 
 @router.delete("/quarantine/{quarantine_filename}")
-async def delete_quarantine_file(
-    quarantine_filename: str, current_admin: Admin = Depends(get_current_admin)
-) -> Dict[str, str]:
+def delete_quarantine_file(quarantine_filename: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, str]:
     """격리된 파일 삭제 (관리자 전용)"""
-    if current_admin.role not in ["admin", "super_admin"]:
+    if current_admin.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="격리 파일 삭제 권한이 없습니다.")
 
-    import os
-
     from app.core.config import settings
 
     quarantine_dir = os.path.join(settings.UPLOAD_DIR, "quarantine")
@@ -241,6 +357,7 @@ async def delete_quarantine_file(
 
     try:
         os.remove(file_path)
+        _invalidate_storage_cache()
         return {"message": "격리된 파일이 삭제되었습니다."}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 삭제 중 오류: {str(e)}")
@@ -251,7 +368,7 @@ async def cleanup_quarantine_files(
     background_tasks: BackgroundTasks, days_old: int = 30, current_admin: Admin = Depends(get_current_admin)
 ) -> Dict[str, str]:
     """오래된 격리 파일 정리 (관리자 전용)"""
-    if current_admin.role not in ["admin", "super_admin"]:
+    if current_admin.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="격리 파일 정리 권한이 없습니다.")
 
     background_tasks.add_task(file_security_service.cleanup_quarantine_files, days_old)
@@ -262,8 +379,6 @@ async def cleanup_quarantine_files(
 @router.get("/security-scan/{filename}")
 async def rescan_file_security(filename: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
     """파일 보안 재검사 (관리자 전용)"""
-    import os
-
     from app.core.config import settings
 
     file_path = os.path.join(settings.UPLOAD_DIR, "images", filename)
@@ -272,9 +387,8 @@ async def rescan_file_security(filename: str, current_admin: Admin = Depends(get
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
 
     try:
-        # 파일 내용 읽기
-        with open(file_path, "rb") as f:
-            content = f.read()
+        # 파일 내용 읽기 (블로킹 I/O가 이벤트 루프를 막지 않도록 스레드에서 실행)
+        content = await asyncio.to_thread(_read_file_bytes, file_path)
 
         # 가짜 UploadFile 객체 생성
         class FakeUploadFile:
@@ -307,24 +421,26 @@ async def check_file_permissions(file_path: str, current_admin: Admin = Depends(
     from app.core.file_permissions import file_permission_manager
 
     # 다양한 역할에 대한 권한 확인
-    roles = ["user", "manager", "admin"]
+    file_category = file_permission_manager.get_file_category(f"/{file_path}")
     permissions_by_role = {}
 
-    for role in roles:
-        file_category = file_permission_manager.get_file_category(f"/{file_path}")
-        if file_category:
-            permissions = file_security_service.get_file_permissions(role, file_category)
-            permissions_by_role[role] = permissions
+    if file_category:
+        for role in PERMISSION_CHECK_ROLES:
+            permissions_by_role[role] = file_security_service.get_file_permissions(role, file_category)
 
     return {"file_path": file_path, "file_category": file_category, "permissions_by_role": permissions_by_role}
 
 
 @router.get("/storage/usage")
-async def get_storage_usage(current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def get_storage_usage(current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
     """스토리지 사용량 조회 (관리자 전용)"""
     from app.services.storage_service import storage_service
 
-    return storage_service.get_storage_usage()
+    cached = query_cache.get("storage:usage")
+    if cached is None:
+        cached = storage_service.get_storage_usage()
+        query_cache.set("storage:usage", cached, STORAGE_CACHE_TTL)
+    return ORJSONResponse(cached)
 
 
 @router.post("/storage/optimize")
@@ -332,7 +448,7 @@ async def optimize_storage(
     background_tasks: BackgroundTasks, current_admin: Admin = Depends(get_current_admin)
 ) -> Dict[str, str]:
     """스토리지 최적화 수행 (관리자 전용)"""
-    if current_admin.role not in ["admin", "super_admin"]:
+    if current_admin.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="스토리지 최적화 권한이 없습니다.")
 
     from app.services.storage_service import storage_service
@@ -343,23 +459,23 @@ async def optimize_storage(
 
 
 @router.get("/storage/duplicates/{directory}")
-async def find_duplicate_files(directory: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def find_duplicate_files(directory: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
     """중복 파일 찾기 (관리자 전용)"""
     from app.services.storage_service import storage_service
 
     try:
         duplicates = storage_service.find_duplicate_files(directory)
-        return {"directory": directory, "duplicate_count": len(duplicates), "duplicates": duplicates}
+        return ORJSONResponse({"directory": directory, "duplicate_count": len(duplicates), "duplicates": duplicates})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/storage/backup/{directory}")
-async def create_backup(
+def create_backup(
     directory: str, backup_name: Optional[str] = None, current_admin: Admin = Depends(get_current_admin)
 ) -> Dict[str, str]:
     """디렉토리 백업 생성 (관리자 전용)"""
-    if current_admin.role not in ["admin", "super_admin"]:
+    if current_admin.role not in ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="백업 생성 권한이 없습니다.")
 
     from app.services.storage_service import storage_service
@@ -374,7 +490,7 @@ async def create_backup(
 
 
 @router.get("/info/{file_path:path}")
-async def get_file_info(file_path: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
+def get_file_info(file_path: str, current_admin: Admin = Depends(get_current_admin)) -> Dict[str, Any]:
     """파일 상세 정보 조회 (관리자 전용)"""
     from app.services.storage_service import storage_service
 
@@ -2,6 +2,8 @@
 헬스체크 API 엔드포인트
 """
 
+import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -15,6 +17,11 @@ from app.schemas.admin import AdminResponse
 
 router = APIRouter()
 
+# readiness probe 결과 캐시 (짧은 간격으로 몰리는 probe 요청을 하나의 DB/Redis 체크로 합침)
+READINESS_CACHE_TTL = 0.5
+_readiness_cache: Dict[str, Any] = {"checked_at": 0.0, "result": None}
+_readiness_lock = asyncio.Lock()
+
 
 @router.get("/", response_model=Dict[str, Any])
 async def basic_health_check():
@@ -201,15 +208,25 @@ async def liveness_probe():
 @router.get("/readiness")
 async def readiness_probe():
     """Kubernetes readiness probe용 엔드포인트"""
-    try:
-        # 핵심 서비스들만 빠르게 체크
-        db_check = await health_checker._check_database()
-        redis_check = await health_checker._check_redis()
-
-        if db_check.status == HealthStatus.HEALTHY and redis_check.status == HealthStatus.HEALTHY:
-            return {"status": "ready", "timestamp": datetime.now().isoformat()}
-        else:
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Service not ready")
-
-    except Exception as e:
-        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Readiness check failed: {str(e)}")
+    if time.monotonic() - _readiness_cache["checked_at"] < READINESS_CACHE_TTL:
+        return _readiness_cache["result"]
+
+    async with _readiness_lock:
+        # 락 대기 중 다른 요청이 체크를 마친 경우 그 결과 재사용
+        if time.monotonic() - _readiness_cache["checked_at"] < READINESS_CACHE_TTL:
+            return _readiness_cache["result"]
+
+        try:
+            # 핵심 서비스들만 빠르게 체크 (DB/Redis 왕복을 동시에 진행)
+            db_check, redis_check = await asyncio.gather(health_checker._check_database(), health_checker._check_redis())
+
+            if db_check.status == HealthStatus.HEALTHY and redis_check.status == HealthStatus.HEALTHY:
+                result = {"status": "ready", "timestamp": datetime.now().isoformat()}
+                # 성공 결과만 캐시하여 장애 시에는 매 probe마다 다시 확인
+                _readiness_cache.update(checked_at=time.monotonic(), result=result)
+                return result
+            else:
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Service not ready")
+
+        except Exception as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"Readiness check failed: {str(e)}")
@@ -18,6 +18,7 @@ from ...schemas.number import (
     NumberReservationResponse,
     NumberResponse,
     NumberSearchRequest,
+    NumberStatus,
     NumberUpdate,
 )
 from ...services.number_service import NumberService
@@ -33,7 +34,7 @@ def get_number_service(db: Session = Depends(get_db)) -> NumberService:
 @router.get("/", response_model=NumberListResponse)
 async def get_numbers(
     category: Optional[str] = Query(None, description="카테고리 필터"),
-    status: Optional[str] = Query("available", description="상태 필터"),
+    status: Optional[NumberStatus] = Query("available", description="상태 필터"),
     is_premium: Optional[bool] = Query(None, description="프리미엄 번호 필터"),
     pattern_type: Optional[str] = Query(None, description="패턴 유형 필터"),
     search: Optional[str] = Query(None, description="번호 검색"),
@@ -213,7 +214,7 @@ async def assign_number(
 @router.get("/admin/all", response_model=NumberListResponse)
 async def get_all_numbers_for_admin(
     category: Optional[str] = Query(None, description="카테고리 필터"),
-    status: Optional[str] = Query(None, description="상태 필터"),
+    status: Optional[NumberStatus] = Query(None, description="상태 필터"),
     is_premium: Optional[bool] = Query(None, description="프리미엄 번호 필터"),
     pattern_type: Optional[str] = Query(None, description="패턴 유형 필터"),
     search: Optional[str] = Query(None, description="번호 검색"),
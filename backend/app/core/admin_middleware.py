@@ -8,8 +8,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
 
 from ..core.security import verify_token
-from ..models.admin_activity_log import AdminActivityLog
-from .database import SessionLocal
+from ..services.admin_service import activity_log_buffer
 
 
 class AdminActivityMiddleware(BaseHTTPMiddleware):
@@ -80,8 +79,6 @@ class AdminActivityMiddleware(BaseHTTPMiddleware):
     ):
         """관리자 활동 로그 기록"""
         try:
-            db = SessionLocal()
-
             # 액션 결정
             action = self._determine_action(request.method, request.url.path)
 
@@ -91,8 +88,9 @@ class AdminActivityMiddleware(BaseHTTPMiddleware):
             # 성공 여부 판단
             success = "true" if 200 <= response.status_code < 400 else "false"
 
-            # 활동 로그 생성
-            activity_log = AdminActivityLog(
+            # 활동 로그는 버퍼에 적재하고 백그라운드 태스크가 일괄 저장
+            # (이벤트 루프에서 세션을 열어 동기 INSERT/commit 하지 않음)
+            activity_log_buffer.push(
                 admin_id=admin_id,
                 action=action,
                 resource_type=resource_type,
@@ -107,10 +105,6 @@ class AdminActivityMiddleware(BaseHTTPMiddleware):
                 success=success,
             )
 
-            db.add(activity_log)
-            db.commit()
-            db.close()
-
         except Exception as e:
             # 로깅 실패는 메인 요청에 영향을 주지 않도록
             print(f"Admin activity logging failed: {e}")
@@ -3,6 +3,9 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from anyio import to_thread
+
+from app.core.config import settings
 from app.core.database import get_db
 from app.services.email_queue_service import email_queue_service
 from app.services.verification_service import verification_service
@@ -40,6 +43,14 @@ class BackgroundTaskManager:
         storage_optimization_task = asyncio.create_task(self._run_storage_optimization())
         self.tasks.append(storage_optimization_task)
 
+        # 관리자 활동 로그 일괄 저장 태스크
+        activity_log_task = asyncio.create_task(self._run_activity_log_flush())
+        self.tasks.append(activity_log_task)
+
+        # 상태 이력 파티션 유지 태스크
+        partition_task = asyncio.create_task(self._run_partition_maintenance())
+        self.tasks.append(partition_task)
+
         # 시스템 모니터링 태스크
         monitoring_task = asyncio.create_task(self._run_system_monitoring())
         self.tasks.append(monitoring_task)
@@ -85,6 +96,10 @@ class BackgroundTaskManager:
             await asyncio.gather(*self.tasks, return_exceptions=True)
 
         self.tasks.clear()
+
+        # 버퍼에 남은 관리자 활동 로그 저장
+        await to_thread.run_sync(self._flush_activity_logs)
+
         logger.info("백그라운드 태스크가 중지되었습니다.")
 
     async def _run_email_queue_processor(self):
@@ -180,6 +195,80 @@ class BackgroundTaskManager:
         except Exception as e:
             logger.error(f"스토리지 최적화 태스크 오류: {str(e)}")
 
+    def _flush_activity_logs(self) -> int:
+        """버퍼에 적재된 관리자 활동 로그 일괄 저장"""
+        from app.services.admin_service import activity_log_buffer
+
+        if not activity_log_buffer.has_pending():
+            return 0
+
+        db = next(get_db())
+        try:
+            return activity_log_buffer.flush(db)
+        finally:
+            db.close()
+
+    async def _run_activity_log_flush(self):
+        """관리자 활동 로그 일괄 저장 태스크"""
+        try:
+            logger.info("관리자 활동 로그 저장 태스크 시작")
+            from app.services.admin_service import activity_log_buffer
+
+            loop = asyncio.get_running_loop()
+            last_flush = loop.time()
+            while self.is_running:
+                # FLUSH_INTERVAL마다, 또는 BATCH_SIZE만큼 쌓이면 즉시 저장 (DB 작업은 스레드에서 실행)
+                if (
+                    activity_log_buffer.pending_count() >= activity_log_buffer.BATCH_SIZE
+                    or loop.time() - last_flush >= activity_log_buffer.FLUSH_INTERVAL
+                ):
+                    try:
+                        await to_thread.run_sync(self._flush_activity_logs)
+                    except Exception as e:
+                        logger.error(f"관리자 활동 로그 저장 중 오류: {str(e)}")
+                    last_flush = loop.time()
+
+                await asyncio.sleep(activity_log_buffer.POLL_INTERVAL)
+
+        except asyncio.CancelledError:
+            logger.info("관리자 활동 로그 저장 태스크가 취소되었습니다.")
+        except Exception as e:
+            logger.error(f"관리자 활동 로그 저장 태스크 오류: {str(e)}")
+
+    def _ensure_history_partitions(self) -> int:
+        """주문 상태 이력의 향후 월별 파티션 생성"""
+        from app.services.database_monitoring_service import DatabaseMonitoringService
+
+        db = next(get_db())
+        try:
+            return DatabaseMonitoringService(db).ensure_history_partitions()
+        finally:
+            db.close()
+
+    async def _run_partition_maintenance(self):
+        """주문 상태 이력 파티션 유지 태스크"""
+        try:
+            logger.info("파티션 유지 태스크 시작")
+
+            while self.is_running:
+                try:
+                    # 24시간마다 향후 월별 파티션 생성 (카탈로그 조회/DDL은 스레드에서 실행)
+                    created_count = await to_thread.run_sync(self._ensure_history_partitions)
+
+                    if created_count > 0:
+                        logger.info(f"주문 상태 이력 파티션 {created_count}개 생성 완료")
+
+                except Exception as e:
+                    logger.error(f"파티션 유지 중 오류: {str(e)}")
+
+                # 24시간 대기
+                await asyncio.sleep(86400)
+
+        except asyncio.CancelledError:
+            logger.info("파티션 유지 태스크가 취소되었습니다.")
+        except Exception as e:
+            logger.error(f"파티션 유지 태스크 오류: {str(e)}")
+
     async def _run_system_monitoring(self):
         """시스템 모니터링 태스크"""
         try:
@@ -234,6 +323,8 @@ async def lifespan(app) -> AsyncGenerator[None, None]:
     """FastAPI 애플리케이션 생명주기 관리"""
     # 시작 시
     logger.info("애플리케이션 시작")
+    # 동기(def) 핸들러가 실행되는 스레드풀 크기 조정
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
     await background_task_manager.start_background_tasks()
 
     yield
@@ -29,6 +29,18 @@ class Settings(BaseSettings):
     # 데이터베이스 설정 - SQLite for demo
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./demo.db")
 
+    # 커넥션 풀 설정 - pool_size >= 워커당 동시 요청 수 (관리자 대시보드 1회 로딩 시 동시 요청 수 x 동시 관리자 수)
+    # 전체 DB 커넥션 수는 uvicorn 워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) <= PostgreSQL max_connections x 0.8 로 유지
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 20))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    # 풀 고갈 시 스레드가 오래 쌓이지 않도록 짧게 대기 후 실패
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 10))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    # 동기 핸들러를 실행하는 AnyIO 스레드풀 크기 (워커당, 기본값 40) - DB 대기 중인 스레드가 Redis 캐시 응답까지 막지 않도록 여유 있게 설정
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", 200))
+    # PgBouncer(기본 6432 포트) 뒤에 배포하는 경우 앱 측 풀을 끄고 PgBouncer가 커넥션을 다중화
+    DB_USE_PGBOUNCER: bool = os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true"
+
     # Redis 설정 - 메모리 캐시로 대체 가능
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -5,21 +5,33 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+def _pool_options() -> dict:
+    """커넥션 풀 설정 (PgBouncer 사용 시 앱 측 풀 비활성화)"""
+    if settings.DB_USE_PGBOUNCER:
+        return {"poolclass": NullPool}
+
+    return {
+        "pool_pre_ping": True,  # 커넥션 유효성 검사
+        "pool_recycle": settings.DB_POOL_RECYCLE,  # 서버/방화벽 유휴 종료 전에 커넥션 재생성
+        "pool_size": settings.DB_POOL_SIZE,  # 워커당 상시 유지 커넥션 수
+        "max_overflow": settings.DB_MAX_OVERFLOW,  # 순간 부하 시 추가 커넥션 수
+        "pool_timeout": settings.DB_POOL_TIMEOUT,  # 커넥션 대기 시간
+    }
+
+
 # 데이터베이스 엔진 생성 (성능 최적화된 설정)
 engine = create_engine(
     settings.DATABASE_URL,
     # 커넥션 풀 설정
-    pool_pre_ping=True,  # 커넥션 유효성 검사
-    pool_recycle=3600,  # 1시간마다 커넥션 재생성
-    pool_size=20,  # 기본 커넥션 풀 크기 증가
-    max_overflow=30,  # 최대 오버플로우 커넥션 수 증가
-    pool_timeout=30,  # 커넥션 대기 시간
+    **_pool_options(),
     # 성능 최적화 설정
     echo=False,  # SQL 로깅 비활성화 (프로덕션)
     echo_pool=False,  # 풀 로깅 비활성화
@@ -92,10 +104,13 @@ def check_db_connection():
 def get_pool_status():
     """커넥션 풀 상태 정보 반환"""
     pool = engine.pool
+    if isinstance(pool, NullPool):
+        # PgBouncer 사용 시 앱 측 풀이 없으므로 PgBouncer의 SHOW POOLS로 확인
+        return {"pool_class": "NullPool"}
+
     return {
         "pool_size": pool.size(),
         "checked_in": pool.checkedin(),
         "checked_out": pool.checkedout(),
         "overflow": pool.overflow(),
-        "invalid": pool.invalid(),
     }
@@ -1,3 +1,5 @@
+from dataclasses import asdict, dataclass
+from datetime import datetime
 from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, status
@@ -6,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from ..models.admin import Admin
 from ..models.user import User
+from ..services.cache_service import cache_service
 from .database import SessionLocal
 from .security import verify_token
 
@@ -13,6 +16,46 @@ from .security import verify_token
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class CachedAdmin:
+    """인증된 관리자 스냅샷 (요청마다 admins 조회를 생략하기 위해 Redis에 캐싱하는 읽기 전용 정보)"""
+
+    id: int
+    username: str
+    email: str
+    role: str
+    is_active: bool
+    is_superuser: bool
+    full_name: Optional[str] = None
+    department: Optional[str] = None
+    phone: Optional[str] = None
+    last_login: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_admin(cls, admin: Admin) -> "CachedAdmin":
+        return cls(**{field: getattr(admin, field) for field in cls.__dataclass_fields__})
+
+    @classmethod
+    def from_cache(cls, data: dict) -> "CachedAdmin":
+        for field in ("last_login", "created_at"):
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+        return cls(**data)
+
+    def to_cache(self) -> dict:
+        data = asdict(self)
+        for field in ("last_login", "created_at"):
+            if data[field]:
+                data[field] = data[field].isoformat()
+        return data
+
+    @property
+    def is_super_admin(self):
+        """슈퍼 관리자 여부"""
+        return self.role == "super_admin" or self.is_superuser
+
+
 def get_db() -> Generator:
     """데이터베이스 세션 의존성"""
     try:
@@ -60,12 +103,19 @@ def get_current_admin_id(credentials: HTTPAuthorizationCredentials = Depends(sec
     return int(admin_id)
 
 
-def get_current_admin(db: Session = Depends(get_db), admin_id: int = Depends(get_current_admin_id)) -> Admin:
-    """현재 관리자 객체 반환"""
+def get_current_admin(db: Session = Depends(get_db), admin_id: int = Depends(get_current_admin_id)) -> CachedAdmin:
+    """현재 관리자 정보 반환 (캐시 히트 시 DB 조회 없음, 관리자 정보 변경 시 캐시 무효화)"""
+    cached_admin = cache_service.get_cached_admin_auth(admin_id)
+    if cached_admin is not None:
+        return CachedAdmin.from_cache(cached_admin)
+
     admin = db.query(Admin).filter(Admin.id == admin_id).first()
     if not admin:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="관리자를 찾을 수 없습니다.")
-    return admin
+
+    current_admin = CachedAdmin.from_admin(admin)
+    cache_service.cache_admin_auth(admin_id, current_admin.to_cache())
+    return current_admin
 
 
 def get_optional_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[int]:
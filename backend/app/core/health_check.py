@@ -178,6 +178,11 @@ class HealthChecker:
     # 개별 헬스체크 메서드들
     async def _check_database(self) -> HealthCheckResult:
         """데이터베이스 헬스체크"""
+        # 동기 DB 호출이 이벤트 루프를 막지 않도록 스레드에서 실행 (다른 체크와 동시 진행 가능)
+        return await asyncio.to_thread(self._check_database_sync)
+
+    def _check_database_sync(self) -> HealthCheckResult:
+        """데이터베이스 헬스체크 (동기)"""
         try:
             db = next(get_db())
             start_time = time.time()
@@ -195,7 +200,6 @@ class HealthChecker:
                 "checked_in": pool.checkedin(),
                 "checked_out": pool.checkedout(),
                 "overflow": pool.overflow(),
-                "invalid": pool.invalid(),
             }
 
             # 응답 시간 기반 상태 결정
@@ -229,8 +233,11 @@ class HealthChecker:
 
     async def _check_redis(self) -> HealthCheckResult:
         """Redis 헬스체크"""
+        return await asyncio.to_thread(self._check_redis_sync)
+
+    def _check_redis_sync(self) -> HealthCheckResult:
+        """Redis 헬스체크 (동기)"""
         try:
-            redis_client = redis_client
             start_time = time.time()
 
             # PING 명령 실행
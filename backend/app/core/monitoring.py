@@ -14,6 +14,8 @@ import psutil
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.config import settings
+from app.core.database import get_pool_status
 from app.core.logging_config import get_logger
 from app.core.redis_client import redis_client
 
@@ -52,6 +54,9 @@ class SystemMetric:
     network_sent: int
     network_recv: int
     active_connections: int
+    db_pool_size: int = 0
+    db_pool_checked_out: int = 0
+    db_pool_overflow: int = 0
 
 
 class MetricsCollector:
@@ -158,6 +163,10 @@ class MetricsCollector:
         if metric.disk_percent > 90:
             alerts.append(f"High disk usage: {metric.disk_percent:.1f}%")
 
+        # 상시 커넥션과 추가 커넥션을 모두 사용 중이면 이후 요청은 풀 대기(DB_POOL_TIMEOUT) 발생
+        if metric.db_pool_size and metric.db_pool_checked_out >= metric.db_pool_size + settings.DB_MAX_OVERFLOW:
+            alerts.append(f"DB connection pool exhausted: {metric.db_pool_checked_out} checked out")
+
         for alert in alerts:
             logger.warning(alert, extra={"alert_type": "system_threshold"})
 
@@ -197,6 +206,9 @@ class MetricsCollector:
             "disk_used_gb": latest.disk_used / (1024**3),
             "disk_free_gb": latest.disk_free / (1024**3),
             "active_connections": latest.active_connections,
+            "db_pool_size": latest.db_pool_size,
+            "db_pool_checked_out": latest.db_pool_checked_out,
+            "db_pool_overflow": latest.db_pool_overflow,
         }
 
     def _get_status_code_distribution(self, metrics: List[RequestMetric]) -> Dict[str, int]:
@@ -329,6 +341,9 @@ class SystemMonitor:
         except (psutil.AccessDenied, psutil.NoSuchProcess):
             connections = 0
 
+        # DB 커넥션 풀 사용량 (PgBouncer 사용 시 앱 측 풀 없음)
+        pool_status = get_pool_status()
+
         return SystemMetric(
             timestamp=datetime.now(),
             cpu_percent=cpu_percent,
@@ -341,6 +356,9 @@ class SystemMonitor:
             network_sent=network.bytes_sent,
             network_recv=network.bytes_recv,
             active_connections=connections,
+            db_pool_size=pool_status.get("pool_size", 0),
+            db_pool_checked_out=pool_status.get("checked_out", 0),
+            db_pool_overflow=max(pool_status.get("overflow", 0), 0),  # 풀이 다 차기 전에는 음수로 반환됨
         )
 
 
@@ -1,13 +1,13 @@
 from enum import Enum
-from functools import wraps
-from typing import List, Set
+from functools import lru_cache, wraps
+from typing import List, Set, Tuple
 
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from ..models.admin import Admin
 from ..models.user import User
-from .deps import get_current_admin, get_current_user, get_db
+from .deps import CachedAdmin, get_current_admin, get_current_user, get_db
 
 
 class Permission(Enum):
@@ -112,14 +112,20 @@ ROLE_PERMISSIONS: dict[Role, Set[Permission]] = {
 }
 
 
+@lru_cache(maxsize=None)
+def get_role_permission_values(role: str) -> Tuple[str, ...]:
+    """역할별 권한 값 목록 (ROLE_PERMISSIONS는 코드에 고정된 매핑이므로 역할당 한 번만 계산)"""
+    return tuple(sorted(permission.value for permission in ROLE_PERMISSIONS.get(Role(role), set())))
+
+
 class PermissionChecker:
     """권한 검사 클래스"""
 
     def __init__(self, required_permissions: List[Permission]):
         self.required_permissions = required_permissions
 
-    def __call__(self, current_admin: Admin = Depends(get_current_admin)):
-        """관리자 권한 검사"""
+    async def __call__(self, current_admin: Admin = Depends(get_current_admin)):
+        """관리자 권한 검사 (메모리 내 매핑 조회뿐이므로 스레드풀을 거치지 않도록 async로 실행)"""
         admin_role = Role(current_admin.role)
         admin_permissions = ROLE_PERMISSIONS.get(admin_role, set())
 
@@ -138,8 +144,8 @@ class UserPermissionChecker:
     def __init__(self, required_permissions: List[Permission]):
         self.required_permissions = required_permissions
 
-    def __call__(self, current_user: User = Depends(get_current_user)):
-        """사용자 권한 검사"""
+    async def __call__(self, current_user: User = Depends(get_current_user)):
+        """사용자 권한 검사 (메모리 내 매핑 조회뿐이므로 스레드풀을 거치지 않도록 async로 실행)"""
         user_permissions = ROLE_PERMISSIONS.get(Role.USER, set())
 
         for permission in self.required_permissions:
@@ -151,11 +157,14 @@ class UserPermissionChecker:
         return current_user
 
 
+# 같은 권한 조합에는 같은 검사기 인스턴스를 반환하여 FastAPI가 요청 내에서 의존성 결과를 재사용하도록 함
+@lru_cache(maxsize=None)
 def require_permissions(*permissions: Permission):
     """관리자 권한 요구 데코레이터"""
     return PermissionChecker(list(permissions))
 
 
+@lru_cache(maxsize=None)
 def require_user_permissions(*permissions: Permission):
     """사용자 권한 요구 데코레이터"""
     return UserPermissionChecker(list(permissions))
@@ -201,7 +210,7 @@ class RoleManager:
         """권한 보유 여부 확인"""
         if isinstance(user_or_admin, User):
             permissions = RoleManager.get_user_permissions(user_or_admin)
-        elif isinstance(user_or_admin, Admin):
+        elif isinstance(user_or_admin, (Admin, CachedAdmin)):
             permissions = RoleManager.get_admin_permissions(user_or_admin)
         else:
             return False
@@ -212,7 +221,7 @@ class RoleManager:
     def can_access_resource(user_or_admin, resource_user_id: int, permission: Permission) -> bool:
         """리소스 접근 권한 확인"""
         # 관리자인 경우
-        if isinstance(user_or_admin, Admin):
+        if isinstance(user_or_admin, (Admin, CachedAdmin)):
             return RoleManager.has_permission(user_or_admin, permission)
 
         # 사용자인 경우 - 자신의 리소스만 접근 가능
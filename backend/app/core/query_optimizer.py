@@ -167,10 +167,9 @@ class QueryCache:
             if datetime.now() < self._cache_ttl.get(key, datetime.min):
                 return self._cache[key]
             else:
-                # TTL 만료된 캐시 삭제
-                del self._cache[key]
-                if key in self._cache_ttl:
-                    del self._cache_ttl[key]
+                # TTL 만료된 캐시 삭제 (스레드풀에서 동시에 만료 처리될 수 있으므로 pop 사용)
+                self._cache.pop(key, None)
+                self._cache_ttl.pop(key, None)
         return None
 
     def set(self, key: str, value: Any, ttl_seconds: int = 300):
@@ -178,6 +177,12 @@ class QueryCache:
         self._cache[key] = value
         self._cache_ttl[key] = datetime.now() + timedelta(seconds=ttl_seconds)
 
+    def delete_prefix(self, prefix: str):
+        """접두사가 일치하는 캐시 삭제"""
+        for key in [key for key in list(self._cache) if key.startswith(prefix)]:
+            self._cache.pop(key, None)
+            self._cache_ttl.pop(key, None)
+
     def clear(self):
         """캐시 전체 삭제"""
         self._cache.clear()
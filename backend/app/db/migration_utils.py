@@ -0,0 +1,170 @@
+"""
+Alembic 마이그레이션 공용 유틸리티
+CONCURRENTLY 인덱스 생성/삭제를 잠금 대기 상한, 재시도, 테이블별 병렬 세션으로 실행
+"""
+
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# 잠금 대기 상한 - 오래 걸리는 트랜잭션 뒤에서 쓰기를 무기한 막지 않도록 빠르게 실패 후 재시도
+LOCK_TIMEOUT = '5s'
+STATEMENT_TIMEOUT = '30min'
+MAX_LOCK_RETRIES = 3
+
+# 동시에 인덱스를 빌드할 최대 테이블 수 (테이블별 전용 세션 사용)
+MAX_PARALLEL_TABLES = 4
+
+# PostgreSQL lock_not_available 에러 코드
+LOCK_NOT_AVAILABLE = '55P03'
+
+# (인덱스 이름, 테이블, 인덱스 정의)
+IndexDefinition = Tuple[str, str, str]
+
+
+def create_index_sql(index_name: str, table_name: str, definition: str) -> str:
+    return f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name} {definition}"
+
+
+def drop_index_sql(index_name: str) -> str:
+    return f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"
+
+
+def execute_with_retry(execute: Callable[[str], None], index_name: str, sql: str) -> None:
+    """lock_timeout 발생 시 지수 백오프로 재시도 (IF [NOT] EXISTS로 재실행해도 안전)"""
+    for attempt in range(MAX_LOCK_RETRIES):
+        try:
+            execute(sql)
+            return
+        except sa.exc.DBAPIError as e:
+            # 중단된 CONCURRENTLY 빌드는 오류 종류(잠금/statement_timeout 등)와 관계없이 INVALID 인덱스를 남기므로 정리
+            # 정리에 실패해도 다음 실행의 유효성 확인(_is_valid_index)에서 다시 처리되므로 원래 오류를 전달
+            if sql.startswith('CREATE'):
+                try:
+                    execute(drop_index_sql(index_name))
+                except sa.exc.DBAPIError:
+                    pass
+            if getattr(e.orig, 'pgcode', None) != LOCK_NOT_AVAILABLE or attempt == MAX_LOCK_RETRIES - 1:
+                raise
+            time.sleep(2**attempt)
+
+
+def _is_valid_index(connection, index_name: str) -> bool:
+    """인덱스가 존재하고 유효한지 확인 (중단된 CONCURRENTLY 빌드는 indisvalid = false로 남음)"""
+    return bool(
+        connection.execute(
+            sa.text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {'name': index_name}
+        ).scalar()
+    )
+
+
+def build_index_with_retry(connection, execute: Callable[[str], None], index_name: str, sql: str) -> None:
+    """CREATE INDEX CONCURRENTLY 실행 후 유효성 확인
+
+    IF NOT EXISTS는 이전 실행이 남긴 INVALID 인덱스도 건너뛰므로 유효하지 않으면 삭제 후 한 번 더 생성
+    """
+    execute_with_retry(execute, index_name, sql)
+    if _is_valid_index(connection, index_name):
+        return
+
+    execute_with_retry(execute, index_name, drop_index_sql(index_name))
+    execute_with_retry(execute, index_name, sql)
+    if not _is_valid_index(connection, index_name):
+        raise RuntimeError(f"인덱스 {index_name} 생성 후에도 유효하지 않은 상태입니다.")
+
+
+def _group_by_table(indexes: Iterable[IndexDefinition]) -> List[List[IndexDefinition]]:
+    """테이블별 인덱스 목록으로 묶음 (같은 테이블의 빌드는 서로 경합하므로 한 세션에서 순차 실행)"""
+    indexes_by_table = defaultdict(list)
+    for index_name, table_name, definition in indexes:
+        indexes_by_table[table_name].append((index_name, table_name, definition))
+    return list(indexes_by_table.values())
+
+
+def _run_per_table(
+    statements_by_table: List[List[Tuple[str, str]]], lock_timeout: str, session_settings: Sequence[str]
+) -> None:
+    """테이블별 (인덱스 이름, SQL) 목록을 각자의 autocommit 세션에서 병렬 실행하고 모두 끝날 때까지 대기
+
+    CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 autocommit 블록 사용 (SET LOCAL 대신 세션 단위 SET)
+    """
+    timeouts = [f"SET lock_timeout = '{lock_timeout}'", f"SET statement_timeout = '{STATEMENT_TIMEOUT}'"]
+
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            for sql in timeouts:
+                op.execute(sql)
+            for statements in statements_by_table:
+                for _index_name, sql in statements:
+                    op.execute(sql)
+            op.execute("RESET statement_timeout")
+            op.execute("RESET lock_timeout")
+            return
+
+        engine = op.get_bind().engine
+
+        def run(statements) -> None:
+            with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+                def execute(sql: str) -> None:
+                    connection.execute(sa.text(sql))
+
+                for sql in [*timeouts, *session_settings]:
+                    execute(sql)
+                for index_name, sql in statements:
+                    if sql.startswith('CREATE'):
+                        build_index_with_retry(connection, execute, index_name, sql)
+                    else:
+                        execute_with_retry(execute, index_name, sql)
+
+        # 서로 다른 테이블의 인덱스 빌드는 충돌하지 않으므로 테이블별 세션에서 병렬로 힙 스캔
+        max_workers = min(MAX_PARALLEL_TABLES, len(statements_by_table))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, statements) for statements in statements_by_table]
+            for future in futures:
+                future.result()
+
+
+def create_indexes_concurrently(
+    indexes: Iterable[IndexDefinition], lock_timeout: str = LOCK_TIMEOUT, session_settings: Sequence[str] = ()
+) -> None:
+    """인덱스를 CONCURRENTLY 생성하여 빌드 중에도 쓰기를 막지 않음 (이미 있으면 건너뜀)"""
+    statements_by_table = [
+        [(name, create_index_sql(name, table, definition)) for name, table, definition in group]
+        for group in _group_by_table(indexes)
+    ]
+    _run_per_table(statements_by_table, lock_timeout, session_settings)
+
+
+def drop_indexes_concurrently(indexes: Iterable[IndexDefinition], lock_timeout: str = LOCK_TIMEOUT) -> None:
+    """인덱스를 테이블별 생성 역순으로 CONCURRENTLY 삭제"""
+    statements_by_table = [
+        [(name, drop_index_sql(name)) for name, _table, _definition in reversed(group)] for group in _group_by_table(indexes)
+    ]
+    _run_per_table(statements_by_table, lock_timeout, ())
+
+
+def rebuild_index_concurrently(index_name: str, table_name: str, definition: str, unique: bool = False) -> None:
+    """임시 이름으로 새 정의의 인덱스를 CONCURRENTLY 생성한 뒤 기존 인덱스와 교체
+
+    CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 autocommit 블록 안에서 호출
+    각 단계는 lock_timeout 안에서 실행하고 잠금 대기로 실패하면 재시도하여 긴 트랜잭션 뒤에서 쓰기를 막지 않음
+    """
+    temp_name = f"{index_name}_new"
+    steps = [
+        (temp_name, drop_index_sql(temp_name)),
+        (temp_name, f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY {temp_name} ON {table_name} {definition}"),
+        (index_name, drop_index_sql(index_name)),
+        (index_name, f"ALTER INDEX {temp_name} RENAME TO {index_name}"),
+    ]
+
+    op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+    op.execute(f"SET statement_timeout = '{STATEMENT_TIMEOUT}'")
+    for name, sql in steps:
+        execute_with_retry(op.execute, name, sql)
+    op.execute("RESET statement_timeout")
+    op.execute("RESET lock_timeout")
@@ -337,7 +337,7 @@ def create_seed_admins(db: Session):
             "full_name": "시스템 관리자",
             "department": "IT팀",
             "phone": "02-1234-5678",
-            "login_count": "0",
+            "login_count": 0,
         },
         {
             "username": "operator1",
@@ -349,7 +349,7 @@ def create_seed_admins(db: Session):
             "full_name": "운영자1",
             "department": "고객서비스팀",
             "phone": "02-1234-5679",
-            "login_count": "0",
+            "login_count": 0,
         },
         {
             "username": "operator2",
@@ -361,7 +361,7 @@ def create_seed_admins(db: Session):
             "full_name": "운영자2",
             "department": "고객서비스팀",
             "phone": "02-1234-5680",
-            "login_count": "0",
+            "login_count": 0,
         },
     ]
 
@@ -1,9 +1,12 @@
+import logging
 import os
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.v1.api import api_router
 from app.core.background_tasks import lifespan
@@ -24,9 +27,14 @@ from app.core.security_middleware import (
 
 # 로깅 시스템 초기화
 setup_logging()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
-    title="MyZone Mobile Activation Service", description="핸드폰 개통 서비스 API", version="1.0.0", lifespan=lifespan
+    title="MyZone Mobile Activation Service",
+    description="핸드폰 개통 서비스 API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # 미들웨어 추가 (순서 중요 - 역순으로 실행됨)
@@ -76,6 +84,16 @@ upload_dir = os.path.join(os.getcwd(), settings.UPLOAD_DIR)
 os.makedirs(upload_dir, exist_ok=True)
 app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
 
+
+# DB 예외 공통 처리 (엔드포인트별 except Exception 래핑 대신 한 곳에서 500 응답으로 변환)
+# 오류 추적이 Redis에 동기 기록하므로 스레드풀에서 실행되도록 def로 선언
+@app.exception_handler(SQLAlchemyError)
+def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    logger.error(f"DB 처리 중 오류: {request.method} {request.url.path} - {exc}")
+    error_tracker.track_error(exc, endpoint=request.url.path, method=request.method)
+    return ORJSONResponse(status_code=500, content={"detail": "데이터베이스 처리 중 오류가 발생했습니다."})
+
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
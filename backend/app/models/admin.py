@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, Integer, String
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -25,7 +25,7 @@ class Admin(BaseModel):
 
     # 로그인 정보
     last_login = Column(DateTime, nullable=True, comment="마지막 로그인 시간")
-    login_count = Column(String(10), default="0", nullable=False, comment="로그인 횟수")
+    login_count = Column(Integer, default=0, nullable=False, comment="로그인 횟수")
 
     # 추가 정보
     full_name = Column(String(100), nullable=True, comment="실명")
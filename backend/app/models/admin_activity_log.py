@@ -38,21 +38,26 @@ class AdminActivityLog(BaseModel):
     def __repr__(self):
         return f"<AdminActivityLog(id={self.id}, admin_id={self.admin_id}, action='{self.action}')>"
 
+    @classmethod
+    def log_values(cls, admin_id: int, action: str, **kwargs) -> dict:
+        """활동 로그 컬럼 값 생성 (ORM 객체 없이 일괄 INSERT할 때 사용)"""
+        return {
+            "admin_id": admin_id,
+            "action": action,
+            "resource_type": kwargs.get("resource_type"),
+            "resource_id": kwargs.get("resource_id"),
+            "method": kwargs.get("method"),
+            "endpoint": kwargs.get("endpoint"),
+            "ip_address": kwargs.get("ip_address"),
+            "user_agent": kwargs.get("user_agent"),
+            "description": kwargs.get("description"),
+            "request_data": kwargs.get("request_data"),
+            "response_status": kwargs.get("response_status"),
+            "success": kwargs.get("success", "true"),
+            "error_message": kwargs.get("error_message"),
+        }
+
     @classmethod
     def create_log(cls, admin_id: int, action: str, **kwargs):
         """활동 로그 생성 헬퍼 메소드"""
-        return cls(
-            admin_id=admin_id,
-            action=action,
-            resource_type=kwargs.get("resource_type"),
-            resource_id=kwargs.get("resource_id"),
-            method=kwargs.get("method"),
-            endpoint=kwargs.get("endpoint"),
-            ip_address=kwargs.get("ip_address"),
-            user_agent=kwargs.get("user_agent"),
-            description=kwargs.get("description"),
-            request_data=kwargs.get("request_data"),
-            response_status=kwargs.get("response_status"),
-            success=kwargs.get("success", "true"),
-            error_message=kwargs.get("error_message"),
-        )
+        return cls(**cls.log_values(admin_id, action, **kwargs))
@@ -23,4 +23,4 @@ class BaseModel(Base, TimestampMixin):
 
     __abstract__ = True
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
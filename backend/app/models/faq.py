@@ -9,7 +9,7 @@ class FAQ(Base):
 
     __tablename__ = "faqs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     category = Column(String(50), nullable=False, index=True, comment="카테고리")
     question = Column(Text, nullable=False, comment="질문")
     answer = Column(Text, nullable=False, comment="답변")
@@ -27,7 +27,7 @@ class Inquiry(Base):
 
     __tablename__ = "inquiries"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False, comment="문의자 이름")
     email = Column(String(255), nullable=False, comment="이메일")
     phone = Column(String(20), comment="연락처")
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 
-from sqlalchemy import Boolean, Column, DateTime, Index, Numeric, String
+from sqlalchemy import Boolean, Column, DateTime, Enum, Index, Numeric, String
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -19,8 +19,13 @@ class Number(BaseModel):
     additional_fee = Column(Numeric(10, 2), default=0, nullable=False, comment="번호 추가 요금")
 
     # 상태 관리
+    # PostgreSQL에서는 number_status enum 타입 (alembic 032)
     status = Column(
-        String(20), default="available", nullable=False, index=True, comment="상태 (available, reserved, assigned)"
+        Enum("available", "reserved", "assigned", name="number_status"),
+        default="available",
+        nullable=False,
+        index=True,
+        comment="상태 (available, reserved, assigned)",
     )
 
     # 예약 정보
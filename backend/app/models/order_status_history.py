@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from .base import BaseModel
@@ -8,6 +8,10 @@ class OrderStatusHistory(BaseModel):
     """주문 상태 변경 이력 모델"""
 
     __tablename__ = "order_status_history"
+    # PostgreSQL에서는 created_at 기준 월별 RANGE 파티션 테이블 (alembic 016에서 전환,
+    # 향후 파티션은 백그라운드 태스크가 생성)
+    # 주문별 최신 상태는 orders.status에 함께 기록되므로 이력 테이블은 상세 조회 전용
+    # ((order_id, created_at) 인덱스: 관리자 주문 상세의 이력 최신순 조회)
 
     # 주문 관계
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True, comment="주문 ID")
@@ -21,7 +25,7 @@ class OrderStatusHistory(BaseModel):
     note = Column(Text, nullable=True, comment="상태 변경 메모")
 
     # 자동/수동 처리 구분
-    is_automatic = Column(String(10), default="false", nullable=False, comment="자동 처리 여부")
+    is_automatic = Column(Boolean, default=False, nullable=False, comment="자동 처리 여부")
 
     # 관계 설정
     order = relationship("Order", back_populates="status_history")
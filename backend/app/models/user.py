@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, String, Text
+from sqlalchemy import Boolean, Column, Date, Index, String, Text, text
 from sqlalchemy.orm import relationship
 
 from ..core.database_encryption import EncryptedString, EncryptedText
@@ -13,7 +13,7 @@ class User(BaseModel):
     # 기본 정보 (민감한 정보는 암호화)
     name = Column(EncryptedString(100), nullable=False, comment="사용자 이름 (암호화)")
     phone = Column(String(20), unique=True, nullable=False, index=True, comment="휴대폰 번호")
-    email = Column(String(255), unique=True, nullable=True, index=True, comment="이메일 주소")
+    email = Column(String(255), nullable=True, comment="이메일 주소")
     birth_date = Column(Date, nullable=False, comment="생년월일")
     gender = Column(String(10), nullable=False, comment="성별")
 
@@ -33,6 +33,12 @@ class User(BaseModel):
     # 관계 설정
     orders = relationship("Order", back_populates="user", cascade="all, delete-orphan")
 
+    # 인덱스 설정
+    __table_args__ = (
+        # 이메일은 선택 항목이므로 NULL이 아닌 행만 인덱싱하는 부분 고유 인덱스
+        Index("ix_users_email", "email", unique=True, postgresql_where=text("email IS NOT NULL")),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, phone='{self.phone}')>"
 
@@ -7,7 +7,7 @@ from app.models.base import Base
 class VerificationCode(Base):
     __tablename__ = "verification_codes"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     phone = Column(String(20), nullable=False, index=True)
     code = Column(String(10), nullable=False)
     purpose = Column(String(50), nullable=False)  # 'auth', 'password_reset' 등
@@ -70,7 +70,7 @@ class AdminResponse(BaseModel):
     phone: Optional[str]
     is_active: bool
     last_login: Optional[datetime]
-    login_count: str
+    login_count: int
     created_at: datetime
 
     class Config:
@@ -108,9 +108,10 @@ class AdminActivityLogListResponse(BaseModel):
     """관리자 활동 로그 목록 응답 스키마"""
 
     logs: List[AdminActivityLogResponse]
-    total: int
+    total: Optional[int]  # 커서 페이지에서는 None
     skip: int
     limit: int
+    next_cursor: Optional[int] = None
 
 
 class AdminDashboardResponse(BaseModel):
@@ -1,10 +1,13 @@
 import re
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, validator
 
+# numbers.status enum 값 (PostgreSQL number_status 타입) - 그 외 값은 DB 오류 대신 422로 거부
+NumberStatus = Literal["available", "reserved", "assigned"]
+
 
 class NumberBase(BaseModel):
     """전화번호 기본 스키마"""
@@ -65,7 +68,7 @@ class NumberFilter(BaseModel):
     """전화번호 필터링 스키마"""
 
     category: Optional[str] = Field(None, description="카테고리 필터")
-    status: Optional[str] = Field("available", description="상태 필터")
+    status: Optional[NumberStatus] = Field("available", description="상태 필터")
     is_premium: Optional[bool] = Field(None, description="프리미엄 번호 필터")
     pattern_type: Optional[str] = Field(None, description="패턴 유형 필터")
     search: Optional[str] = Field(None, description="번호 검색 (끝자리 또는 패턴)")
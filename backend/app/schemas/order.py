@@ -58,7 +58,7 @@ class OrderStatusHistoryResponse(BaseModel):
     status: str
     previous_status: Optional[str]
     note: Optional[str]
-    is_automatic: str
+    is_automatic: bool
     admin_id: Optional[int]
     created_at: datetime
 
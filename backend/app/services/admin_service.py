@@ -1,11 +1,16 @@
 import json
+import logging
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, Request, status
-from sqlalchemy import and_, desc, extract, func, or_
+from sqlalchemy import and_, desc, extract, func, insert, or_, select, tuple_
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import Session
 
+from ..core.permissions import get_role_permission_values
 from ..core.security import get_password_hash, verify_password
 from ..models.admin import Admin
 from ..models.admin_activity_log import AdminActivityLog
@@ -15,6 +20,96 @@ from ..models.order_status_history import OrderStatusHistory
 from ..models.plan import Plan
 from ..models.user import User
 from ..schemas.auth import AdminCreate, AdminUpdate
+from .cache_service import cache_service
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogBuffer:
+    """관리자 활동 로그 버퍼
+
+    조회 요청에서는 로그를 메모리에 적재만 하고 백그라운드 태스크가 주기적으로 모아서 한 번에 INSERT
+    """
+
+    # 백그라운드 태스크의 flush 주기 (초)
+    FLUSH_INTERVAL = 2.0
+    # BATCH_SIZE 도달 여부 확인 주기 (초) - 버퍼 길이만 확인하므로 DB 접근 없음
+    POLL_INTERVAL = 0.1
+    # 한 번에 INSERT할 최대 행 수
+    BATCH_SIZE = 500
+    # 적재 상한 - flush가 멈춘 경우 오래된 로그부터 버려 메모리 증가 방지
+    MAX_PENDING = 10000
+
+    def __init__(self):
+        self._pending = deque(maxlen=self.MAX_PENDING)
+        self._lock = threading.Lock()
+
+    def push(self, admin_id: int, action: str, **kwargs):
+        """로그 적재 (요청 시각을 created_at으로 기록)"""
+        values = AdminActivityLog.log_values(admin_id=admin_id, action=action, **kwargs)
+        now = datetime.utcnow()
+        values["created_at"] = now
+        values["updated_at"] = now
+        with self._lock:
+            self._pending.append(values)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = [self._pending.popleft() for _ in range(min(len(self._pending), self.BATCH_SIZE))]
+        return rows
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self, db: Session) -> int:
+        """적재된 로그를 다중 VALUES INSERT로 일괄 저장"""
+        flushed = 0
+        while True:
+            rows = self._drain()
+            if not rows:
+                return flushed
+
+            try:
+                db.execute(insert(AdminActivityLog), rows)
+                db.commit()
+                flushed += len(rows)
+            except (DataError, IntegrityError):
+                # 일부 행의 값 문제 - 한 건씩 저장하여 문제 행만 제외
+                db.rollback()
+                flushed += self._insert_each(db, rows)
+            except Exception as e:
+                # DB 장애 등 - 감사 로그를 버리지 않도록 버퍼 앞쪽에 되돌리고 다음 주기에 재시도
+                db.rollback()
+                self._requeue(rows)
+                logger.error(f"관리자 활동 로그 {len(rows)}건 저장 실패, 다음 주기에 재시도: {str(e)}")
+                return flushed
+
+    def _insert_each(self, db: Session, rows: List[Dict[str, Any]]) -> int:
+        inserted = 0
+        for row in rows:
+            try:
+                db.execute(insert(AdminActivityLog), [row])
+                db.commit()
+                inserted += 1
+            except Exception as e:
+                db.rollback()
+                logger.error(f"관리자 활동 로그 저장 실패 (action={row.get('action')}): {str(e)}")
+        return inserted
+
+    def _requeue(self, rows: List[Dict[str, Any]]):
+        """저장 실패한 로그를 원래 순서대로 버퍼 앞쪽에 되돌림 (MAX_PENDING 초과분은 오래된 로그부터 버림)"""
+        with self._lock:
+            free = self.MAX_PENDING - len(self._pending)
+            if free < len(rows):
+                logger.error(f"관리자 활동 로그 버퍼 초과로 {len(rows) - max(free, 0)}건 유실")
+                rows = rows[len(rows) - max(free, 0) :]
+            self._pending.extendleft(reversed(rows))
+
+
+activity_log_buffer = ActivityLogBuffer()
 
 
 class AdminService:
@@ -77,6 +172,7 @@ class AdminService:
 
         self.db.commit()
         self.db.refresh(admin)
+        cache_service.invalidate_admin_auth(admin.id)
 
         # 활동 로그 기록
         self.log_admin_activity(
@@ -98,6 +194,7 @@ class AdminService:
 
         admin.is_active = False
         self.db.commit()
+        cache_service.invalidate_admin_auth(admin.id)
 
         # 활동 로그 기록
         self.log_admin_activity(
@@ -158,45 +255,82 @@ class AdminService:
         self.db.add(activity_log)
         self.db.commit()
 
-    def get_admin_activity_logs(self, admin_id: int = None, skip: int = 0, limit: int = 100, days: int = 30) -> Dict[str, Any]:
-        """관리자 활동 로그 조회"""
-        query = self.db.query(AdminActivityLog)
+    def queue_admin_activity(self, admin_id: int, action: str, **kwargs):
+        """조회성 관리자 활동 로그 기록 - 응답을 기다리게 하지 않도록 버퍼에 적재 후 백그라운드에서 일괄 저장"""
+        activity_log_buffer.push(admin_id=admin_id, action=action, **kwargs)
 
-        if admin_id:
-            query = query.filter(AdminActivityLog.admin_id == admin_id)
+    def get_admin_activity_logs(
+        self, admin_id: int = None, skip: int = 0, limit: int = 100, days: int = 30, cursor: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """관리자 활동 로그 조회
+
+        로그마다 관리자 관계를 지연 로딩하지 않도록 관리자명을 조인으로 함께 조회하고, 전체 건수는 윈도우 함수로 계산
+        cursor(직전 페이지 마지막 로그 ID)가 주어지면 OFFSET 대신 (created_at, id) 키셋으로 다음 페이지를 조회하며,
+        이때 전체 건수는 첫 페이지에서만 계산하므로 None 반환
+        """
+        columns = (
+            AdminActivityLog.id,
+            AdminActivityLog.admin_id,
+            Admin.username.label("admin_username"),
+            AdminActivityLog.action,
+            AdminActivityLog.resource_type,
+            AdminActivityLog.resource_id,
+            AdminActivityLog.method,
+            AdminActivityLog.endpoint,
+            AdminActivityLog.ip_address,
+            AdminActivityLog.description,
+            AdminActivityLog.success,
+            AdminActivityLog.error_message,
+            AdminActivityLog.created_at,
+        )
+        keys = [column.key for column in columns]
 
         # 최근 N일 이내 로그만 조회
         since_date = datetime.utcnow() - timedelta(days=days)
-        query = query.filter(AdminActivityLog.created_at >= since_date)
-
-        query = query.order_by(desc(AdminActivityLog.created_at))
-
-        total = query.count()
-        logs = query.offset(skip).limit(limit).all()
-
-        return {
-            "logs": [
-                {
-                    "id": log.id,
-                    "admin_id": log.admin_id,
-                    "admin_username": log.admin.username if log.admin else None,
-                    "action": log.action,
-                    "resource_type": log.resource_type,
-                    "resource_id": log.resource_id,
-                    "method": log.method,
-                    "endpoint": log.endpoint,
-                    "ip_address": log.ip_address,
-                    "description": log.description,
-                    "success": log.success,
-                    "error_message": log.error_message,
-                    "created_at": log.created_at,
-                }
-                for log in logs
-            ],
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-        }
+        conditions = [AdminActivityLog.created_at >= since_date]
+        if admin_id:
+            conditions.append(AdminActivityLog.admin_id == admin_id)
+
+        # 정렬 (최신 로그 우선, 같은 시각은 ID로 구분)
+        order_by = (desc(AdminActivityLog.created_at), desc(AdminActivityLog.id))
+        result = {"logs": [], "total": None, "skip": skip, "limit": limit, "next_cursor": None}
+
+        if cursor is None:
+            rows = self.db.execute(
+                select(*columns, func.count().over().label("total"))
+                .outerjoin(Admin, Admin.id == AdminActivityLog.admin_id)
+                .where(*conditions)
+                .order_by(*order_by)
+                .offset(skip)
+                .limit(limit)
+            ).all()
+
+            # 범위를 벗어난 페이지는 행이 없어 전체 건수를 알 수 없으므로 그때만 COUNT 실행
+            if rows:
+                result["total"] = rows[0].total
+            else:
+                result["total"] = self.db.execute(select(func.count(AdminActivityLog.id)).where(*conditions)).scalar()
+        else:
+            # 키셋 페이지네이션 - 페이지 깊이와 무관하게 limit 건만 읽음
+            cursor_created_at = self.db.execute(select(AdminActivityLog.created_at).where(AdminActivityLog.id == cursor)).scalar()
+            if cursor_created_at is None:
+                return result
+            rows = self.db.execute(
+                select(*columns)
+                .outerjoin(Admin, Admin.id == AdminActivityLog.admin_id)
+                .where(
+                    *conditions,
+                    tuple_(AdminActivityLog.created_at, AdminActivityLog.id) < tuple_(cursor_created_at, cursor),
+                )
+                .order_by(*order_by)
+                .limit(limit)
+            ).all()
+
+        # keys가 응답 컬럼까지만 있으므로 zip에서 total 컬럼은 제외됨
+        result["logs"] = [dict(zip(keys, row)) for row in rows]
+        if len(rows) == limit:
+            result["next_cursor"] = rows[-1].id
+        return result
 
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """관리자 대시보드 통계"""
@@ -208,7 +342,10 @@ class AdminService:
         total_orders = self.db.query(Order).count()
 
         # 오늘의 통계
-        today_orders = self.db.query(Order).filter(func.date(Order.created_at) == today).count()
+        today_orders = self.db.query(Order).filter(
+            Order.created_at >= datetime.combine(today, datetime.min.time()),
+            Order.created_at < datetime.combine(today + timedelta(days=1), datetime.min.time()),
+        ).count()
 
         # 상태별 주문 수
         pending_orders = self.db.query(Order).filter(Order.status == "pending").count()
@@ -280,7 +417,4 @@ class AdminService:
 
     def get_admin_permissions(self, admin: Admin) -> List[str]:
         """관리자 권한 목록 조회"""
-        from ..core.permissions import RoleManager
-
-        permissions = RoleManager.get_admin_permissions(admin)
-        return [perm.value for perm in permissions]
+        return list(get_role_permission_values(admin.role))
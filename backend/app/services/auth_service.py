@@ -17,6 +17,7 @@ from ..schemas.auth import (
     SMSVerificationRequest,
     UserLogin,
 )
+from ..services.cache_service import cache_service
 from ..services.verification_service import verification_service
 
 
@@ -47,6 +48,7 @@ class AuthService:
         # 마지막 로그인 시간 업데이트
         admin.last_login = datetime.utcnow()
         self.db.commit()
+        cache_service.invalidate_admin_auth(admin.id)
 
         return admin
 
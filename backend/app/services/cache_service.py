@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional
 
+from ..core.query_optimizer import query_cache
 from ..core.redis_client import redis_client
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ class CacheService:
         "user": "user:",
         "order": "order:",
         "session": "session:",
+        "admin_auth": "auth:admin:",
         "stats": "stats:",
         "search": "search:",
         "temp": "temp:",
@@ -38,11 +40,18 @@ class CacheService:
         "user": 1800,  # 30분
         "order": 600,  # 10분
         "session": 86400,  # 24시간
+        "admin_auth": 300,  # 5분
         "stats": 300,  # 5분
         "search": 600,  # 10분
         "temp": 300,  # 5분
     }
 
+    # 자주 호출되는 단말기 조회용 TTL (초)
+    DEVICE_BRANDS_TTL = 300  # 5분
+    FEATURED_DEVICES_TTL = 60  # 1분 (재고 수량 노출)
+    # DB 장애 시 대신 응답할 마지막 정상 응답 보관 기간 (단말기 변경 시에도 삭제하지 않음)
+    DEVICE_STALE_TTL = 600  # 10분
+
     def __init__(self):
         self.client = redis_client
 
@@ -116,16 +125,50 @@ class CacheService:
         key = self._get_key("device", f"list:{brand or 'all'}")
         return self.client.get(key)
 
+    def cache_device_brands(self, brands_data: List[Dict[str, Any]], ttl: Optional[int] = None) -> bool:
+        """브랜드 목록 캐싱 (장애 대비용 사본 함께 저장)"""
+        self.client.set(self._get_key("device", "stale:brands"), brands_data, self.DEVICE_STALE_TTL)
+        key = self._get_key("device", "brands")
+        return self.client.set(key, brands_data, ttl or self.DEVICE_BRANDS_TTL)
+
+    def get_cached_device_brands(self) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 브랜드 목록 조회"""
+        key = self._get_key("device", "brands")
+        return self.client.get(key)
+
+    def get_stale_device_brands(self) -> Optional[List[Dict[str, Any]]]:
+        """마지막으로 정상 조회된 브랜드 목록 조회 (DB 장애 시 대체 응답용)"""
+        return self.client.get(self._get_key("device", "stale:brands"))
+
+    def cache_featured_devices(self, limit: int, devices_data: List[Dict[str, Any]], ttl: Optional[int] = None) -> bool:
+        """추천 단말기 목록 캐싱 (장애 대비용 사본 함께 저장)"""
+        self.client.set(self._get_key("device", f"stale:featured:{limit}"), devices_data, self.DEVICE_STALE_TTL)
+        key = self._get_key("device", f"featured:{limit}")
+        return self.client.set(key, devices_data, ttl or self.FEATURED_DEVICES_TTL)
+
+    def get_cached_featured_devices(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 추천 단말기 목록 조회"""
+        key = self._get_key("device", f"featured:{limit}")
+        return self.client.get(key)
+
+    def get_stale_featured_devices(self, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """마지막으로 정상 조회된 추천 단말기 목록 조회 (DB 장애 시 대체 응답용)"""
+        return self.client.get(self._get_key("device", f"stale:featured:{limit}"))
+
     def invalidate_device_cache(self, device_id: Optional[int] = None):
         """단말기 캐시 무효화"""
         if device_id:
             key = self._get_key("device", str(device_id))
             self.client.delete(key)
 
-        # 단말기 목록 캐시 삭제
+        # 단말기 목록/추천/브랜드 캐시 삭제
         list_keys = self.client.keys(self._get_key("device", "list:*"))
-        if list_keys:
-            self.client.delete(*list_keys)
+        list_keys += self.client.keys(self._get_key("device", "featured:*"))
+        list_keys.append(self._get_key("device", "brands"))
+        self.client.delete(*list_keys)
+
+        # 이 프로세스의 단말기 응답 캐시도 삭제 (다른 워커는 짧은 TTL 후 만료)
+        query_cache.delete_prefix(self._get_key("device", ""))
 
     # 번호 캐싱
     def cache_available_numbers(self, category: str, numbers_data: List[Dict[str, Any]], ttl: Optional[int] = None) -> bool:
@@ -182,6 +225,23 @@ class CacheService:
         key = self._get_key("session", str(user_id))
         self.client.delete(key)
 
+    # 관리자 인증 정보 캐싱
+    def cache_admin_auth(self, admin_id: int, admin_data: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """인증된 관리자 정보 캐싱"""
+        key = self._get_key("admin_auth", str(admin_id))
+        ttl = self._get_ttl("admin_auth", ttl)
+        return self.client.set(key, admin_data, ttl)
+
+    def get_cached_admin_auth(self, admin_id: int) -> Optional[Dict[str, Any]]:
+        """캐시된 관리자 인증 정보 조회"""
+        key = self._get_key("admin_auth", str(admin_id))
+        return self.client.get(key)
+
+    def invalidate_admin_auth(self, admin_id: int):
+        """관리자 인증 정보 캐시 무효화"""
+        key = self._get_key("admin_auth", str(admin_id))
+        self.client.delete(key)
+
     # 임시 데이터 캐싱 (번호 예약, 주문 임시 저장 등)
     def cache_temp_data(self, identifier: str, data: Any, ttl: Optional[int] = None) -> bool:
         """임시 데이터 캐싱"""
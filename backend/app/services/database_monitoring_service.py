@@ -278,6 +278,79 @@ class DatabaseMonitoringService:
 
         return recommendations
 
+    def ensure_history_partitions(self, months_ahead: int = 12) -> int:
+        """order_status_history의 향후 월별 파티션을 미리 생성 (생성된 파티션 수 반환)
+
+        기본 파티션에 해당 범위의 행이 이미 있으면 바로 파티션을 만들 수 없으므로
+        별도 테이블로 행을 옮긴 뒤 같은 트랜잭션에서 ATTACH 한다.
+        모든 워커가 이 작업을 실행하므로 트랜잭션 단위 advisory lock을 얻은 워커만 진행한다.
+        """
+        if self.db.bind.dialect.name != "postgresql":
+            return 0
+
+        self.db.execute(text("SET LOCAL lock_timeout = '5s'"))
+        acquired = self.db.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext('order_status_history_partitions'))")
+        ).scalar()
+        if not acquired:
+            self.db.rollback()
+            return 0
+
+        try:
+            created = self._create_history_partitions(months_ahead)
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # 커밋 시 advisory lock도 함께 해제
+        self.db.commit()
+        return created
+
+    def _create_history_partitions(self, months_ahead: int) -> int:
+        """현재 달부터 months_ahead개월 뒤까지 없는 월별 파티션 생성"""
+        created = 0
+        month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        for _ in range(months_ahead + 1):
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            partition_name = f"order_status_history_{month_start:%Y_%m}"
+            exists = self.db.execute(text("SELECT to_regclass(:name)"), {"name": partition_name}).scalar()
+            if exists is None:
+                bounds = f"FROM ('{month_start:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+                range_params = {"start": month_start, "end": next_month}
+                has_default_rows = self.db.execute(
+                    text(
+                        "SELECT EXISTS (SELECT 1 FROM order_status_history_default "
+                        "WHERE created_at >= :start AND created_at < :end)"
+                    ),
+                    range_params,
+                ).scalar()
+                if has_default_rows:
+                    self.db.execute(
+                        text(
+                            f"CREATE TABLE {partition_name} "
+                            "(LIKE order_status_history INCLUDING DEFAULTS INCLUDING COMMENTS)"
+                        )
+                    )
+                    self.db.execute(
+                        text(
+                            "WITH moved AS (DELETE FROM order_status_history_default "
+                            "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                            f"INSERT INTO {partition_name} SELECT * FROM moved"
+                        ),
+                        range_params,
+                    )
+                    self.db.execute(
+                        text(f"ALTER TABLE order_status_history ATTACH PARTITION {partition_name} FOR VALUES {bounds}")
+                    )
+                else:
+                    self.db.execute(
+                        text(f"CREATE TABLE {partition_name} PARTITION OF order_status_history FOR VALUES {bounds}")
+                    )
+                created += 1
+            month_start = next_month
+
+        return created
+
     def run_maintenance_task(self, task_type: str, table_name: str = None) -> Dict[str, Any]:
         """유지보수 작업 실행"""
         try:
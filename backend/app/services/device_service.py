@@ -2,10 +2,10 @@ import os
 import uuid
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from ..models.device import Device
@@ -16,13 +16,52 @@ from .cache_service import cache_service
 class DeviceService:
     """단말기 서비스"""
 
+    # 이미지 업로드 제한 및 스트리밍 복사 단위
+    MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
+    UPLOAD_CHUNK_SIZE = 64 * 1024  # 64KiB
+
     def __init__(self, db: Session):
         self.db = db
         self.cache = cache_service
 
+    @staticmethod
+    def _device_to_cache(device: Device) -> Dict[str, Any]:
+        """캐시 저장용 단말기 딕셔너리 변환"""
+        return {
+            "id": device.id,
+            "brand": device.brand,
+            "model": device.model,
+            "color": device.color,
+            # 금액은 소수점 자릿수가 유지되도록 문자열로 저장
+            "price": str(device.price),
+            "discount_price": str(device.discount_price) if device.discount_price else None,
+            "stock_quantity": device.stock_quantity,
+            "specifications": device.specifications,
+            "description": device.description,
+            "image_url": device.image_url,
+            "image_urls": device.image_urls,
+            "is_active": device.is_active,
+            "is_featured": device.is_featured,
+            "display_order": device.display_order,
+            "release_date": device.release_date,
+            "created_at": device.created_at.isoformat() if device.created_at else None,
+            "updated_at": device.updated_at.isoformat() if device.updated_at else None,
+        }
+
+    @staticmethod
+    def _device_from_cache(device_data: Dict[str, Any]) -> Device:
+        """캐시 딕셔너리로 단말기 객체 복원 (금액은 Decimal로 변환)"""
+        for field in ("price", "discount_price"):
+            if device_data.get(field) is not None:
+                device_data[field] = Decimal(str(device_data[field]))
+        return Device(**device_data)
+
     def get_devices(self, filters: DeviceFilter, page: int = 1, size: int = 20) -> tuple[List[Device], int]:
-        """단말기 목록 조회 (필터링 및 페이징 지원)"""
-        query = self.db.query(Device)
+        """단말기 목록 조회 (필터링 및 페이징 지원)
+
+        응답 스키마는 Device 컬럼만 사용하므로 관계 로딩 없이 한 번의 쿼리로 페이지와 전체 건수를 함께 조회
+        """
+        query = self.db.query(Device, func.count().over().label("total"))
 
         # 필터 적용
         conditions = []
@@ -54,25 +93,28 @@ class DeviceService:
         if conditions:
             query = query.filter(and_(*conditions))
 
-        # 전체 개수 조회
-        total = query.count()
-
         # 정렬 및 페이징 (추천 상품 우선, 브랜드별, 표시 순서별)
-        devices = (
+        rows = (
             query.order_by(Device.is_featured.desc(), Device.brand.asc(), Device.display_order.asc(), Device.id.asc())
             .offset((page - 1) * size)
             .limit(size)
             .all()
         )
 
-        return devices, total
+        # 범위를 벗어난 페이지는 행이 없어 전체 건수를 알 수 없으므로 그때만 COUNT 실행
+        if rows:
+            total = rows[0].total
+        else:
+            total = query.with_entities(func.count(Device.id)).order_by(None).scalar()
+
+        return [row.Device for row in rows], total
 
     def get_device_by_id(self, device_id: int) -> Device:
         """ID로 단말기 조회 (캐시 적용)"""
         # 캐시에서 조회
         cached_device = self.cache.get_cached_device(device_id)
         if cached_device:
-            return Device(**cached_device)
+            return self._device_from_cache(cached_device)
 
         # 캐시 미스 시 DB에서 조회
         device = self.db.query(Device).filter(Device.id == device_id).first()
@@ -80,26 +122,7 @@ class DeviceService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="단말기를 찾을 수 없습니다.")
 
         # 결과 캐싱
-        device_dict = {
-            "id": device.id,
-            "brand": device.brand,
-            "model": device.model,
-            "color": device.color,
-            "price": float(device.price),
-            "discount_price": float(device.discount_price) if device.discount_price else None,
-            "stock_quantity": device.stock_quantity,
-            "specifications": device.specifications,
-            "description": device.description,
-            "image_url": device.image_url,
-            "image_urls": device.image_urls,
-            "is_active": device.is_active,
-            "is_featured": device.is_featured,
-            "display_order": device.display_order,
-            "release_date": device.release_date,
-            "created_at": device.created_at.isoformat() if device.created_at else None,
-            "updated_at": device.updated_at.isoformat() if device.updated_at else None,
-        }
-        self.cache.cache_device(device_id, device_dict)
+        self.cache.cache_device(device_id, self._device_to_cache(device))
 
         return device
 
@@ -108,7 +131,7 @@ class DeviceService:
         # 캐시에서 조회
         cached_devices = self.cache.get_cached_devices_list(brand)
         if cached_devices:
-            return [Device(**device_data) for device_data in cached_devices]
+            return [self._device_from_cache(device_data) for device_data in cached_devices]
 
         # 캐시 미스 시 DB에서 조회
         devices = (
@@ -119,34 +142,15 @@ class DeviceService:
         )
 
         # 결과 캐싱
-        devices_data = []
-        for device in devices:
-            device_dict = {
-                "id": device.id,
-                "brand": device.brand,
-                "model": device.model,
-                "color": device.color,
-                "price": float(device.price),
-                "discount_price": float(device.discount_price) if device.discount_price else None,
-                "stock_quantity": device.stock_quantity,
-                "specifications": device.specifications,
-                "description": device.description,
-                "image_url": device.image_url,
-                "image_urls": device.image_urls,
-                "is_active": device.is_active,
-                "is_featured": device.is_featured,
-                "display_order": device.display_order,
-                "release_date": device.release_date,
-                "created_at": device.created_at.isoformat() if device.created_at else None,
-                "updated_at": device.updated_at.isoformat() if device.updated_at else None,
-            }
-            devices_data.append(device_dict)
-
-        self.cache.cache_devices_list(brand, devices_data)
+        self.cache.cache_devices_list(brand, [self._device_to_cache(device) for device in devices])
         return devices
 
     def get_available_brands(self) -> List[BrandInfo]:
-        """사용 가능한 브랜드 목록 조회"""
+        """사용 가능한 브랜드 목록 조회 (캐시 적용)"""
+        cached_brands = self.cache.get_cached_device_brands()
+        if cached_brands is not None:
+            return [BrandInfo(**brand_data) for brand_data in cached_brands]
+
         brands_data = (
             self.db.query(
                 Device.brand,
@@ -159,14 +163,20 @@ class DeviceService:
             .all()
         )
 
-        return [
+        brands = [
             BrandInfo(brand=brand, device_count=count, models=list(set(models)) if models else [])
             for brand, count, models in brands_data
         ]
+        self.cache.cache_device_brands([brand.model_dump() for brand in brands])
+        return brands
 
     def get_featured_devices(self, limit: int = 6) -> List[Device]:
-        """추천 단말기 조회"""
-        return (
+        """추천 단말기 조회 (캐시 적용)"""
+        cached_devices = self.cache.get_cached_featured_devices(limit)
+        if cached_devices is not None:
+            return [self._device_from_cache(device_data) for device_data in cached_devices]
+
+        devices = (
             self.db.query(Device)
             .filter(and_(Device.is_featured == True, Device.is_active == True))
             .order_by(Device.display_order.asc(), Device.id.asc())
@@ -174,6 +184,23 @@ class DeviceService:
             .all()
         )
 
+        self.cache.cache_featured_devices(limit, [self._device_to_cache(device) for device in devices])
+        return devices
+
+    def get_stale_brands(self) -> Optional[List[BrandInfo]]:
+        """DB 장애 시 대체 응답할 마지막 정상 브랜드 목록"""
+        cached_brands = self.cache.get_stale_device_brands()
+        if cached_brands is None:
+            return None
+        return [BrandInfo(**brand_data) for brand_data in cached_brands]
+
+    def get_stale_featured_devices(self, limit: int = 6) -> Optional[List[Device]]:
+        """DB 장애 시 대체 응답할 마지막 정상 추천 단말기 목록"""
+        cached_devices = self.cache.get_stale_featured_devices(limit)
+        if cached_devices is None:
+            return None
+        return [self._device_from_cache(device_data) for device_data in cached_devices]
+
     def get_devices_in_stock(self) -> List[Device]:
         """재고 있는 단말기 조회"""
         return (
@@ -188,6 +215,13 @@ class DeviceService:
         device = self.get_device_by_id(device_id)
         return device.stock_quantity >= quantity
 
+    def get_stock_snapshot(self, device_id: int) -> Tuple[int, bool]:
+        """재고 수량과 판매 활성화 상태를 한 번의 조회로 반환 (재고 확인 API용)"""
+        snapshot = self.db.execute(select(Device.stock_quantity, Device.is_active).where(Device.id == device_id)).first()
+        if not snapshot:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="단말기를 찾을 수 없습니다.")
+        return snapshot.stock_quantity, snapshot.is_active
+
     def update_stock(self, device_id: int, quantity: int) -> Device:
         """재고 수량 업데이트"""
         device = self.get_device_by_id(device_id)
@@ -243,6 +277,9 @@ class DeviceService:
         device = self.get_device_by_id(device_id)
         device.is_active = False
         self.db.commit()
+
+        # 캐시 무효화 (브랜드/추천 목록에서 제외)
+        self.cache.invalidate_device_cache(device_id)
         return True
 
     def upload_device_image(self, device_id: int, file: UploadFile, is_main: bool = False) -> str:
@@ -261,10 +298,20 @@ class DeviceService:
         upload_dir.mkdir(parents=True, exist_ok=True)
         file_path = upload_dir / filename
 
-        # 파일 저장
+        # 파일 저장 - 전체를 메모리에 올리지 않고 청크 단위로 복사하며 크기 제한 확인 (file.size는 없을 수 있음)
+        written = 0
         with open(file_path, "wb") as buffer:
-            content = file.file.read()
-            buffer.write(content)
+            while chunk := file.file.read(self.UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > self.MAX_IMAGE_SIZE:
+                    break
+                buffer.write(chunk)
+
+        if written > self.MAX_IMAGE_SIZE:
+            file_path.unlink(missing_ok=True)
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="파일 크기는 5MB를 초과할 수 없습니다."
+            )
 
         # URL 생성
         image_url = f"/uploads/devices/{filename}"
@@ -280,6 +327,9 @@ class DeviceService:
         self.db.commit()
         self.db.refresh(device)
 
+        # 캐시 무효화
+        self.cache.invalidate_device_cache(device_id)
+
         return image_url
 
     def remove_device_image(self, device_id: int, image_url: str) -> bool:
@@ -302,6 +352,9 @@ class DeviceService:
             pass  # 파일 삭제 실패는 무시
 
         self.db.commit()
+
+        # 캐시 무효화
+        self.cache.invalidate_device_cache(device_id)
         return True
 
     async def update_device_images(self, device_id: int, image_urls: dict) -> Device:
@@ -2,6 +2,7 @@
 파일 보안 및 검증 서비스
 """
 
+import asyncio
 import hashlib
 import logging
 import mimetypes
@@ -385,6 +386,11 @@ class FileSecurityService:
 
     async def cleanup_quarantine_files(self, days_old: int = 30) -> int:
         """오래된 격리 파일 정리"""
+        # 백그라운드 작업으로 이벤트 루프에서 실행되므로 파일 순회/삭제는 스레드에서 수행
+        return await asyncio.to_thread(self._cleanup_quarantine_files_sync, days_old)
+
+    def _cleanup_quarantine_files_sync(self, days_old: int) -> int:
+        """오래된 격리 파일 정리 (동기)"""
         cleaned_count = 0
 
         try:
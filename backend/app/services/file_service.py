@@ -2,6 +2,7 @@
 파일 업로드 및 이미지 최적화 서비스
 """
 
+import asyncio
 import hashlib
 import os
 import time
@@ -11,6 +12,9 @@ from typing import List, Optional, Tuple
 
 import boto3
 import magic
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, UploadFile
 from PIL import Image, ImageOps
@@ -33,6 +37,14 @@ class FileService:
     # 이미지 크기 설정
     IMAGE_SIZES = {"thumbnail": (150, 150), "small": (300, 300), "medium": (600, 600), "large": (1200, 1200)}
 
+    # S3 커넥션 풀 크기 (다중 업로드 시 파일 수 x 변형 수만큼 동시 요청이 발생하므로 기본값 10보다 크게 설정)
+    S3_MAX_POOL_CONNECTIONS = 32
+
+    # 8MB 이상 파일은 멀티파트로 나누어 여러 커넥션으로 동시 전송
+    S3_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=8, use_threads=True
+    )
+
     def __init__(self):
         self.s3_client = None
         if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
@@ -41,6 +53,7 @@ class FileService:
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
                 region_name=settings.AWS_REGION,
+                config=BotoConfig(max_pool_connections=self.S3_MAX_POOL_CONNECTIONS, tcp_keepalive=True),
             )
 
     async def validate_file(self, file: UploadFile) -> bool:
@@ -130,14 +143,22 @@ class FileService:
         if not self.s3_client:
             raise HTTPException(status_code=500, detail="S3 설정이 올바르지 않습니다.")
 
+        # boto3 호출은 블로킹이므로 스레드에서 실행하여 여러 업로드가 동시에 진행되도록 함
+        return await asyncio.to_thread(self._upload_to_s3_sync, file_data, filename, content_type)
+
+    def _upload_to_s3_sync(self, file_data: bytes, filename: str, content_type: str) -> str:
+        """S3 업로드 (동기)"""
         try:
-            self.s3_client.put_object(
-                Bucket=settings.S3_BUCKET_NAME,
-                Key=filename,
-                Body=file_data,
-                ContentType=content_type,
-                CacheControl="max-age=31536000",  # 1년 캐시
-                Metadata={"uploaded_at": str(int(time.time())), "file_hash": hashlib.md5(file_data).hexdigest()},
+            self.s3_client.upload_fileobj(
+                BytesIO(file_data),
+                settings.S3_BUCKET_NAME,
+                filename,
+                ExtraArgs={
+                    "ContentType": content_type,
+                    "CacheControl": "max-age=31536000",  # 1년 캐시
+                    "Metadata": {"uploaded_at": str(int(time.time())), "file_hash": hashlib.md5(file_data).hexdigest()},
+                },
+                Config=self.S3_TRANSFER_CONFIG,
             )
 
             # CDN URL 반환
@@ -146,11 +167,15 @@ class FileService:
             else:
                 return f"https://{settings.S3_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{filename}"
 
-        except ClientError as e:
+        except (ClientError, S3UploadFailedError) as e:
             raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
 
     async def save_local_file(self, file_data: bytes, filename: str) -> str:
         """로컬 파일 시스템에 저장"""
+        return await asyncio.to_thread(self._save_local_file_sync, file_data, filename)
+
+    def _save_local_file_sync(self, file_data: bytes, filename: str) -> str:
+        """로컬 파일 저장 (동기)"""
         upload_dir = os.path.join(settings.UPLOAD_DIR, "images")
         os.makedirs(upload_dir, exist_ok=True)
 
@@ -194,6 +219,10 @@ class FileService:
 
     async def delete_file(self, filename: str) -> bool:
         """파일 삭제"""
+        return await asyncio.to_thread(self._delete_file_sync, filename)
+
+    def _delete_file_sync(self, filename: str) -> bool:
+        """파일 삭제 (동기)"""
         try:
             if self.s3_client:
                 # S3에서 삭제
@@ -216,6 +245,10 @@ class FileService:
 
     async def cleanup_temp_files(self) -> int:
         """임시 파일 정리"""
+        return await asyncio.to_thread(self._cleanup_temp_files_sync)
+
+    def _cleanup_temp_files_sync(self) -> int:
+        """임시 파일 정리 (동기)"""
         cleaned_count = 0
         temp_dir = os.path.join(settings.UPLOAD_DIR, "temp")
 
@@ -1,10 +1,11 @@
-from datetime import date, datetime
+import logging
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Float, Integer, String, and_, cast, desc, func, insert, literal, or_, select, tuple_, update
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 
 from ..models.device import Device
 from ..models.number import Number
@@ -16,6 +17,8 @@ from ..models.user import User
 from ..schemas.order import OrderCreate, OrderDashboard, OrderFilter, OrderStatusStats, OrderStatusUpdate, OrderUpdate
 from ..services.notification_service import notification_service
 
+logger = logging.getLogger(__name__)
+
 
 class OrderService:
     """주문 서비스"""
@@ -47,17 +50,39 @@ class OrderService:
         """주문 목록 조회 (필터링 및 페이징 지원)"""
         query = self.db.query(Order)
 
+        # 필터 적용 (결제/사용자 조건은 해당 테이블 JOIN 필요)
+        if filters.is_paid is not None:
+            query = query.outerjoin(Payment)
+
+        if filters.search:
+            query = query.join(User)
+
+        conditions = self._order_filter_conditions(filters)
+        if conditions:
+            query = query.filter(and_(*conditions))
+
+        # 전체 개수 조회
+        total = query.count()
+
         if include_relations:
+            # 목록은 LIMIT이 걸리므로 JOIN 대신 관계별 IN 쿼리 1회로 일괄 로딩 (주문 수와 무관하게 쿼리 수 고정)
             query = query.options(
-                joinedload(Order.user),
-                joinedload(Order.plan),
-                joinedload(Order.device),
-                joinedload(Order.number),
-                joinedload(Order.payment),
-                joinedload(Order.status_history),
+                selectinload(Order.user),
+                selectinload(Order.plan),
+                selectinload(Order.device),
+                selectinload(Order.number),
+                selectinload(Order.payment),
+                selectinload(Order.status_history),
             )
 
-        # 필터 적용
+        # 정렬 및 페이징 (최신 주문 우선)
+        orders = query.order_by(desc(Order.created_at)).offset((page - 1) * size).limit(size).all()
+
+        return orders, total
+
+    @staticmethod
+    def _order_filter_conditions(filters: OrderFilter) -> list:
+        """주문 목록 필터 조건 (is_paid는 Payment, search는 User가 JOIN되어 있어야 함)"""
         conditions = []
 
         if filters.status:
@@ -74,9 +99,9 @@ class OrderService:
 
         if filters.is_paid is not None:
             if filters.is_paid:
-                query = query.join(Payment).filter(Payment.status == "completed")
+                conditions.append(Payment.status == "completed")
             else:
-                query = query.outerjoin(Payment).filter(or_(Payment.id.is_(None), Payment.status != "completed"))
+                conditions.append(or_(Payment.id.is_(None), Payment.status != "completed"))
 
         if filters.date_from:
             conditions.append(Order.created_at >= filters.date_from)
@@ -86,33 +111,90 @@ class OrderService:
 
         if filters.search:
             search_term = f"%{filters.search}%"
-            query = query.join(User)
             conditions.append(or_(Order.order_number.ilike(search_term), User.name.ilike(search_term)))
 
+        return conditions
+
+    def get_order_rows(
+        self, filters: OrderFilter, page: int = 1, size: int = 20, cursor: Optional[int] = None
+    ) -> tuple[List[Dict[str, Any]], Optional[int]]:
+        """관리자 주문 목록 조회 (ORM 객체 대신 필요한 컬럼만 JOIN으로 조회해 행 단위 dict로 반환)
+
+        cursor(직전 페이지 마지막 주문 ID)가 주어지면 OFFSET 대신 (created_at, id) 키셋으로 다음 페이지를 조회하며,
+        이때 전체 건수는 첫 페이지에서만 계산하므로 None 반환
+        """
+        stmt = (
+            select(
+                Order.id,
+                Order.order_number,
+                Order.user_id,
+                User.name.label("user_name"),
+                User.phone.label("user_phone"),
+                Plan.name.label("plan_name"),
+                (Device.brand + " " + Device.model).label("device_name"),
+                Number.number.label("number"),
+                Order.status,
+                cast(Order.total_amount, Float).label("total_amount"),
+                func.coalesce(Payment.status == "completed", False).label("is_paid"),
+                Payment.status.label("payment_status"),
+                Order.created_at,
+                Order.updated_at,
+            )
+            .select_from(Order)
+            .outerjoin(User, Order.user_id == User.id)
+            .outerjoin(Plan, Order.plan_id == Plan.id)
+            .outerjoin(Device, Order.device_id == Device.id)
+            .outerjoin(Number, Order.number_id == Number.id)
+            .outerjoin(Payment, Payment.order_id == Order.id)
+        )
+
+        conditions = self._order_filter_conditions(filters)
         if conditions:
-            query = query.filter(and_(*conditions))
+            stmt = stmt.where(and_(*conditions))
+
+        # 정렬 (최신 주문 우선, 같은 시각은 ID로 구분)
+        order_by = (desc(Order.created_at), desc(Order.id))
+
+        if cursor is None:
+            total = self.db.execute(select(func.count()).select_from(stmt.subquery())).scalar()
+            stmt = stmt.order_by(*order_by).offset((page - 1) * size).limit(size)
+        else:
+            total = None
+            cursor_created_at = self.db.execute(select(Order.created_at).where(Order.id == cursor)).scalar()
+            if cursor_created_at is None:
+                return [], total
+            stmt = (
+                stmt.where(tuple_(Order.created_at, Order.id) < tuple_(cursor_created_at, cursor))
+                .order_by(*order_by)
+                .limit(size)
+            )
 
-        # 전체 개수 조회
-        total = query.count()
+        rows = [dict(row) for row in self.db.execute(stmt).mappings()]
 
-        # 정렬 및 페이징 (최신 주문 우선)
-        orders = query.order_by(desc(Order.created_at)).offset((page - 1) * size).limit(size).all()
+        return rows, total
 
-        return orders, total
+    @staticmethod
+    def _detail_load_options():
+        """주문 상세 조회용 로딩 옵션
+
+        단건 관계는 JOIN으로 함께 가져오고, 상태 이력은 JOIN 시 행이 곱해지므로 별도 IN 쿼리로 로딩하면서
+        이력별 처리 관리자까지 함께 가져와 이력 수와 무관하게 쿼리 2회로 처리
+        """
+        return (
+            joinedload(Order.user),
+            joinedload(Order.plan),
+            joinedload(Order.device),
+            joinedload(Order.number),
+            joinedload(Order.payment),
+            selectinload(Order.status_history).joinedload(OrderStatusHistory.admin),
+        )
 
     def get_order_by_id(self, order_id: int, include_relations: bool = True) -> Order:
         """ID로 주문 조회"""
         query = self.db.query(Order)
 
         if include_relations:
-            query = query.options(
-                joinedload(Order.user),
-                joinedload(Order.plan),
-                joinedload(Order.device),
-                joinedload(Order.number),
-                joinedload(Order.payment),
-                joinedload(Order.status_history),
-            )
+            query = query.options(*self._detail_load_options())
 
         order = query.filter(Order.id == order_id).first()
         if not order:
@@ -124,14 +206,7 @@ class OrderService:
         query = self.db.query(Order)
 
         if include_relations:
-            query = query.options(
-                joinedload(Order.user),
-                joinedload(Order.plan),
-                joinedload(Order.device),
-                joinedload(Order.number),
-                joinedload(Order.payment),
-                joinedload(Order.status_history),
-            )
+            query = query.options(*self._detail_load_options())
 
         order = query.filter(Order.order_number == order_number).first()
         if not order:
@@ -249,65 +324,134 @@ class OrderService:
     async def update_order_status(
         self, order_id: int, status_update: OrderStatusUpdate, admin_id: Optional[int] = None
     ) -> Order:
-        """주문 상태 변경"""
-        order = self.get_order_by_id(order_id, include_relations=False)
+        """주문 상태 변경 후 알림 발송"""
+        order = self.apply_status_update(order_id, status_update, admin_id)
+        await self.notify_status_update(order, status_update)
+        return order
 
+    def apply_status_update(
+        self, order_id: int, status_update: OrderStatusUpdate, admin_id: Optional[int] = None
+    ) -> Order:
+        """주문 상태 변경 (DB 처리만 수행하며 알림은 notify_status_update로 별도 발송)"""
         new_status = status_update.status
-        current_status = order.status
 
-        # 상태 전환 가능성 확인
-        if new_status not in self.STATUS_TRANSITIONS.get(current_status, []):
+        changed = self._transition_status(order_id, new_status, status_update.note, admin_id)
+        if changed is None:
+            # 실패 원인(주문 없음 / 전환 불가) 판별을 위한 조회는 오류 경로에서만 수행
+            order = self.get_order_by_id(order_id, include_relations=False)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"'{current_status}'에서 '{new_status}'로 상태를 변경할 수 없습니다.",
+                detail=f"'{order.status}'에서 '{new_status}'로 상태를 변경할 수 없습니다.",
             )
 
-        # 상태 변경
-        order.status = new_status
+        order_number, number_id = changed
 
-        # 상태 이력 추가
-        self._add_status_history(
-            order_id, new_status, current_status, status_update.note, admin_id=admin_id, is_automatic=False
-        )
-
-        # 상태별 추가 처리
-        if new_status == "completed":
+        # 상태별 추가 처리 (번호 조회 없이 UPDATE 한 번으로 처리)
+        if number_id and new_status == "completed":
             # 번호 할당
-            if order.number_id:
-                number = self.db.query(Number).filter(Number.id == order.number_id).first()
-                if number:
-                    number.assign()
-        elif new_status == "cancelled":
+            self.db.execute(
+                update(Number)
+                .where(Number.id == number_id)
+                .values(status="assigned", reserved_until=None, reserved_by_order_id=None)
+            )
+        elif number_id and new_status == "cancelled":
             # 번호 예약 해제
-            if order.number_id:
-                number = self.db.query(Number).filter(Number.id == order.number_id).first()
-                if number and number.reserved_by_order_id == order.order_number:
-                    number.release()
+            self.db.execute(
+                update(Number)
+                .where(Number.id == number_id, Number.reserved_by_order_id == order_number)
+                .values(status="available", reserved_until=None, reserved_by_order_id=None)
+            )
 
         self.db.commit()
-        self.db.refresh(order)
+        # PostgreSQL 경로의 Core UPDATE는 세션의 Order 객체를 갱신하지 않고 expire_on_commit도 꺼져 있으므로
+        # 이미 세션에 있는 객체(취소 가능 여부 확인 등)를 DB 값으로 덮어써서 재조회
+        order = self.db.query(Order).populate_existing().filter(Order.id == order_id).first()
+        if not order:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="주문을 찾을 수 없습니다.")
+        return order
+
+    async def notify_status_update(
+        self, order: Order, status_update: OrderStatusUpdate, user: Optional[User] = None
+    ) -> None:
+        """상태 변경 알림 발송 (SMS + 이메일)
 
-        # 상태 변경 알림 발송 (SMS + 이메일)
+        user를 넘기면 알림 발송 중 DB 조회를 하지 않음
+        """
         try:
             await notification_service.send_order_status_update_notifications(
-                db=self.db, order=order, new_status=new_status, note=status_update.note
+                db=self.db, order=order, new_status=status_update.status, note=status_update.note, user=user
             )
         except Exception as e:
             # 알림 발송 실패는 상태 변경에 영향을 주지 않음
             logger.error(f"주문 상태 변경 알림 발송 실패: {e}")
 
-        return order
+    def _transition_status(
+        self, order_id: int, new_status: str, note: Optional[str], admin_id: Optional[int]
+    ) -> Optional[tuple[str, Optional[int]]]:
+        """상태 전환과 이력 추가를 수행하고 (주문번호, 번호 ID) 반환 (주문이 없거나 전환 불가 시 None)
+
+        PostgreSQL에서는 현재 상태 확인, orders UPDATE, 이력 INSERT를 데이터 변경 CTE 한 문장으로 처리
+        """
+        # new_status로 전환 가능한 이전 상태 목록
+        allowed_from = [current for current, targets in self.STATUS_TRANSITIONS.items() if new_status in targets]
+        if not allowed_from:
+            return None
+
+        if self.db.bind.dialect.name != "postgresql":
+            order = self.db.query(Order).filter(Order.id == order_id).first()
+            if not order or order.status not in allowed_from:
+                return None
+
+            current_status = order.status
+            order.status = new_status
+            self._add_status_history(order_id, new_status, current_status, note, admin_id=admin_id, is_automatic=False)
+            return order.order_number, order.number_id
+
+        now = datetime.utcnow()
+
+        # 변경 전 상태는 UPDATE의 RETURNING으로 얻을 수 없으므로 행을 잠근 서브쿼리에서 읽음
+        previous = aliased(Order)
+        locked = select(previous.id, previous.status).where(previous.id == order_id).with_for_update().subquery("previous")
+        updated = (
+            update(Order)
+            .where(Order.id == locked.c.id, locked.c.status.in_(allowed_from))
+            .values(status=new_status, updated_at=now)
+            .returning(Order.id, Order.order_number, Order.number_id, locked.c.status.label("previous_status"))
+            .cte("updated")
+        )
+        history = (
+            insert(OrderStatusHistory)
+            .from_select(
+                ["order_id", "status", "previous_status", "note", "admin_id", "is_automatic", "created_at", "updated_at"],
+                select(
+                    updated.c.id,
+                    literal(new_status),
+                    updated.c.previous_status,
+                    literal(note, String),
+                    literal(admin_id, Integer),
+                    literal(False),
+                    literal(now),
+                    literal(now),
+                ),
+            )
+            .cte("history")
+        )
+
+        row = self.db.execute(select(updated.c.order_number, updated.c.number_id).add_cte(history)).first()
+        return (row.order_number, row.number_id) if row else None
 
     async def cancel_order(self, order_id: int, reason: Optional[str] = None, admin_id: Optional[int] = None) -> Order:
         """주문 취소"""
+        return await self.update_order_status(order_id, self.build_cancel_update(order_id, reason), admin_id)
+
+    def build_cancel_update(self, order_id: int, reason: Optional[str] = None) -> OrderStatusUpdate:
+        """취소 가능 여부를 확인하고 취소용 상태 변경 데이터 생성"""
         order = self.get_order_by_id(order_id, include_relations=False)
 
         if not order.can_cancel:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="취소할 수 없는 주문입니다.")
 
-        status_update = OrderStatusUpdate(status="cancelled", note=reason or "주문이 취소되었습니다.")
-
-        return await self.update_order_status(order_id, status_update, admin_id)
+        return OrderStatusUpdate(status="cancelled", note=reason or "주문이 취소되었습니다.")
 
     def get_user_orders(self, user_id: int, page: int = 1, size: int = 20) -> tuple[List[Order], int]:
         """사용자별 주문 목록 조회"""
@@ -328,7 +472,10 @@ class OrderService:
         cancelled_orders = self.db.query(Order).filter(Order.status == "cancelled").count()
 
         # 오늘 주문 수
-        today_orders = self.db.query(Order).filter(func.date(Order.created_at) == today).count()
+        today_orders = self.db.query(Order).filter(
+            Order.created_at >= datetime.combine(today, datetime.min.time()),
+            Order.created_at < datetime.combine(today + timedelta(days=1), datetime.min.time()),
+        ).count()
 
         # 총 매출 (완료된 주문)
         total_revenue = self.db.query(func.sum(Order.total_amount)).filter(Order.status == "completed").scalar() or Decimal(
@@ -373,7 +520,7 @@ class OrderService:
             previous_status=previous_status,
             note=note,
             admin_id=admin_id,
-            is_automatic="true" if is_automatic else "false",
+            is_automatic=is_automatic,
         )
         self.db.add(history)
         self.db.flush()
@@ -1,9 +1,9 @@
 import calendar
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import and_, case, desc, extract, func, or_
+from sqlalchemy import and_, case, desc, extract, func, or_, select
 from sqlalchemy.orm import Session
 
 from ..models.device import Device
@@ -13,6 +13,20 @@ from ..models.payment import Payment
 from ..models.plan import Plan
 from ..models.user import User
 
+# 리포트 기간별 조회 일수
+REPORT_PERIOD_DAYS = {"week": 7, "month": 30, "quarter": 90, "year": 365}
+
+# 주문 리포트 내보내기 컬럼 (iter_order_report_rows 순서와 일치)
+ORDER_REPORT_COLUMNS = ["주문번호", "주문상태", "요금제", "요금제 비용", "단말기 비용", "총 금액", "결제상태", "결제일시", "주문일시"]
+
+
+def _created_between(start: date, end: date):
+    """created_at이 [start, end] 날짜 구간에 속하는 조건 (인덱스를 탈 수 있는 범위 조건)"""
+    return and_(
+        Order.created_at >= datetime.combine(start, datetime.min.time()),
+        Order.created_at < datetime.combine(end + timedelta(days=1), datetime.min.time()),
+    )
+
 
 class StatisticsService:
     """통계 서비스"""
@@ -36,17 +50,17 @@ class StatisticsService:
         )
 
         # 오늘 통계
-        today_orders = self.db.query(Order).filter(func.date(Order.created_at) == today).count()
+        today_orders = self.db.query(Order).filter(_created_between(today, today)).count()
 
         today_revenue = self.db.query(func.sum(Order.total_amount)).filter(
-            and_(func.date(Order.created_at) == today, Order.status == "completed")
+            and_(_created_between(today, today), Order.status == "completed")
         ).scalar() or Decimal("0")
 
         # 어제 통계 (비교용)
-        yesterday_orders = self.db.query(Order).filter(func.date(Order.created_at) == yesterday).count()
+        yesterday_orders = self.db.query(Order).filter(_created_between(yesterday, yesterday)).count()
 
         yesterday_revenue = self.db.query(func.sum(Order.total_amount)).filter(
-            and_(func.date(Order.created_at) == yesterday, Order.status == "completed")
+            and_(_created_between(yesterday, yesterday), Order.status == "completed")
         ).scalar() or Decimal("0")
 
         # 이번 달 통계
@@ -57,12 +71,10 @@ class StatisticsService:
         ).scalar() or Decimal("0")
 
         # 지난 달 통계 (비교용)
-        last_month_orders = (
-            self.db.query(Order).filter(and_(Order.created_at >= last_month_start, Order.created_at <= last_month_end)).count()
-        )
+        last_month_orders = self.db.query(Order).filter(_created_between(last_month_start, last_month_end)).count()
 
         last_month_revenue = self.db.query(func.sum(Order.total_amount)).filter(
-            and_(Order.created_at >= last_month_start, Order.created_at <= last_month_end, Order.status == "completed")
+            and_(_created_between(last_month_start, last_month_end), Order.status == "completed")
         ).scalar() or Decimal("0")
 
         # 성장률 계산
@@ -106,6 +118,7 @@ class StatisticsService:
                     "avg_processing_time"
                 )
             )
+            .select_from(Order)
             .join(OrderStatusHistory, Order.id == OrderStatusHistory.order_id)
             .filter(and_(Order.status == "completed", OrderStatusHistory.status == "completed"))
             .scalar()
@@ -131,7 +144,7 @@ class StatisticsService:
                 func.count(Order.id).label("orders"),
                 func.sum(case((Order.status == "completed", Order.total_amount), else_=0)).label("revenue"),
             )
-            .filter(and_(func.date(Order.created_at) >= start_date, func.date(Order.created_at) <= end_date))
+            .filter(_created_between(start_date, end_date))
             .group_by(func.date(Order.created_at))
             .order_by(func.date(Order.created_at))
             .all()
@@ -176,18 +189,10 @@ class StatisticsService:
                 month_end = next_month - timedelta(days=next_month.day)
 
             # 해당 월의 통계
-            month_orders = (
-                self.db.query(Order)
-                .filter(and_(func.date(Order.created_at) >= month_start, func.date(Order.created_at) <= month_end))
-                .count()
-            )
+            month_orders = self.db.query(Order).filter(_created_between(month_start, month_end)).count()
 
             month_revenue = self.db.query(func.sum(Order.total_amount)).filter(
-                and_(
-                    func.date(Order.created_at) >= month_start,
-                    func.date(Order.created_at) <= month_end,
-                    Order.status == "completed",
-                )
+                and_(_created_between(month_start, month_end), Order.status == "completed")
             ).scalar() or Decimal("0")
 
             monthly_data.insert(
@@ -379,6 +384,32 @@ class StatisticsService:
             },
         }
 
+    def iter_order_report_rows(self, period: str = "month", batch_size: int = 1000) -> Iterator[tuple]:
+        """리포트 기간의 주문 행을 서버 사이드 커서로 순회 (CSV/Excel 내보내기용)"""
+        start = date.today() - timedelta(days=REPORT_PERIOD_DAYS.get(period, 30) - 1)
+        stmt = (
+            select(
+                Order.order_number,
+                Order.status,
+                Plan.name,
+                Order.plan_fee,
+                Order.device_fee,
+                Order.total_amount,
+                Payment.status,
+                Payment.paid_at,
+                Order.created_at,
+            )
+            .join(Plan, Order.plan_id == Plan.id)
+            .outerjoin(Payment, Payment.order_id == Order.id)
+            .where(Order.created_at >= datetime.combine(start, datetime.min.time()))
+            .order_by(Order.created_at)
+        )
+
+        # 전체 결과를 메모리에 올리지 않고 batch_size 단위로 가져옴
+        result = self.db.execute(stmt, execution_options={"stream_results": True, "yield_per": batch_size})
+        for row in result:
+            yield tuple(row)
+
     def get_comprehensive_report(self, period: str = "month") -> Dict[str, Any]:
         """종합 리포트"""
         return {
@@ -2,12 +2,14 @@
 스토리지 관리 서비스
 """
 
+import hashlib
 import logging
 import os
 import shutil
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.core.config import settings
 
@@ -17,6 +19,12 @@ logger = logging.getLogger(__name__)
 class StorageService:
     """스토리지 관리 서비스"""
 
+    # 백업 gzip 압축 레벨 (이미지는 이미 압축된 형식이라 높은 레벨은 CPU만 소모하고 크기 차이가 거의 없음)
+    BACKUP_COMPRESS_LEVEL = 1
+
+    # 파일 해시 계산 시 읽기 단위
+    HASH_CHUNK_SIZE = 1024 * 1024
+
     def __init__(self):
         self.upload_dir = Path(settings.UPLOAD_DIR)
         self.max_storage_size = getattr(settings, "MAX_STORAGE_SIZE", 10 * 1024 * 1024 * 1024)  # 10GB 기본값
@@ -33,6 +41,11 @@ class StorageService:
         for directory in self.directories.values():
             directory.mkdir(parents=True, exist_ok=True)
 
+        # 파일 해시 캐시 {경로: (수정시각 ns, 크기, 해시)} - 변경되지 않은 파일은 재계산하지 않음
+        # find_duplicate_files는 스레드풀에서 동시에 실행될 수 있으므로 캐시 순회/변경은 잠금 안에서 수행
+        self._file_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+        self._file_hash_cache_lock = threading.Lock()
+
     def get_storage_usage(self) -> Dict[str, any]:
         """스토리지 사용량 조회"""
         usage_info = {
@@ -149,6 +162,24 @@ class StorageService:
 
         return cleaned_count
 
+    def _get_file_hash(self, file_path: Path, stat: os.stat_result) -> str:
+        """파일 해시 조회 (수정시각과 크기가 같으면 캐시된 값 사용)"""
+        key = str(file_path)
+        with self._file_hash_cache_lock:
+            cached = self._file_hash_cache.get(key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        hasher = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+
+        file_hash = hasher.hexdigest()
+        with self._file_hash_cache_lock:
+            self._file_hash_cache[key] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
     def find_duplicate_files(self, directory_name: str = "images") -> List[Dict[str, any]]:
         """중복 파일 찾기 (해시 기반)"""
         if directory_name not in self.directories:
@@ -158,18 +189,35 @@ class StorageService:
         if not directory.exists():
             return []
 
-        import hashlib
-
         file_hashes = {}
         duplicates = []
 
         try:
+            # 크기가 같은 파일끼리만 해시 비교 (크기가 유일한 파일은 중복일 수 없음)
+            files_by_size: Dict[int, List[Tuple[Path, os.stat_result]]] = {}
             for file_path in directory.rglob("*"):
                 if file_path.is_file():
+                    stat = file_path.stat()
+                    files_by_size.setdefault(stat.st_size, []).append((file_path, stat))
+
+            # 삭제된 파일의 해시 캐시 정리
+            scanned_paths = {str(file_path) for candidates in files_by_size.values() for file_path, _ in candidates}
+            directory_prefix = str(directory) + os.sep
+            with self._file_hash_cache_lock:
+                stale_keys = [
+                    key for key in self._file_hash_cache if key.startswith(directory_prefix) and key not in scanned_paths
+                ]
+                for key in stale_keys:
+                    del self._file_hash_cache[key]
+
+            for candidates in files_by_size.values():
+                if len(candidates) < 2:
+                    continue
+
+                for file_path, stat in candidates:
                     try:
                         # 파일 해시 계산
-                        with open(file_path, "rb") as f:
-                            file_hash = hashlib.md5(f.read()).hexdigest()
+                        file_hash = self._get_file_hash(file_path, stat)
 
                         if file_hash in file_hashes:
                             # 중복 파일 발견
@@ -178,7 +226,7 @@ class StorageService:
                                     "hash": file_hash,
                                     "original_file": str(file_hashes[file_hash]),
                                     "duplicate_file": str(file_path),
-                                    "size_bytes": file_path.stat().st_size,
+                                    "size_bytes": stat.st_size,
                                 }
                             )
                         else:
@@ -209,7 +257,7 @@ class StorageService:
         try:
             import tarfile
 
-            with tarfile.open(backup_path, "w:gz") as tar:
+            with tarfile.open(backup_path, "w:gz", compresslevel=self.BACKUP_COMPRESS_LEVEL) as tar:
                 tar.add(source_path, arcname=source_directory)
 
             logger.info(f"백업 생성 완료: {backup_path}")
@@ -0,0 +1,24 @@
+"""
+프로덕션 Gunicorn 설정 (Uvicorn 워커)
+
+워커 수는 WEB_CONCURRENCY 환경변수로 지정하고, 없으면 2 x CPU + 1 사용
+컨테이너 CPU 제한이 호스트 코어 수보다 작으면 os.cpu_count()가 호스트 기준이므로 WEB_CONCURRENCY를 명시할 것
+전체 DB 커넥션 수는 워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW)이므로 워커를 늘릴 때 풀 크기도 함께 조정
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 일정 요청 수마다 워커를 순차 재시작하여 장기 실행 시 메모리 증가 누적 방지
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
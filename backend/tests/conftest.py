@@ -3,6 +3,7 @@
 """
 
 import asyncio
+import os
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -33,6 +34,9 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# PostgreSQL 전용 경로(데이터 변경 CTE, enum 등) 테스트용 데이터베이스 (미설정 시 postgres 테스트 건너뜀)
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -54,6 +58,23 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def pg_db_session():
+    """테스트용 PostgreSQL 세션 (운영과 같이 expire_on_commit=False)"""
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL이 설정되지 않았습니다.")
+
+    pg_engine = create_engine(TEST_POSTGRES_URL)
+    Base.metadata.create_all(bind=pg_engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=pg_engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=pg_engine)
+        pg_engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """테스트 클라이언트"""
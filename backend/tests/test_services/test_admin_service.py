@@ -0,0 +1,103 @@
+"""
+관리자 서비스 테스트
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import OperationalError
+
+from app.models.admin_activity_log import AdminActivityLog
+from app.services.admin_service import ActivityLogBuffer, AdminService
+
+
+class TestActivityLogBuffer:
+    """관리자 활동 로그 버퍼 테스트 클래스"""
+
+    def test_queue_admin_activity_defers_insert(self, db_session, monkeypatch):
+        """조회성 활동 로그는 flush 전까지 저장되지 않는지 테스트"""
+        # Given
+        buffer = ActivityLogBuffer()
+        monkeypatch.setattr("app.services.admin_service.activity_log_buffer", buffer)
+        admin_service = AdminService(db_session)
+
+        # When
+        admin_service.queue_admin_activity(admin_id=1, action="VIEW_ORDERS", description="주문 목록 조회")
+
+        # Then
+        assert buffer.has_pending()
+        assert db_session.query(AdminActivityLog).count() == 0
+
+    def test_flush_inserts_pending_logs_in_batches(self, db_session, monkeypatch):
+        """적재된 로그가 배치 단위로 모두 저장되는지 테스트"""
+        # Given
+        monkeypatch.setattr(ActivityLogBuffer, "BATCH_SIZE", 2)
+        buffer = ActivityLogBuffer()
+        for i in range(5):
+            buffer.push(admin_id=1, action="VIEW_DAILY_STATISTICS", request_data={"days": i})
+
+        # When
+        flushed = buffer.flush(db_session)
+
+        # Then
+        assert flushed == 5
+        assert not buffer.has_pending()
+        logs = db_session.query(AdminActivityLog).order_by(AdminActivityLog.id).all()
+        assert [log.request_data["days"] for log in logs] == [0, 1, 2, 3, 4]
+        assert all(log.created_at is not None for log in logs)
+
+    def test_flush_requeues_logs_when_db_unavailable(self, db_session, monkeypatch):
+        """DB 오류 시 로그가 버려지지 않고 원래 순서대로 버퍼에 남는지 테스트"""
+        # Given
+        buffer = ActivityLogBuffer()
+        for i in range(3):
+            buffer.push(admin_id=1, action="VIEW_ORDERS", request_data={"page": i})
+
+        def fail_execute(*args, **kwargs):
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+
+        monkeypatch.setattr(db_session, "execute", fail_execute)
+
+        # When
+        flushed = buffer.flush(db_session)
+
+        # Then
+        assert flushed == 0
+        assert buffer.pending_count() == 3
+        assert [row["request_data"]["page"] for row in buffer._drain()] == [0, 1, 2]
+
+
+class TestAdminActivityLogQuery:
+    """관리자 활동 로그 조회 테스트 클래스"""
+
+    def test_get_admin_activity_logs_keyset_pagination(self, db_session):
+        """커서 기반 활동 로그 페이지네이션 테스트"""
+        # Given
+        admin_service = AdminService(db_session)
+        base_time = datetime.utcnow() - timedelta(hours=1)
+        for i in range(5):
+            db_session.add(
+                AdminActivityLog(
+                    admin_id=1,
+                    action="VIEW_ORDERS",
+                    description=f"log-{i}",
+                    created_at=base_time + timedelta(minutes=i // 2),
+                )
+            )
+        db_session.commit()
+
+        # When
+        first_page = admin_service.get_admin_activity_logs(limit=2)
+        second_page = admin_service.get_admin_activity_logs(limit=2, cursor=first_page["next_cursor"])
+        last_page = admin_service.get_admin_activity_logs(limit=2, cursor=second_page["next_cursor"])
+
+        # Then
+        assert first_page["total"] == 5
+        assert second_page["total"] is None
+        assert last_page["next_cursor"] is None
+        assert [log["description"] for log in first_page["logs"] + second_page["logs"] + last_page["logs"]] == [
+            "log-4",
+            "log-3",
+            "log-2",
+            "log-1",
+            "log-0",
+        ]
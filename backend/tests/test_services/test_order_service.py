@@ -9,8 +9,13 @@ from unittest.mock import Mock, patch
 import pytest
 
 from app.core.exceptions import InvalidOrderStatusError, OrderNotFoundError
+from app.models.device import Device
+from app.models.number import Number
 from app.models.order import Order, OrderStatus
-from app.schemas.order import OrderCreate, OrderUpdate
+from app.models.order_status_history import OrderStatusHistory
+from app.models.plan import Plan
+from app.models.user import User
+from app.schemas.order import OrderCreate, OrderFilter, OrderUpdate
 from app.services.order_service import OrderService
 
 
@@ -329,3 +334,85 @@ class TestOrderService:
         assert result["processing_orders"] == 1
         assert result["completed_orders"] == 1
         assert result["cancelled_orders"] == 1
+
+    def test_get_order_rows_keyset_pagination(self, db_session, created_user, created_plan):
+        """커서 기반 주문 목록 페이지네이션 테스트"""
+        # Given
+        order_service = OrderService(db_session)
+        base_time = datetime(2025, 1, 1, 12, 0, 0)
+        for i in range(5):
+            db_session.add(
+                Order(
+                    user_id=created_user.id,
+                    plan_id=created_plan.id,
+                    order_number=f"ORDKEYSET{i}",
+                    status=OrderStatus.PENDING,
+                    total_amount=Decimal("55000"),
+                    plan_fee=Decimal("55000"),
+                    created_at=base_time + timedelta(minutes=i // 2),
+                )
+            )
+        db_session.commit()
+        filters = OrderFilter()
+
+        # When
+        first_page, total = order_service.get_order_rows(filters, size=2)
+        second_page, next_total = order_service.get_order_rows(filters, size=2, cursor=first_page[-1]["id"])
+        last_page, _ = order_service.get_order_rows(filters, size=2, cursor=second_page[-1]["id"])
+
+        # Then
+        assert total == 5
+        assert next_total is None
+        assert [row["order_number"] for row in first_page + second_page + last_page] == [
+            "ORDKEYSET4",
+            "ORDKEYSET3",
+            "ORDKEYSET2",
+            "ORDKEYSET1",
+            "ORDKEYSET0",
+        ]
+        assert first_page[0]["user_name"] == created_user.name
+
+
+@pytest.mark.postgres
+class TestOrderStatusTransitionPostgres:
+    """PostgreSQL 데이터 변경 CTE 상태 전환 테스트 클래스"""
+
+    def test_cancel_returns_updated_order_from_session(
+        self, pg_db_session, sample_user_data, sample_plan_data, sample_device_data, sample_number_data
+    ):
+        """세션에 이미 로드된 주문도 취소 후 갱신된 상태로 반환되는지 테스트"""
+        # Given
+        user = User(**sample_user_data)
+        plan = Plan(**sample_plan_data)
+        device = Device(**sample_device_data)
+        number = Number(**{**sample_number_data, "status": "reserved", "reserved_by_order_id": "ORD123456789"})
+        pg_db_session.add_all([user, plan, device, number])
+        pg_db_session.commit()
+
+        order = Order(
+            user_id=user.id,
+            plan_id=plan.id,
+            device_id=device.id,
+            number_id=number.id,
+            order_number="ORD123456789",
+            status=OrderStatus.PENDING,
+            total_amount=Decimal("1255000"),
+            plan_fee=Decimal("55000"),
+            delivery_address="서울시 강남구",
+        )
+        pg_db_session.add(order)
+        pg_db_session.commit()
+        order_service = OrderService(pg_db_session)
+
+        # When
+        status_update = order_service.build_cancel_update(order.id, "고객 요청")
+        result = order_service.apply_status_update(order.id, status_update, admin_id=None)
+
+        # Then
+        assert result.status == OrderStatus.CANCELLED
+        history = pg_db_session.query(OrderStatusHistory).filter(OrderStatusHistory.order_id == order.id).one()
+        assert history.previous_status == OrderStatus.PENDING
+        assert history.status == OrderStatus.CANCELLED
+        pg_db_session.refresh(number)
+        assert number.status == "available"
+        assert number.reserved_by_order_id is None
@@ -0,0 +1,47 @@
+"""
+스토리지 서비스 테스트
+"""
+
+from app.services.storage_service import StorageService
+
+
+class TestFindDuplicateFiles:
+    """중복 파일 검색 테스트 클래스"""
+
+    def test_find_duplicate_files_compares_same_size_files(self, tmp_path, monkeypatch):
+        """같은 내용의 파일만 중복으로 검출하고 해시를 캐시하는지 테스트"""
+        # Given
+        storage_service = StorageService()
+        monkeypatch.setattr(storage_service, "directories", {"images": tmp_path})
+        (tmp_path / "a.webp").write_bytes(b"same-content")
+        (tmp_path / "b.webp").write_bytes(b"same-content")
+        (tmp_path / "c.webp").write_bytes(b"diff-content")
+        (tmp_path / "d.webp").write_bytes(b"unique size file")
+
+        # When
+        duplicates = storage_service.find_duplicate_files("images")
+
+        # Then
+        assert len(duplicates) == 1
+        assert {duplicates[0]["original_file"], duplicates[0]["duplicate_file"]} == {
+            str(tmp_path / "a.webp"),
+            str(tmp_path / "b.webp"),
+        }
+        assert str(tmp_path / "d.webp") not in storage_service._file_hash_cache
+
+    def test_find_duplicate_files_drops_cache_for_removed_files(self, tmp_path, monkeypatch):
+        """삭제된 파일의 해시 캐시가 정리되는지 테스트"""
+        # Given
+        storage_service = StorageService()
+        monkeypatch.setattr(storage_service, "directories", {"images": tmp_path})
+        (tmp_path / "a.webp").write_bytes(b"same-content")
+        (tmp_path / "b.webp").write_bytes(b"same-content")
+        storage_service.find_duplicate_files("images")
+
+        # When
+        (tmp_path / "b.webp").unlink()
+        duplicates = storage_service.find_duplicate_files("images")
+
+        # Then
+        assert duplicates == []
+        assert str(tmp_path / "b.webp") not in storage_service._file_hash_cache